@@ -1,5 +1,6 @@
 import importlib
 import numpy as np
+from contextlib import contextmanager
 import openpnm as op
 import scipy.sparse as sprs
 import scipy.sparse.csgraph as spgr
@@ -21,7 +22,8 @@ def_set = {'phase': None,
            'solver_rtol': 1e-6,
            'solver_maxiter': 5000,
            'iterative_props': [],
-           'cache_A': True, 'cache_b': True,
+           'solver_reuse': 10,
+           'cache_A': True, 'cache_b': True, 'cache_solver': False,
            'gui': {'setup':        {'quantity': '',
                                     'conductance': ''},
                    'set_rate_BC':  {'pores': None,
@@ -33,6 +35,13 @@ def_set = {'phase': None,
            }
 
 
+def _build_ilu(A):
+    # Wraps an incomplete LU factorization of A for use as a preconditioner
+    ilu = sprs.linalg.spilu(A.tocsc())
+    return sprs.linalg.LinearOperator(shape=A.shape, matvec=ilu.solve,
+                                      rmatvec=lambda x: ilu.solve(x, 'T'))
+
+
 class GenericTransport(GenericAlgorithm):
     r"""
     This class implements steady-state linear transport calculations
@@ -73,6 +82,9 @@ class GenericTransport(GenericAlgorithm):
     |                     | ``dict`` with the data stored under the 'quantity'|
     |                     | specified in the ``settings``                     |
     +---------------------+---------------------------------------------------+
+    | ``run_batch``       | Solves for several sets of boundary conditions    |
+    |                     | at once, returning the results of each            |
+    +---------------------+---------------------------------------------------+
 
     In addition to the above methods there are also the following attributes:
 
@@ -134,6 +146,8 @@ class GenericTransport(GenericAlgorithm):
         self._pure_A = None
         self._b = None
         self._pure_b = None
+        self._solver_cache = {}
+        self._solver_runs = 0
         self['pore.bc_rate'] = np.nan
         self['pore.bc_value'] = np.nan
 
@@ -173,7 +187,11 @@ class GenericTransport(GenericAlgorithm):
 
         solver_preconditioner : string
             This is used by the PETSc solver to specify which preconditioner
-            to use.  The default is ``jacobi``.
+            to use.  The default is ``jacobi``.  The iterative solvers of the
+            ``scipy`` family are preconditioned with an incomplete LU
+            factorization if this is set to ``ilu``, and are otherwise not
+            preconditioned.  This can not be used with ``cg`` or ``minres``,
+            which need a symmetric preconditioner.
 
         solver_atol : scalar
             Used to control the accuracy to which the iterative solver aims.
@@ -187,6 +205,19 @@ class GenericTransport(GenericAlgorithm):
             Limits the number of iterations to attempt before quiting when
             aiming for the specified tolerance. The default is 5000.
 
+        solver_reuse : int
+            The number of solves for which an ILU preconditioner or a PyAMG
+            hierarchy is used before it is rebuilt from the current
+            coefficient matrix.  The default is 10, and 1 rebuilds it for
+            every solve.
+
+        cache_solver : boolean
+            The factorization or preconditioner made by the solver is reused
+            during a run, as explained in ``_solve``.  If ``False`` (default)
+            it is freed when the run is finished, and if ``True`` it is kept
+            for the next run, for as long as the sparsity pattern of the
+            coefficient matrix does not change.
+
         """
         if phase:
             self.settings['phase'] = phase.name
@@ -408,18 +439,35 @@ class GenericTransport(GenericAlgorithm):
         The conductance to use is specified in the algorithm's ``settings``
         under ``conductance``.  In subclasses (e.g. ``FickianDiffusion``)
         this is set by default, though it can be overwritten.
+
+        If ``settings['cache_A']`` is ``True`` the matrix is kept and only
+        rebuilt once the conductance or the network's 'throat.conns' are
+        written.  Conductances edited in-place, as in
+        ``phys['throat.diffusive_conductance'][:] = 4.0``, are not detected,
+        so ``notify`` must be called on the object holding them afterwards.
         """
         cache_A = self.settings['cache_A']
+        network = self.project.network
+        phase = self.project.phases()[self.settings['phase']]
+        conductance = self.settings['conductance']
         if not cache_A:
             self._pure_A = None
+        else:
+            # A lazy conductance model is only rerun when read, which
+            # would clear the cached matrix if its inputs have changed
+            phase._refresh_lazy(conductance)
         if self._pure_A is None:
-            network = self.project.network
-            phase = self.project.phases()[self.settings['phase']]
-            g = phase[self.settings['conductance']]
+            g = phase[conductance]
             am = network.create_adjacency_matrix(weights=g, fmt='coo')
             self._pure_A = spgr.laplacian(am).astype(float)
+            # Discard the cached matrix if the conductance or topology change
+            phase.subscribe(self._clear_A_cache, keys=conductance)
+            network.subscribe(self._clear_A_cache, keys='throat.conns')
         self.A = self._pure_A.copy()
 
+    def _clear_A_cache(self, obj, key):
+        self._pure_A = None
+
     def _build_b(self):
         r"""
         Builds the RHS matrix, without applying any boundary conditions or
@@ -440,8 +488,14 @@ class GenericTransport(GenericAlgorithm):
         if self._pure_b is None:
             b = np.zeros(shape=self.Np, dtype=float)  # Create vector of 0s
             self._pure_b = b
+            # Discard the cached vector if pores are added or removed
+            network = self.project.network
+            network.subscribe(self._clear_b_cache, keys='pore.coords')
         self.b = self._pure_b.copy()
 
+    def _clear_b_cache(self, obj, key):
+        self._pure_b = None
+
     def _get_A(self):
         if self._A is None:
             self._build_A()
@@ -467,6 +521,11 @@ class GenericTransport(GenericAlgorithm):
         Applies all the boundary conditions that have been specified, by
         adding values to the *A* and *b* matrices.
         """
+        for key in ['pore.bc_rate', 'pore.bc_value']:
+            if (key in self.keys()) and (self[key].shape[0] != self.b.size):
+                raise Exception(key + ' does not match the number of pores '
+                                + 'in the network, so the boundary '
+                                + 'conditions must be set again')
         if 'pore.bc_rate' in self.keys():
             # Update b
             ind = np.isfinite(self['pore.bc_rate'])
@@ -510,13 +569,108 @@ class GenericTransport(GenericAlgorithm):
         """
         logger.info('―' * 80)
         logger.info('Running GenericTransport')
-        self._run_generic()
+        with self._solver_session():
+            self._run_generic()
 
     def _run_generic(self):
         self._apply_BCs()
         x_new = self._solve()
         self[self.settings['quantity']] = x_new
 
+    def run_batch(self, bc_sets):
+        r"""
+        Solves the algorithm for several sets of boundary conditions in one
+        call, such as flow along each principle direction of the domain.
+
+        Parameters
+        ----------
+        bc_sets : dict
+            The boundary conditions of each case, keyed by the name of the
+            case.  Each is a list of the conditions to apply, given as dicts
+            with the ``pores`` and ``values`` to pass to ``set_value_BC``,
+            or to ``set_rate_BC`` if the dict also holds ``'bctype': 'rate'``.
+            A list of cases can be given instead, which are then named by
+            their position in the list.
+
+        Returns
+        -------
+        A dict keyed by the name of each case, holding the solution under the
+        ``quantity`` given in ``settings``, and the net rate into the pores
+        of each of its boundary conditions as an array under ``'rate'``.
+
+        Notes
+        -----
+        The coefficient matrix is only built once, and the cases which put
+        value conditions on the same pores share one matrix, which is
+        factorized once so all of their right hand sides are solved as a
+        block.  The boundary conditions and results already on the algorithm
+        are left unchanged.
+
+        Examples
+        --------
+        >>> import openpnm as op
+        >>> pn = op.network.Cubic(shape=[5, 5, 5])
+        >>> geo = op.geometry.StickAndBall(network=pn)
+        >>> air = op.phases.Air(network=pn)
+        >>> phys = op.physics.Standard(network=pn, phase=air, geometry=geo)
+        >>> fd = op.algorithms.FickianDiffusion(network=pn, phase=air)
+        >>> bc_sets = {'x': [{'pores': pn.pores('left'), 'values': 1.0},
+        ...                  {'pores': pn.pores('right'), 'values': 0.0}],
+        ...            'y': [{'pores': pn.pores('front'), 'values': 1.0},
+        ...                  {'pores': pn.pores('back'), 'values': 0.0}]}
+        >>> batch = fd.run_batch(bc_sets)
+        >>> sorted(batch['x'].keys())
+        ['pore.concentration', 'rate']
+        >>> batch['x']['rate'].shape
+        (2,)
+
+        """
+        if self.settings.get('sources', None):
+            raise Exception('Source terms are not supported by run_batch, '
+                            + 'since each case would need to be iterated')
+        if not isinstance(bc_sets, dict):
+            bc_sets = dict(enumerate(bc_sets))
+        quantity = self.settings['quantity']
+        bcs = {k: self[k].copy() for k in ['pore.bc_value', 'pore.bc_rate']}
+        x_old = self.pop(quantity, None)
+        # Apply the BCs of each case, and group the cases by their matrix
+        groups = {}
+        for case, specs in bc_sets.items():
+            self.remove_BC()
+            for spec in specs:
+                self._set_BC(pores=spec['pores'], bcvalues=spec['values'],
+                             bctype=spec.get('bctype', 'value'))
+            self._build_A()
+            self._build_b()
+            self._apply_BCs()
+            key = np.isfinite(self['pore.bc_value']).tobytes()
+            if key not in groups.keys():
+                groups[key] = (self.A, [], [])
+            groups[key][1].append(case)
+            groups[key][2].append(self.b)
+        batch = {}
+        try:
+            with self._solver_session():
+                for A, cases, b in groups.values():
+                    self.A = A
+                    x = self._solve(A=A, b=np.stack(b, axis=1))
+                    for i, case in enumerate(cases):
+                        self[quantity] = x[:, i]
+                        rates = [self.rate(pores=spec['pores'])[0]
+                                 for spec in bc_sets[case]]
+                        batch[case] = {quantity: x[:, i],
+                                       'rate': np.array(rates)}
+        finally:
+            # Restore the state the algorithm had before the batch
+            for k, v in bcs.items():
+                self[k] = v
+            self._A = None
+            self._b = None
+            self.pop(quantity, None)
+            if x_old is not None:
+                self[quantity] = x_old
+        return batch
+
     def _solve(self, A=None, b=None):
         r"""
         Sends the A and b matrices to the specified solver, and solves for *x*
@@ -532,13 +686,30 @@ class GenericTransport(GenericAlgorithm):
 
         b : ND-array
             The RHS matrix in any format.  If not specified, then it uses
-            the ``b`` matrix attached to the object.
+            the ``b`` matrix attached to the object.  A 2D array holding
+            several right hand sides as columns can be given, in which case
+            a 2D array of solutions is returned.
 
         Notes
         -----
         The solver used here is specified in the ``settings`` attribute of the
         algorithm.
 
+        During a run the work done by the solver is kept for the next call,
+        as long as the sparsity pattern of *A* does not change, which is the
+        case during the iterations of reactive and transient algorithms.  It
+        is freed when the run is finished, unless ``cache_solver`` is
+        ``True``:
+
+        - The LU factorization used by ``spsolve`` is reused while the values
+          of *A* are unchanged, so only *b* needs to be substituted.
+
+        - The ILU preconditioner of the ``scipy`` iterative solvers and the
+          PyAMG hierarchy are reused for ``solver_reuse`` solves, even if the
+          values of *A* have changed.  The hierarchy then preconditions a
+          GMRES solve of the current *A*.  If a solve with a reused
+          preconditioner fails, it is rebuilt and the solve is repeated.
+
         """
         # Fetch A and b from self if not given, and throw error if not found
         if A is None:
@@ -556,6 +727,15 @@ class GenericTransport(GenericAlgorithm):
             self.settings['solver_family'] = 'pyamg'
         if self.settings['solver'] == 'petsc':
             self.settings['solver_family'] = 'petsc'
+        iterative = ['bicg', 'bicgstab', 'cg', 'cgs', 'gmres', 'lgmres',
+                     'minres', 'gcrotmk', 'qmr']
+
+        # Only the scipy direct solvers accept a block of right hand sides
+        direct = ((self.settings['solver_family'] == 'scipy')
+                  and (self.settings['solver_type'] not in iterative))
+        if (np.ndim(b) == 2) and not direct:
+            x = [self._solve(A=A, b=b[:, i]) for i in range(b.shape[1])]
+            return np.stack(x, axis=1)
 
         # Set tolerance for iterative solvers
         rtol = self.settings['solver_rtol']
@@ -570,19 +750,43 @@ class GenericTransport(GenericAlgorithm):
             if importlib.util.find_spec('scikit-umfpack'):
                 A.indices = A.indices.astype(np.int64)
                 A.indptr = A.indptr.astype(np.int64)
-            iterative = ['bicg', 'bicgstab', 'cg', 'cgs', 'gmres', 'lgmres',
-                         'minres', 'gcrotmk', 'qmr']
-            solver = getattr(sprs.linalg, self.settings['solver_type'])
+            solver_type = self.settings['solver_type']
+            solver = getattr(sprs.linalg, solver_type)
 
-            if self.settings['solver_type'] == 'cg' and not is_sym:
+            if solver_type == 'cg' and not is_sym:
                 raise Exception('Conjugate gradient (cg) solver cannot be used with '
                                 + 'non-symmetric matrices. Choose a different solver.')
-            if self.settings['solver_type'] in iterative:
-                x, exit_code = solver(A=A, b=b, atol=atol, tol=rtol,
-                                      maxiter=self.settings['solver_maxiter'])
+            ilu = self.settings['solver_preconditioner'] == 'ilu'
+            if ilu and solver_type in ['cg', 'minres']:
+                raise Exception('The ilu preconditioner is not symmetric, so '
+                                + 'it can not be used with the ' + solver_type
+                                + ' solver. Choose a different solver.')
+            if solver_type in iterative:
+                kwargs = {'atol': atol, 'tol': rtol,
+                          'maxiter': self.settings['solver_maxiter']}
+                M = 'M1' if solver_type == 'qmr' else 'M'
+                if ilu:
+                    if solver_type == 'qmr':
+                        kwargs['M2'] = sprs.linalg.aslinearoperator(
+                            sprs.identity(A.shape[0]))
+                    state = self._get_solver_state(A, kind='ilu')
+                    kwargs[M] = self._get_preconditioner(state, A,
+                                                         build=_build_ilu)
+                x, exit_code = solver(A=A, b=b, **kwargs)
+                if (exit_code > 0) and ilu and (state['uses'] > 1):
+                    # The preconditioner was made for earlier values of A
+                    kwargs[M] = self._get_preconditioner(state, A, rebuild=True,
+                                                         build=_build_ilu)
+                    x, exit_code = solver(A=A, b=b, **kwargs)
                 if exit_code > 0:
                     raise Exception('SciPy solver did not converge! '
                                     + 'Exit code: ' + str(exit_code))
+            elif solver_type == 'spsolve':
+                state = self._get_solver_state(A, kind='lu')
+                if not np.array_equal(state.get('values', None), A.data):
+                    state['lu'] = sprs.linalg.factorized(A.tocsc())
+                    state['values'] = A.data.copy()
+                x = state['lu'](b)
             else:
                 x = solver(A=A, b=b)
             return x
@@ -610,10 +814,81 @@ class GenericTransport(GenericAlgorithm):
                 import pyamg
             else:
                 raise Exception('PyAMG is not installed.')
-            ml = pyamg.ruge_stuben_solver(A)
-            x = ml.solve(b=b, tol=1e-10)
+            state = self._get_solver_state(A, kind='pyamg')
+            ml = self._get_preconditioner(state, A,
+                                          build=pyamg.ruge_stuben_solver)
+            if np.array_equal(state['M_values'], A.data):
+                x = ml.solve(b=b, tol=1e-10)
+                return x
+            # The hierarchy was made for earlier values of A, so it is used
+            # to precondition a solve of the current A instead
+            x, exit_code = sprs.linalg.gmres(
+                A=A, b=b, M=ml.aspreconditioner(), tol=1e-10, atol=0,
+                maxiter=self.settings['solver_maxiter'])
+            if exit_code != 0:
+                ml = self._get_preconditioner(state, A, rebuild=True,
+                                              build=pyamg.ruge_stuben_solver)
+                x = ml.solve(b=b, tol=1e-10)
             return x
 
+    def _get_solver_state(self, A, kind):
+        r"""
+        Returns the cached state of the solver for the sparsity pattern of
+        ``A``, which must be in CSR format.  The state is emptied if the
+        pattern or the ``kind`` of solver have changed since the last call,
+        or if it is called outside of a run while the ``cache_solver``
+        setting is ``False``.
+        """
+        state = self._solver_cache
+        keep = ((self.settings['cache_solver'] or self._solver_runs > 0)
+                and (state.get('kind', None) == kind)
+                and (state['shape'] == A.shape)
+                and np.array_equal(state['indptr'], A.indptr)
+                and np.array_equal(state['indices'], A.indices))
+        if not keep:
+            state.clear()
+            state.update({'kind': kind, 'shape': A.shape,
+                          'indptr': A.indptr.copy(),
+                          'indices': A.indices.copy()})
+        return state
+
+    @contextmanager
+    def _solver_session(self):
+        r"""
+        Keeps the state of the solver while the block runs, and frees it
+        afterwards unless the ``cache_solver`` setting is ``True``.  Nested
+        blocks, such as a run calling the run of its parent class, keep the
+        state until the outermost one has finished.
+        """
+        self._solver_runs += 1
+        try:
+            yield
+        finally:
+            self._solver_runs -= 1
+            if (self._solver_runs == 0) and not self.settings['cache_solver']:
+                self._solver_cache.clear()
+
+    def _get_preconditioner(self, state, A, build, rebuild=False):
+        r"""
+        Returns the preconditioner held in the solver ``state``.  A new one is
+        made by calling ``build(A)`` if there is none yet, if ``rebuild`` is
+        ``True``, or if it has already been used for the number of solves
+        given by the ``solver_reuse`` setting.
+        """
+        reuse = self.settings['solver_reuse']
+        if rebuild or ('M' not in state.keys()) or (state['uses'] >= reuse):
+            state['M'] = build(A)
+            state['M_values'] = A.data.copy()
+            state['uses'] = 0
+        state['uses'] += 1
+        return state['M']
+
+    def __getstate__(self):
+        # Factorizations can not be pickled, so copies start without them
+        state = self.__dict__.copy()
+        state['_solver_cache'] = {}
+        return state
+
     def results(self):
         r"""
         Fetches the calculated quantity from the algorithm and returns it as
@@ -392,7 +392,7 @@ class InvasionPercolation(GenericAlgorithm):
         self['pore.trapped'] = self['pore.clusters'] > -1
         trapped_ts = net.find_neighbor_throats(self['pore.trapped'])
         self['throat.trapped'] = np.zeros([net.Nt], dtype=bool)
-        self['throat.trapped'][trapped_ts] = True
+        self.set_label(label='throat.trapped', throats=trapped_ts)
         self['pore.invasion_sequence'][self['pore.trapped']] = -1
         self['throat.invasion_sequence'][self['throat.trapped']] = -1
 
@@ -74,6 +74,8 @@ class IonicTransport(ReactiveTransport):
             i_new[alg.name] = None
 
         # Iterate (Gummel) until solutions converge
+        acc = self._get_accelerator()
+        self.convergence = {'iterations': 0, 'residuals': []}
         for itr in range(int(self.settings['i_max_iter'])):
             i_r = [float(format(i, '.3g')) for i in i_res.values()]
             i_r = str(i_r)[1:-1]
@@ -101,7 +103,40 @@ class IonicTransport(ReactiveTransport):
                 # Update phase and physics
                 phase.update(p_alg.results())
                 phys[0].regenerate_models()
+                self._accelerate(acc=acc, algs=algs, x=i_old, gx=i_new)
+                self.convergence['iterations'] += 1
+                self.convergence['residuals'].append(max(i_res.values()))
 
             if i_convergence:
                 print('Solution converged')
                 break
+
+    def _accelerate(self, acc, algs, x, gx):
+        r"""
+        Replaces the fields found by a Gummel iteration with the next guess
+        given by the accelerator, if an ``acceleration`` is set in
+        ``settings``.
+
+        Parameters
+        ----------
+        acc : FixedPointAccelerator
+            The accelerator of the Gummel iterations
+
+        algs : list
+            The potential field and ion algorithms
+
+        x, gx : dict
+            The fields of each algorithm before and after the iteration,
+            keyed by algorithm name
+        """
+        if self.settings['acceleration'] is None:
+            return
+        phase = self.project.phases()[self.settings['phase']]
+        x = np.concatenate([x[alg.name] for alg in algs])
+        gx = np.concatenate([gx[alg.name] for alg in algs])
+        x_new = np.split(acc.update(x, gx), len(algs))
+        for alg, vals in zip(algs, x_new):
+            alg[alg.settings['quantity']] = vals
+            phase[alg.settings['quantity']] = vals
+        for phys in self.project.find_physics(phase=phase):
+            phys.regenerate_models()
@@ -240,7 +240,7 @@ class MixedInvasionPercolation(GenericAlgorithm):
             raise Exception('Some outlets are already defined as inlets')
         if overwrite:
             self['pore.outlets'] = False
-        self['pore.outlets'][Ps] = True
+        self.set_label(label='pore.outlets', pores=Ps)
 
     def _add_ts2q(self, pore, queue):
         """
@@ -708,7 +708,7 @@ class MixedInvasionPercolation(GenericAlgorithm):
             for c in np.unique(clusters[clusters >= 0]):
                 c_ts = net.find_neighbor_throats(clusters == c,
                                                  mode='xnor')
-                self['throat.trapped'][c_ts] = True
+                self.set_label(label='throat.trapped', throats=c_ts)
             num_tTs = np.sum(self['throat.trapped'])
             logger.info("Number of trapped throats: " + str(num_tTs))
             self['throat.invasion_sequence'][self['throat.trapped']] = -1
@@ -776,7 +776,7 @@ class MixedInvasionPercolation(GenericAlgorithm):
         Ps = self._parse_indices(pores)
         if overwrite:
             self['pore.residual'] = False
-        self['pore.residual'][Ps] = True
+        self.set_label(label='pore.residual', pores=Ps)
         residual = self['pore.residual']
         net = self.project.network
         conns = net['throat.conns']
@@ -213,7 +213,7 @@ class OrdinaryPercolation(GenericAlgorithm):
             raise Exception('Some inlets are already defined as outlets')
         if overwrite:
             self['pore.inlets'] = False
-        self['pore.inlets'][Ps] = True
+        self.set_label(label='pore.inlets', pores=Ps)
         self['pore.invasion_pressure'][Ps] = sp.inf
         self['pore.invasion_sequence'][Ps] = -1
 
@@ -244,7 +244,7 @@ class OrdinaryPercolation(GenericAlgorithm):
             raise Exception('Some outlets are already defined as inlets')
         if overwrite:
             self['pore.outlets'] = False
-        self['pore.outlets'][Ps] = True
+        self.set_label(label='pore.outlets', pores=Ps)
 
     def set_residual(self, pores=[], throats=[], overwrite=False):
         r"""
@@ -270,11 +270,11 @@ class OrdinaryPercolation(GenericAlgorithm):
         Ps = self._parse_indices(pores)
         if overwrite:
             self['pore.residual'] = False
-        self['pore.residual'][Ps] = True
+        self.set_label(label='pore.residual', pores=Ps)
         Ts = self._parse_indices(throats)
         if overwrite:
             self['throat.residual'] = False
-        self['throat.residual'][Ts] = True
+        self.set_label(label='throat.residual', throats=Ts)
 
     def get_percolation_threshold(self):
         r"""
@@ -1,7 +1,7 @@
 import numpy as np
 from numpy.linalg import norm
 from openpnm.algorithms import GenericTransport
-from openpnm.utils import logging
+from openpnm.utils import logging, FixedPointAccelerator
 logger = logging.getLogger(__name__)
 
 
@@ -31,6 +31,10 @@ class ReactiveTransport(GenericTransport):
                    'max_iter': 5000,
                    'relaxation_source': 1.0,
                    'relaxation_quantity': 1.0,
+                   'rxn_solver': 'picard',
+                   'acceleration': None,
+                   'acceleration_depth': 5,
+                   'max_backtracks': 10,
                    'gui': {'setup':        {'phase': None,
                                             'quantity': '',
                                             'conductance': '',
@@ -51,6 +55,7 @@ class ReactiveTransport(GenericTransport):
         self.settings.update(settings)
         if phase is not None:
             self.setup(phase=phase)
+        self.convergence = {}
 
     def setup(self, phase=None, quantity='', conductance='',
               rxn_tolerance=None, max_iter=None, relaxation_source=None,
@@ -95,8 +100,42 @@ class ReactiveTransport(GenericTransport):
             Factor approaching 1 : fast simulation but may be unstable.
             Default value is 1 (no under-relaxation).
 
+        rxn_solver : string
+            The method used to iterate on the source terms.  Options are:
+
+            - ``'picard'``: (Default) Solves with the source terms linearized
+            about the last solution, under-relaxed as described by the two
+            settings above.
+
+            - ``'newton'``: Takes Newton steps, found from the conductances
+            and the derivatives of the source terms, and shortens each step
+            until the residual decreases.  The relaxation settings are not
+            used, and stiff source terms usually converge in far fewer
+            iterations.
+
+        max_backtracks : int
+            The number of times a Newton step is halved to find one which
+            decreases the residual, after which the shortest step is taken.
+            The default is 10.
+
+        acceleration : string or None
+            Speeds up Picard iterations by choosing each new guess from the
+            previous ones, rather than by the fixed ``relaxation_quantity``.
+            Options are ``'anderson'`` for Anderson mixing of the last
+            ``acceleration_depth`` iterations, ``'aitken'`` for Aitken's
+            adaptive relaxation starting from ``relaxation_quantity``, or
+            ``None`` (default) for fixed relaxation.  See
+            ``openpnm.utils.FixedPointAccelerator`` for details.
+
+        acceleration_depth : int
+            The number of iterations used by Anderson mixing.  The default is
+            5.
+
         Notes
         -----
+        The number of iterations and the residual of each are stored in the
+        ``convergence`` attribute after the algorithm is run.
+
         Under-relaxation is a technique used for improving stability of a
         computation, particularly in the presence of highly non-linear terms.
         Under-relaxation used here limits the change in a variable from one
@@ -249,6 +288,8 @@ class ReactiveTransport(GenericTransport):
         """
         phase = self.project.phases()[self.settings['phase']]
         w = self.settings['relaxation_source']
+        if self.settings['rxn_solver'] == 'newton':
+            w = 1.0  # Newton steps use the exact derivative of the sources
 
         for item in self.settings['sources']:
             Ps = self.pores(item)
@@ -291,7 +332,8 @@ class ReactiveTransport(GenericTransport):
         if x is None:
             x = np.zeros(shape=self.Np, dtype=float)
         self[quantity] = x
-        x = self._run_reactive(x)
+        with self._solver_session():
+            x = self._run_reactive(x)
         self[quantity] = x
 
     def _run_reactive(self, x):
@@ -313,9 +355,12 @@ class ReactiveTransport(GenericTransport):
         x_new : ND-array
             Solution array.
         """
-        w = self.settings['relaxation_quantity']
+        if self.settings['rxn_solver'] == 'newton':
+            return self._run_newton(x)
         quantity = self.settings['quantity']
         rxn_tol = self.settings['rxn_tolerance']
+        acc = self._get_accelerator()
+        self.convergence = {'iterations': 0, 'residuals': []}
 
         for itr in range(self.settings['max_iter']):
             # Update iterative properties on phase and physics
@@ -328,11 +373,13 @@ class ReactiveTransport(GenericTransport):
             # Compute residual and tolerance
             res = norm(self.A*x - self.b)
             res_tol = norm(self.b) * rxn_tol
+            self.convergence['residuals'].append(res)
             if res > res_tol:
                 logger.info('Tolerance not met: ' + str(res))
                 x_new = self._solve()
+                self.convergence['iterations'] += 1
                 # Relaxation
-                x_new = w * x_new + (1-w) * self[quantity]
+                x_new = acc.update(self[quantity], x_new)
                 self[quantity] = x_new
                 x = x_new
             elif res < res_tol:
@@ -348,3 +395,84 @@ class ReactiveTransport(GenericTransport):
             raise Exception("Maximum iterations reached, solution not converged.")
 
         return x_new
+
+    def _get_accelerator(self):
+        r"""
+        Returns a ``FixedPointAccelerator`` for the Picard iterations, as
+        specified by the ``acceleration`` settings
+
+        Notes
+        -----
+        The linearized source terms make the unrelaxed Picard step close to a
+        Newton step, so longer steps are not taken.  They overshoot where the
+        reaction rate changes quickly, such as near zero concentration.
+        """
+        sets = self.settings
+        acc = FixedPointAccelerator(mode=sets['acceleration'],
+                                    depth=sets['acceleration_depth'],
+                                    relaxation=sets['relaxation_quantity'],
+                                    max_step=1.0)
+        return acc
+
+    def _run_newton(self, x):
+        r"""
+        Finds the solution by Newton's method, with a backtracking line search
+        on the residual.
+
+        Parameters
+        ----------
+        x : ND-array
+            Initial guess of unknown variable
+
+        Returns
+        -------
+        x_new : ND-array
+            Solution array.
+
+        Notes
+        -----
+        The source terms are linearized as ``S1*x + S2``, where ``S1`` is the
+        derivative of the rate, so after the sources are applied *A* is the
+        Jacobian of the residual ``A*x - b`` and solving it gives the full
+        Newton step.  The step is halved until the residual has decreased,
+        which needs the source terms to be recomputed at each trial point.
+        """
+        res, res_tol = self._newton_residual(x)
+        self.convergence = {'iterations': 0, 'residuals': [res]}
+        for itr in range(self.settings['max_iter']):
+            if res < res_tol:
+                logger.info('Solution converged: ' + str(res))
+                return x
+            if not np.isfinite(res):
+                logger.warning('Residual undefined: ' + str(res))
+                raise Exception("Solution diverged; undefined residual.")
+            logger.info('Tolerance not met: ' + str(res))
+            dx = self._solve() - x
+            self.convergence['iterations'] += 1
+            t = 1.0
+            for i in range(self.settings['max_backtracks'] + 1):
+                x_new = x + t*dx
+                res_new, res_tol = self._newton_residual(x_new)
+                # Accept the step once the residual decreases enough
+                if res_new <= (1 - 1e-4*t) * res:
+                    break
+                t = t/2
+            x, res = x_new, res_new
+            self.convergence['residuals'].append(res)
+        if res >= res_tol:
+            raise Exception("Maximum iterations reached, solution not converged.")
+        return x
+
+    def _newton_residual(self, x):
+        r"""
+        Builds *A* and *b* with the source terms found at ``x``, and returns
+        the norm of the residual and the tolerance it must fall below
+        """
+        self[self.settings['quantity']] = x
+        self._update_iterative_props()
+        self._build_A()
+        self._build_b()
+        self._apply_BCs()
+        self._apply_sources()
+        res = norm(self.A*x - self.b)
+        return res, norm(self.b) * self.settings['rxn_tolerance']
@@ -192,6 +192,7 @@ class TransientIonicTransport(IonicTransport, TransientReactiveTransport):
                         i_new[alg.name] = None
 
                     # Iterate (Gummel) until solutions converge
+                    acc = self._get_accelerator()
                     for itr in range(int(self.settings['i_max_iter'])):
                         i_r = [float(format(i, '.3g')) for i in i_res.values()]
                         i_r = str(i_r)[1:-1]
@@ -223,6 +224,8 @@ class TransientIonicTransport(IonicTransport, TransientReactiveTransport):
                             # Update phase and physics
                             phase.update(p_alg.results())
                             phys[0].regenerate_models()
+                            self._accelerate(acc=acc, algs=algs, x=i_old,
+                                             gx=i_new)
 
                         elif i_convergence:
                             print('Solution for time step: ' + str(time)
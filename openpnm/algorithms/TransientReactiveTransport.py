@@ -25,7 +25,9 @@ class TransientReactiveTransport(ReactiveTransport):
     phenomena with reactions when source terms are added. It supports 3 time
     discretization schemes; 'steady' to perform a steady-state simulation, and
     'implicit' (fast, 1st order accurate) and 'cranknicolson' (slow, 2nd order
-    accurate) both for transient simulations.
+    accurate) both for transient simulations.  Transient simulations can march
+    with a fixed time step, or with one adapted to the estimated error by
+    setting 't_adaptive' to True.
     """
 
     def __init__(self, settings={}, phase=None, **kwargs):
@@ -38,6 +40,8 @@ class TransientReactiveTransport(ReactiveTransport):
                    'rxn_tolerance': 1e-05,
                    't_precision': 12,
                    't_scheme': 'implicit',
+                   't_adaptive': False,
+                   't_error_tolerance': 1e-03,
                    'gui': {'setup':        {'phase': None,
                                             'quantity': '',
                                             'conductance': '',
@@ -47,7 +51,9 @@ class TransientReactiveTransport(ReactiveTransport):
                                             't_output': None,
                                             't_tolerance': None,
                                             't_precision': None,
-                                            't_scheme': ''},
+                                            't_scheme': '',
+                                            't_adaptive': None,
+                                            't_error_tolerance': None},
                            'set_IC':       {'values': None},
                            'set_rate_BC':  {'pores': None,
                                             'values': None},
@@ -66,7 +72,8 @@ class TransientReactiveTransport(ReactiveTransport):
 
     def setup(self, phase=None, quantity='', conductance='',
               t_initial=None, t_final=None, t_step=None, t_output=None,
-              t_tolerance=None, t_precision=None, t_scheme='', **kwargs):
+              t_tolerance=None, t_precision=None, t_scheme='',
+              t_adaptive=None, t_error_tolerance=None, **kwargs):
         r"""
         This method takes several arguments that are essential to running the
         algorithm and adds them to the settings
@@ -93,7 +100,8 @@ class TransientReactiveTransport(ReactiveTransport):
             The simulation's end time. The default value is 10.
 
         t_step : scalar, between 't_initial' and 't_final'
-            The simulation's time step. The default value is 0.1.
+            The simulation's time step, or the first time step if 't_adaptive'
+            is True. The default value is 0.1.
 
         t_output : scalar, ND-array, or list
             When 't_output' is a scalar, it is considered as an output interval
@@ -128,6 +136,19 @@ class TransientReactiveTransport(ReactiveTransport):
             order accurate) and 'cranknicolson' (slow, 2nd order accurate) both
             for transient simulations. The default value is 'implicit'.
 
+        t_adaptive : boolean
+            If True, the time step is adapted to keep the estimated error of
+            each step below 't_error_tolerance', so it grows as the solution
+            settles and shrinks during fast transients. Each step is taken
+            both whole and in two halves, and the difference between the two
+            gives the error estimate. Steps are shortened to land exactly on
+            the output times. The default value is False.
+
+        t_error_tolerance : scalar
+            The largest error allowed in each time step when 't_adaptive' is
+            True, relative to the largest absolute value of 'quantity'. The
+            default value is 1e-03.
+
         Notes
         -----
         More settings can be adjusted in the presence of a non-linear source
@@ -154,6 +175,10 @@ class TransientReactiveTransport(ReactiveTransport):
             self.settings['t_precision'] = t_precision
         if t_scheme:
             self.settings['t_scheme'] = t_scheme
+        if t_adaptive is not None:
+            self.settings['t_adaptive'] = t_adaptive
+        if t_error_tolerance is not None:
+            self.settings['t_error_tolerance'] = t_error_tolerance
         self.settings.update(kwargs)
 
     def set_IC(self, values):
@@ -249,17 +274,14 @@ class TransientReactiveTransport(ReactiveTransport):
         # Save A matrix of the steady sys of eqs (WITHOUT BCs applied)
         self._A_steady = (self.A).copy()
         # Initialize A and b with BCs applied
-        self._t_update_A()
-        self._t_update_b()
-        self._apply_BCs()
-        self._A_t = (self._A).copy()
-        self._b_t = (self._b).copy()
+        self._t_assemble()
         if t is None:
             t = self.settings['t_initial']
         # Create S1 & S1 for 1st Picard's iteration
         self._update_iterative_props()
 
-        self._run_transient(t=t)
+        with self._solver_session():
+            self._run_transient(t=t)
 
     def _run_transient(self, t):
         """r
@@ -294,10 +316,11 @@ class TransientReactiveTransport(ReactiveTransport):
 
         if type(to) in [float, int]:
             # Make sure 'tf' and 'to' are multiples of 'dt'
-            tf = tf + (dt-(tf % dt))*((tf % dt) != 0)
-            to = to + (dt-(to % dt))*((to % dt) != 0)
-            self.settings['t_final'] = tf
-            self.settings['t_output'] = to
+            if not self.settings['t_adaptive']:
+                tf = tf + (dt-(tf % dt))*((tf % dt) != 0)
+                to = to + (dt-(to % dt))*((to % dt) != 0)
+                self.settings['t_final'] = tf
+                self.settings['t_output'] = to
             out = np.arange(t+to, tf, to)
         elif type(to) in [np.ndarray, list]:
             out = np.array(to)
@@ -316,6 +339,9 @@ class TransientReactiveTransport(ReactiveTransport):
             t_str = self._nbr_to_str(t)
             quant_init = self[self.settings['quantity']]
             self[self.settings['quantity']+'@'+t_str] = quant_init
+            if self.settings['t_adaptive']:
+                self._run_adaptive(t=t, out=out)
+                return
             for time in np.arange(t+dt, tf+dt, dt):
                 if (res_t >= tol):  # Check if the steady state is reached
                     logger.info('    Current time step: '+str(time)+' s')
@@ -333,11 +359,7 @@ class TransientReactiveTransport(ReactiveTransport):
                         logger.info('        Exporting time step: '
                                     + str(time) + ' s')
                     # Update A and b and apply BCs
-                    self._t_update_A()
-                    self._t_update_b()
-                    self._apply_BCs()
-                    self._A_t = (self._A).copy()
-                    self._b_t = (self._b).copy()
+                    self._t_assemble()
 
                 else:  # Stop time iterations if residual < t_tolerance
                     # Output steady state solution
@@ -351,6 +373,117 @@ class TransientReactiveTransport(ReactiveTransport):
                 logger.info('    Transient solver converged after: '
                             + str(time) + ' s')
 
+    def _run_adaptive(self, t, out):
+        r"""
+        Performs a transient simulation with time steps adapted to the error
+        of each step, which is estimated by step doubling.
+
+        Parameters
+        ----------
+        t : scalar
+            The time to start the simulation from.
+
+        out : ND-array
+            The times at which transient solutions are stored, the last of
+            which is 't_final'.
+
+        Notes
+        -----
+        Each step is taken once with the current time step and once as two
+        steps of half its size. Their difference, divided by ``2**p - 1``
+        where ``p`` is the order of 't_scheme', estimates the error of the
+        latter, which becomes the new solution if the error is small enough.
+        The next time step is then scaled according to the error, and the
+        step is retried with the shorter time step if it was rejected.
+        """
+        quantity = self.settings['quantity']
+        tol = self.settings['t_tolerance']
+        err_tol = self.settings['t_error_tolerance']
+        t_pre = self.settings['t_precision']
+        dt_init = self.settings['t_step']
+        p = 2 if self.settings['t_scheme'] == 'cranknicolson' else 1
+        dt = dt_init
+        n_accepted, n_rejected = 0, 0
+        steady = False
+        try:
+            for t_out in out:
+                while t < t_out:
+                    # Shorten the step to land exactly on the output time
+                    last = dt >= t_out - t
+                    h = t_out - t if last else dt
+                    x_old = self[quantity].copy()
+                    x_coarse = self._t_step(h).copy()
+                    self[quantity] = x_old
+                    self._t_step(h/2)
+                    x_new = self._t_step(h/2).copy()
+                    err = np.absolute(x_new - x_coarse).max() / (2**p - 1)
+                    err = err / (np.absolute(x_new).max() or 1)
+                    # Scale the time step, with a safety factor and within
+                    # bounds
+                    if err == 0:
+                        factor = 5.0
+                    else:
+                        factor = 0.9*(err_tol/err)**(1/(p+1))
+                        factor = min(5.0, max(0.2, factor))
+                    if err > err_tol:
+                        n_rejected += 1
+                        logger.info('    Time step rejected: ' + str(h) + ' s')
+                        self[quantity] = x_old
+                        dt = h * factor
+                        if dt < 10**(-t_pre):
+                            raise Exception('The time step needed to meet '
+                                            + 't_error_tolerance is smaller '
+                                            + 'than t_precision allows')
+                        continue
+                    n_accepted += 1
+                    t = t_out if last else t + h
+                    # A step shortened for output does not limit the next one
+                    dt = max(dt, h*factor) if last else h*factor
+                    logger.info('    Current time step: ' + str(t) + ' s')
+                    res_t = np.sum(np.absolute(x_old**2 - x_new**2))
+                    logger.info('        Residual: ' + str(res_t))
+                    if res_t < tol:
+                        steady = True
+                        break
+                # Output the solution at output times and at steady state
+                t_str = self._nbr_to_str(t)
+                self[quantity + '@' + t_str] = self[quantity]
+                logger.info('        Exporting time step: ' + str(t) + ' s')
+                if steady:
+                    logger.info('    Transient solver converged after: '
+                                + str(t) + ' s')
+                    break
+            logger.info('    ' + str(n_accepted) + ' time steps taken, '
+                        + str(n_rejected) + ' rejected')
+        finally:
+            # Adapting the time step must not change the setting
+            self.settings['t_step'] = dt_init
+
+    def _t_assemble(self):
+        r"""
+        Builds the transient 'A' and 'b' of the current time step with the BCs
+        applied, and keeps copies of them in '_A_t' and '_b_t', from which the
+        source terms are applied at each iteration of the step
+        """
+        self._t_update_A()
+        self._t_update_b()
+        self._apply_BCs()
+        self._A_t = (self._A).copy()
+        self._b_t = (self._b).copy()
+
+    def _t_step(self, dt):
+        r"""
+        Advances the current value of 'quantity' by a time step of size 'dt'
+        and returns the result
+        """
+        self.settings['t_step'] = dt
+        self._t_assemble()
+        # Solve at least once, as the old solution can meet 'rxn_tolerance'
+        # when 'dt' is small, which would hide the error of the step
+        self._apply_sources()
+        self._correct_apply_sources()
+        return self._t_run_reactive(x=self._solve())
+
     def _t_run_reactive(self, x):
         """r
         Repeatedly updates transient 'A', 'b', and the solution guess within
@@ -370,13 +503,14 @@ class TransientReactiveTransport(ReactiveTransport):
 
         Notes
         -----
-        Description of 'relaxation_quantity' and 'max_iter' settings can be
-        found in the parent class 'ReactiveTransport' documentation.
+        Description of 'relaxation_quantity', 'acceleration' and 'max_iter'
+        settings can be found in the parent class 'ReactiveTransport'
+        documentation.
         """
         if x is None:
             x = np.zeros(shape=[self.Np, ], dtype=float)
         self[self.settings['quantity']] = x
-        relax = self.settings['relaxation_quantity']
+        acc = self._get_accelerator()
         phase = self.project.phases()[self.settings['phase']]
         # Reference for residual's normalization
         ref = np.sum(np.absolute(self._A_t.diagonal())) or 1
@@ -394,7 +528,7 @@ class TransientReactiveTransport(ReactiveTransport):
                 logger.info('Tolerance not met: ' + str(res))
                 x_new = self._solve()
                 # Relaxation
-                x_new = relax*x_new + (1-relax)*self[self.settings['quantity']]
+                x_new = acc.update(self[self.settings['quantity']], x_new)
                 self[self.settings['quantity']] = x_new
                 x = x_new
             elif (res < self.settings['rxn_tolerance']):
@@ -475,7 +609,8 @@ class TransientReactiveTransport(ReactiveTransport):
             t_pre = self.settings['t_precision']
         n = int(-dc(str(round(nbr, t_pre))).as_tuple().exponent
                 * (round(nbr, t_pre) != int(nbr)))
-        nbr_str = (str(int(round(nbr, t_pre)*10**n)) + ('e-'+str(n))*(n != 0))
+        nbr_str = (str(int(round(round(nbr, t_pre)*10**n)))
+                   + ('e-'+str(n))*(n != 0))
         return nbr_str
 
     def _correct_apply_sources(self):
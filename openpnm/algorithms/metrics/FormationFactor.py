@@ -101,24 +101,29 @@ class FormationFactor(GenericMetric):
             phys = GenericPhysics(network=self.network,
                                   phase=phase, geometry=geom)
             phys.add_model(propname='throat.diffusive_conductance', model=mod)
+        # All directions are solved in one batch, sharing the same matrix
+        Diff = FickianDiffusion(network=self.project.network, phase=phase)
+        bc_sets = {}
         for bcs in self.settings['inlets'].keys():
-            Diff = FickianDiffusion(network=self.project.network, phase=phase)
             Pin = self.network.pores(self.settings['inlets'][bcs])
-            Diff.set_value_BC(pores=Pin, values=1.0)
             Pout = self.network.pores(self.settings['outlets'][bcs])
-            Diff.set_value_BC(pores=Pout, values=0.0)
-            Diff.run()
+            bc_sets[bcs] = [{'pores': Pin, 'values': 1.0},
+                            {'pores': Pout, 'values': 0.0}]
+        batch = Diff.run_batch(bc_sets)
+        for bcs, (inlets, outlets) in bc_sets.items():
             A = self.settings['areas'][bcs]
             if A is None:
-                A = Diff._get_domain_area()
+                A = Diff._get_domain_area(inlets=inlets['pores'],
+                                          outlets=outlets['pores'])
                 self.settings['areas'][bcs] = A
             L = self.settings['lengths'][bcs]
             if L is None:
-                L = Diff._get_domain_length()
+                L = Diff._get_domain_length(inlets=inlets['pores'],
+                                            outlets=outlets['pores'])
                 self.settings['lengths'][bcs] = L
-            R = Diff.rate(pores=Pin)
+            R = batch[bcs]['rate'][0]
             Deff = R*L/A  # Conc gradient and diffusivity were both unity
-            self.results[bcs] = 1/Deff[0]
+            self.results[bcs] = 1/Deff
 
     def set_inlets(self, direction, label):
         r"""
@@ -107,7 +107,7 @@ class RelativePermeability(GenericAlgorithm):
     def _abs_perm_calc(self, phase, flow_pores):
         r"""
         Calculates absolute permeability of the medium using StokesFlow
-        algorithm. The direction of flow is defined by flow_pores. This
+        algorithm. The directions of flow are defined by flow_pores. This
         permeability is normalized by variables in darcy's law other than
         the rate.
 
@@ -116,27 +116,28 @@ class RelativePermeability(GenericAlgorithm):
         phase: phase object
         The phase for which the flow rate is calculated.
 
-        flow_pores: numpy array
+        flow_pores: dict
         Boundary pores that will have constant value boundary condition to in
-        StokesFlow algorithm. First element is the inlet face (pores) for flow
-        of invading phase through porous media. Second element is the outlet
-        face (pores).
+        StokesFlow algorithm, keyed by direction. First element is the inlet
+        face (pores) for flow of invading phase through porous media. Second
+        element is the outlet face (pores).
 
-        Output: array [Kwp, Knwp]
-        The value of absolute permeability of defending (if there is any) and
-        invadin phase in the direction that is defined by flow_pores.
+        Output: dict
+        The value of absolute permeability of the given phase in each
+        direction that is defined by flow_pores.
 
         Note: Absolute permeability is not dependent to the phase, but here
         we just need to calculate the rate instead of all variables that are
-        contributing to the darcy's law.
+        contributing to the darcy's law.  All directions are solved in one
+        batch, which builds the coefficient matrix once.
         """
         network = self.project.network
         St_p = StokesFlow(network=network, phase=phase)
-        St_p.set_value_BC(pores=flow_pores[0], values=1)
-        St_p.set_value_BC(pores=flow_pores[1], values=0)
-        St_p.run()
-        val = np.sum(abs(St_p.rate(pores=flow_pores[1])))
-        K_abs = val
+        bc_sets = {dim: [{'pores': pores[0], 'values': 1},
+                         {'pores': pores[1], 'values': 0}]
+                   for dim, pores in flow_pores.items()}
+        batch = St_p.run_batch(bc_sets)
+        K_abs = {dim: abs(batch[dim]['rate'][1]) for dim in bc_sets.keys()}
         self.project.purge_object(obj=St_p)
         return K_abs
 
@@ -248,19 +249,16 @@ class RelativePermeability(GenericAlgorithm):
         """
         net = self.project.network
         K_dir = set(self.settings['flow_inlets'].keys())
-        for dim in K_dir:
-            flow_pores = [net.pores(self.settings['flow_inlets'][dim]),
-                          net.pores(self.settings['flow_outlets'][dim])]
-            if self.settings['wp'] is not None:
-                phase = self.project[self.settings['wp']]
-                K_abs = self._abs_perm_calc(phase, flow_pores)
-                self.Kr_values['perm_abs_wp'].update({dim: K_abs})
-                relperm_wp = []
-            else:
-                relperm_wp = None
-            phase = self.project[self.settings['nwp']]
+        flow_pores = {dim: [net.pores(self.settings['flow_inlets'][dim]),
+                            net.pores(self.settings['flow_outlets'][dim])]
+                      for dim in K_dir}
+        if self.settings['wp'] is not None:
+            phase = self.project[self.settings['wp']]
             K_abs = self._abs_perm_calc(phase, flow_pores)
-            self.Kr_values['perm_abs_nwp'].update({dim: K_abs})
+            self.Kr_values['perm_abs_wp'].update(K_abs)
+        phase = self.project[self.settings['nwp']]
+        K_abs = self._abs_perm_calc(phase, flow_pores)
+        self.Kr_values['perm_abs_nwp'].update(K_abs)
         for dirs in self.settings['flow_inlets']:
             if self.settings['wp'] is not None:
                 relperm_wp = []
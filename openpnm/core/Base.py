@@ -2,12 +2,19 @@ import unyt
 from flatdict import FlatDict
 from collections import namedtuple
 import matplotlib.pyplot as plt
-from openpnm.utils import Workspace, logging
+from openpnm.utils import Workspace, Bitset, logging
 from openpnm.utils.misc import PrintableList, SettingsDict, HealthDict
+from openpnm.utils.misc import nbytes_of, memory_to_table
+from openpnm.core.ModelsMixin import _defer
+from openpnm import topotools
 import scipy as sp
+import scipy.sparse as sprs
+import sys
 import warnings
+from itertools import count
 logger = logging.getLogger(__name__)
 ws = Workspace()
+_version_counter = count()
 
 
 class Base(dict):
@@ -145,6 +152,20 @@ class Base(dict):
         # It is necessary to set the SettingsDict here since some classes
         # use it before calling super.__init__()
         instance.settings = SettingsDict()
+        # The namespace index must also exist before any data is written,
+        # including when objects are rebuilt by copy or pickle
+        instance._namespace = {}
+        instance._label_cache = {}
+        instance._versions = {}
+        instance._interleave_cache = {}
+        instance._location_maps = {}
+        instance._id_index = {}
+        instance._interpolation_maps = {}
+        # Write revisions and observers of each key, see notify
+        instance._revisions = {}
+        instance._subscribers = {}
+        # Arrays are stored in memory unless the project assigns a backend
+        instance._storage = None
         return instance
 
     def __init__(self, Np=0, Nt=0, name=None, project=None):
@@ -183,34 +204,43 @@ class Base(dict):
             return
 
         # Check 2: If adding a new key, make sure it has no conflicts
-        if self.project:
-            proj = self.project
+        proj = self.project
+        if proj:
             boss = proj.find_full_domain(self)
-            keys = boss.keys(mode='all', deep=True)
+            objs = [boss] + boss._subdomains()
         else:
             boss = None
-            keys = self.keys()
-        # Prevent 'pore.foo.bar' when 'pore.foo' present
-        long_keys = [i for i in keys if i.count('.') > 1]
+            objs = [self]
         key_root = '.'.join(key.split('.')[:2])
-        if (key.count('.') > 1) and (key_root in keys):
+        # Prevent 'pore.foo.bar' when 'pore.foo' present
+        if (key.count('.') > 1) and any([key_root in obj for obj in objs]):
             raise Exception('Cannot create ' + key + ' when ' +
                             key_root + ' is already defined')
         # Prevent 'pore.foo' when 'pore.foo.bar' is present
-        if (key.count('.') == 1) and any([i.startswith(key) for i in long_keys]):
-            hit = [i for i in keys if i.startswith(key)][0]
-            raise Exception('Cannot create ' + key + ' when ' +
-                            hit + ' is already defined')
+        if key.count('.') == 1:
+            hits = [k for obj in objs for k in obj._namespace.get(key, [])]
+            if hits:
+                raise Exception('Cannot create ' + key + ' when ' +
+                                hits[0] + ' is already defined')
         # Prevent writing pore.foo on boss when present on subdomain
         if boss:
             if boss is self and (key not in ['pore.all', 'throat.all']):
-                if (key in keys) and (key not in self.keys()):
+                if (key not in self) and any([key in obj for obj in objs]):
                     raise Exception('Cannot create ' + key + ' when it is' +
                                     ' already defined on a subdomain')
 
+        # Any cached data involving this key is now out of date
+        self._bump_version(key)
+        # Values written in place of a lazy model's are kept until its inputs
+        # change, as if the model had made them
+        if key in getattr(self, '_models_dict', {}).keys():
+            if (key not in self._lazy_active) and self._lazy_models():
+                self._stamp_model(key, checksums=True)
+
         # This check allows subclassed numpy arrays through, eg. with units
         if not isinstance(value, sp.ndarray):
             value = sp.array(value, ndmin=1)  # Convert value to an ndarray
+        value = self._apply_precision(value, proj)
 
         # Check 3: Enforce correct dict naming
         element = key.split('.')[0]
@@ -218,7 +248,7 @@ class Base(dict):
 
         # Skip checks for 'coords', 'conns'
         if key in ['pore.coords', 'throat.conns']:
-            super(Base, self).__setitem__(key, value)
+            self._write(key, value)
             return
 
         # Skip checks for protected props, and prevent changes if defined
@@ -226,30 +256,168 @@ class Base(dict):
         if key.split('.')[1] in protected_keys:
             if key in self.keys():
                 if sp.shape(self[key]) == (0, ):
-                    super(Base, self).__setitem__(key, value)
+                    self._write(key, value)
                 else:
                     warnings.warn(key+' is already defined.')
             else:
-                super(Base, self).__setitem__(key, value)
+                self._write(key, value)
             return
 
         # Write value to dictionary
         if sp.shape(value)[0] == 1:  # If value is scalar
             value = sp.ones((self._count(element), ), dtype=value.dtype)*value
-            super(Base, self).__setitem__(key, value)
+            self._write(key, value)
+            self._index_key(key)
         elif sp.shape(value)[0] == self._count(element):
-            super(Base, self).__setitem__(key, value)
+            self._write(key, value)
+            self._index_key(key)
         else:
             if self._count(element) == 0:
                 self.update({key: value})
             else:
                 raise Exception('Cannot write array, wrong length: '+key)
 
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._unindex_key(key)
+        self._bump_version(key)
+        if self._storage is not None:
+            self._storage.release(self, key)
+        self.notify(key)
+
+    def pop(self, key, *args):
+        r"""
+        A subclassed version of the standard dict's pop method which keeps
+        the namespace index and label cache up to date.
+        """
+        vals = super().pop(key, *args)
+        self._unindex_key(key)
+        self._bump_version(key)
+        if self._storage is not None:
+            self._storage.release(self, key)
+        self.notify(key)
+        return vals
+
+    def update(self, *args, **kwargs):
+        r"""
+        A subclassed version of the standard dict's update method which keeps
+        the namespace index and label cache up to date.  Note that like the
+        standard method this bypasses all the checks performed by
+        ``__setitem__``.
+        """
+        temp = dict(*args, **kwargs)
+        if self._storage is not None:
+            temp = {k: self._storage.store(self, k, v)
+                    if isinstance(v, sp.ndarray) else v
+                    for k, v in temp.items()}
+        super().update(temp)
+        for key in temp.keys():
+            self._index_key(key)
+            self._bump_version(key)
+            self.notify(key)
+
+    def _write(self, key, value):
+        r"""
+        Places the array in the dictionary, passing it through the storage
+        backend of the project if one has been assigned.  Labels are stored
+        as a ``Bitset`` if ``settings['pack_labels']`` is ``True``.
+        """
+        if self.settings.get('pack_labels', False) and \
+                self._packable(key, value):
+            value = Bitset(value)
+        elif self._storage is not None:
+            value = self._storage.store(self, key, value)
+        super().__setitem__(key, value)
+        self.notify(key)
+
+    def _packable(self, key, value):
+        # The 'all' labels are read too often to be worth packing
+        return (value.dtype == bool) and (value.ndim == 1) \
+            and (key.split('.')[1] != 'all')
+
+    def pack_labels(self, labels=None):
+        r"""
+        Stores the given labels as packed bits, using 1 bit per pore or
+        throat rather than 1 byte.
+
+        Parameters
+        ----------
+        labels : string or list of strings
+            The labels to pack.  If not given then all labels on the object
+            are packed, except for 'pore.all' and 'throat.all'.
+
+        Notes
+        -----
+        Queries such as ``pores``, ``throats``, ``labels`` and ``set_label``
+        work directly on the packed bits.  Retrieving a label with
+        ``obj['pore.label']`` returns a read-only boolean array, and the label
+        stays packed.  Packed labels are changed with ``set_label`` or by
+        writing a new array.
+
+        To pack labels as they are written, set ``settings['pack_labels']``
+        to ``True``.
+
+        """
+        if labels is None:
+            labels = self.keys(mode='labels')
+        if type(labels) is str:
+            labels = [labels]
+        for key in labels:
+            value = dict.get(self, key)
+            if isinstance(value, sp.ndarray) and self._packable(key, value):
+                super().__setitem__(key, Bitset(value))
+                if self._storage is not None:
+                    self._storage.release(self, key)
+
+    def _set_storage(self, storage):
+        r"""
+        Moves all arrays to the given storage backend, or into memory if
+        ``storage`` is ``None``.  This is called when a backend is assigned
+        to the project, so should not need to be called directly.
+        """
+        old = self._storage
+        self._storage = storage
+        for key, value in list(dict.items(self)):
+            if not isinstance(value, sp.ndarray):
+                continue
+            if storage is None:
+                if isinstance(value, sp.memmap):
+                    value = sp.array(value)
+                super().__setitem__(key, value)
+            else:
+                super().__setitem__(key, storage.store(self, key, value))
+            if (old is not None) and (old is not storage):
+                old.release(self, key)
+
+    def _index_key(self, key):
+        r"""
+        Adds a nested key (i.e. 'pore.foo.bar') to the namespace index, which
+        maps each root (i.e. 'pore.foo') to the set of nested keys below it.
+        This lets the conflict checks in ``__setitem__`` avoid scanning all
+        keys in the domain.
+        """
+        if key.count('.') > 1:
+            root = '.'.join(key.split('.')[:2])
+            self._namespace.setdefault(root, set()).add(key)
+
+    def _unindex_key(self, key):
+        r"""
+        Removes a nested key from the namespace index, if present
+        """
+        if key.count('.') > 1:
+            root = '.'.join(key.split('.')[:2])
+            hits = self._namespace.get(root, set())
+            hits.discard(key)
+            if len(hits) == 0:
+                self._namespace.pop(root, None)
+
     def __getitem__(self, key):
         element, prop = key.split('.', 1)
+        self._refresh_lazy(key)
         if key in self.keys():
-            # Get values if present on self
-            vals = super().__getitem__(key)
+            # Get values if present on self, which may then be edited in-place
+            vals = self._unpack(key, super().__getitem__(key))
+            self._bump_version(key)
         elif key in self.keys(mode='all', deep=True):
             # Interleave values from geom if found there
             vals = self.interleave_data(key)
@@ -257,7 +425,7 @@ class Base(dict):
             # Create a subdict of values present on self
             vals = {}
             keys = self.keys()
-            vals.update({k: self.get(k) for k in keys if k.startswith(key + '.')})
+            vals.update({k: self[k] for k in keys if k.startswith(key + '.')})
         elif any([k.startswith(key + '.') for k in self.keys(mode='all',
                                                              deep=True)]):
             # Create a subdict of values in subdomains by interleaving
@@ -265,16 +433,82 @@ class Base(dict):
             keys = self.keys(mode='all', deep=True)
             vals.update({k: self.interleave_data(k) for k in keys
                          if k.startswith(key + '.')})
-        # The following code, if activated, attempts to run models when
-        # missing data is requested from the dictionary.  The works fine,
-        # but breaks the general way openpnm behaviors.
-        # elif hasattr(self, 'models') and key in self.models:
-        #     self.regenerate_models(key)
-        #     vals = super().__getitem__(key)
         else:
             raise KeyError(key)
         return vals
 
+    def _lazy_models(self):
+        r"""
+        Returns ``True`` if models are only run when their values are read,
+        as set by ``settings['lazy_models']`` on the project, or on the
+        Workspace if not set there.
+        """
+        # Avoid finding the project when lazy models were never enabled
+        if not SettingsDict._enabled['lazy_models']:
+            return False
+        lazy = None
+        proj = self.project
+        if proj:
+            lazy = proj.settings.get('lazy_models', None)
+        if lazy is None:
+            lazy = ws.settings.get('lazy_models', False)
+        return bool(lazy)
+
+    def _refresh_lazy(self, key):
+        r"""
+        Runs the models which produce ``key`` if their values are missing or
+        out of date and models are evaluated lazily.  Keys not found on self
+        are looked for on the subdomains, whose values will be interleaved.
+        """
+        if not self._lazy_models():
+            return
+        # Models returning a dict write to keys like 'pore.foo.bar'
+        names = [key, '.'.join(key.split('.')[:2])]
+        objs = [self]
+        if not dict.__contains__(self, key):
+            objs.extend(self._subdomains())
+        for obj in objs:
+            for name in set(names):
+                if name in getattr(obj, '_models_dict', {}).keys():
+                    obj._update_model(name)
+
+    def _apply_precision(self, value, proj):
+        r"""
+        Narrows the dtype of the given array if the precision policy is
+        'single'.  Floats are stored as float32, and integers as int32 if all
+        values fit.  The policy is taken from ``settings['precision']`` on
+        the project, or on the Workspace if not set there.  Algorithms are
+        not affected, so their results keep full precision.
+        """
+        precision = None
+        if proj:
+            precision = proj.settings.get('precision', None)
+        if precision is None:
+            precision = ws.settings.get('precision', 'double')
+        if precision != 'single':
+            return value
+        if 'GenericAlgorithm' in self._mro():
+            return value
+        if value.dtype == sp.float64:
+            value = value.astype(sp.float32)
+        elif value.dtype == sp.int64:
+            info = sp.iinfo(sp.int32)
+            if (value.size == 0) or ((value.min() >= info.min)
+                                     and (value.max() <= info.max)):
+                value = value.astype(sp.int32)
+        return value
+
+    def _unpack(self, key, vals):
+        r"""
+        Converts a packed label to a boolean array before it's handed out.
+        The label stays packed, so the array is made read-only rather than
+        letting in-place edits be lost.
+        """
+        if isinstance(vals, Bitset):
+            vals = sp.array(vals)
+            vals.flags.writeable = False
+        return vals
+
     def _set_name(self, name, validate=True):
         if not hasattr(self, '_name'):
             self._name = None
@@ -291,6 +525,11 @@ class Base(dict):
                     item['pore.'+name] = item.pop('pore.'+self.name)
                 if 'throat.'+self.name in item.keys():
                     item['throat.'+name] = item.pop('throat.'+self.name)
+                # Keep any subscriptions made by this object
+                for subs in getattr(item, '_subscribers', {}).values():
+                    for i, (sub, method) in enumerate(subs):
+                        if sub == self.name:
+                            subs[i] = (name, method)
         self._name = name
 
     def _get_name(self):
@@ -467,15 +706,23 @@ class Base(dict):
             temp = [i for i in temp if i.split('.')[0] in element]
 
         if deep:
-            if self._isa('phase'):
-                for item in self.project.find_physics(phase=self):
-                    temp += item.keys(element=element, mode=mode, deep=False)
-            if self._isa('network'):
-                for item in self.project.geometries().values():
-                    temp += item.keys(element=element, mode=mode, deep=False)
+            for item in self._subdomains():
+                temp += item.keys(element=element, mode=mode, deep=False)
 
         return temp
 
+    def _subdomains(self):
+        r"""
+        Returns a list of the subdomain objects whose data is part of this
+        object's domain.  These are the Physics for a Phase and the
+        Geometries for a Network.  All other objects have no subdomains.
+        """
+        if self._isa('phase'):
+            return list(self.project.find_physics(phase=self))
+        if self._isa('network'):
+            return list(self.project.geometries().values())
+        return []
+
     # -------------------------------------------------------------------------
     """Data Query Methods"""
     # -------------------------------------------------------------------------
@@ -556,12 +803,8 @@ class Base(dict):
         vals = PrintableList(list(vals))
         # Repeat for associated objects if deep is True
         if deep:
-            if self._isa('phase'):
-                for item in self.project.find_physics(phase=self):
-                    vals += item.props(element=element, mode=mode, deep=False)
-            if self._isa('network'):
-                for item in self.project.geometries().values():
-                    vals += item.props(element=element, mode=mode, deep=False)
+            for item in self._subdomains():
+                vals += item.props(element=element, mode=mode, deep=False)
         return vals
 
     def _get_labels(self, element, locations, mode):
@@ -577,7 +820,10 @@ class Base(dict):
         labels.sort()
         labels = sp.array(labels)  # Convert to ND-array for following checks
         # Make an 2D array with locations in rows and labels in cols
-        arr = sp.vstack([self[item][locations] for item in labels]).T
+        # Labels may be packed, so read only the requested locations, unless
+        # they are not stored on self (i.e. on views)
+        arr = sp.vstack([(self.get(item) if item in self else self[item])
+                         [locations] for item in labels]).T
         num_hits = sp.sum(arr, axis=0)  # Number of locations with each label
         if mode in ['or', 'union', 'any']:
             temp = labels[num_hits > 0]
@@ -713,22 +959,17 @@ class Base(dict):
         else:
             if label.split('.')[0] in ['pore', 'throat']:
                 label = label.split('.', 1)[1]
-            if pores is not None:
-                pores = self._parse_indices(pores)
-                if (mode == 'overwrite') or ('pore.'+label not in self.labels()):
-                    self['pore.' + label] = False
-                if mode in ['remove']:
-                    self['pore.' + label][pores] = False
-                else:
-                    self['pore.' + label][pores] = True
-            if throats is not None:
-                throats = self._parse_indices(throats)
-                if (mode == 'overwrite') or ('throat.'+label not in self.labels()):
-                    self['throat.' + label] = False
-                if mode in ['remove']:
-                    self['throat.' + label][throats] = False
-                else:
-                    self['throat.' + label][throats] = True
+            for element, locs in zip(['pore', 'throat'], [pores, throats]):
+                if locs is None:
+                    continue
+                key = element + '.' + label
+                locs = self._parse_indices(locs)
+                if (mode == 'overwrite') or (key not in self.labels()):
+                    self[key] = False
+                # Edit the stored array directly, since it may be packed
+                self.get(key)[locs] = (mode not in ['remove'])
+                self._bump_version(key)
+                self.notify(key)
             if pores is None and throats is None:
                 del self
 
@@ -742,49 +983,240 @@ class Base(dict):
         labels = self._parse_labels(labels=labels, element=element)
         if element+'.all' not in self.keys():
             raise Exception('Cannot proceed without {}.all'.format(element))
-
-        # Begin computing label array
-        if mode in ['or', 'any', 'union']:
-            union = sp.zeros_like(self[element+'.all'], dtype=bool)
-            for item in labels:  # Iterate over labels and collect all indices
-                union = union + self[element+'.'+item.split('.')[-1]]
-            ind = union
-        elif mode in ['and', 'all', 'intersection']:
-            intersect = sp.ones_like(self[element+'.all'], dtype=bool)
-            for item in labels:  # Iterate over labels and collect all indices
-                intersect = intersect*self[element+'.'+item.split('.')[-1]]
-            ind = intersect
-        elif mode in ['xor', 'exclusive_or']:
-            xor = sp.zeros_like(self[element+'.all'], dtype=int)
-            for item in labels:  # Iterate over labels and collect all indices
-                info = self[element+'.'+item.split('.')[-1]]
-                xor = xor + sp.int8(info)
-            ind = (xor == 1)
-        elif mode in ['nor', 'not', 'none']:
-            nor = sp.zeros_like(self[element+'.all'], dtype=int)
-            for item in labels:  # Iterate over labels and collect all indices
-                info = self[element+'.'+item.split('.')[-1]]
-                nor = nor + sp.int8(info)
-            ind = (nor == 0)
-        elif mode in ['nand']:
-            nand = sp.zeros_like(self[element+'.all'], dtype=int)
-            for item in labels:  # Iterate over labels and collect all indices
-                info = self[element+'.'+item.split('.')[-1]]
-                nand = nand + sp.int8(info)
-            ind = (nand < len(labels)) * (nand > 0)
-        elif mode in ['xnor', 'nxor']:
-            xnor = sp.zeros_like(self[element+'.all'], dtype=int)
-            for item in labels:  # Iterate over labels and collect all indices
-                info = self[element+'.'+item.split('.')[-1]]
-                xnor = xnor + sp.int8(info)
-            ind = (xnor > 1)
+        keys = [element+'.'+item.split('.')[-1] for item in labels]
+        # Results can only be cached if all labels are stored on self
+        cacheable = all([k in self for k in keys])
+        if cacheable:
+            query = (element, tuple(sorted(keys)), mode)
+            sources = [(self, k) for k in query[1] + (element+'.all', )]
+            hit = self._label_cache.get(element+'.all', {}).get(query, None)
+            # Labels handed out since may have been edited in-place
+            if (hit is not None) and self._unchanged_since(sources, hit[0]):
+                return hit[1].copy()
+            stamps = self._stamp_arrays(sources)
+            cacheable = stamps is not None
+            arrs = [super(Base, self).__getitem__(k) for k in keys]
         else:
+            arrs = [self[k] for k in keys]
+        modes = {'or': ['or', 'any', 'union'],
+                 'and': ['and', 'all', 'intersection'],
+                 'xor': ['xor', 'exclusive_or'],
+                 'nor': ['nor', 'not', 'none'],
+                 'nand': ['nand'],
+                 'xnor': ['xnor', 'nxor']}
+        modes = {v: k for k in modes.keys() for v in modes[k]}
+        if mode not in modes.keys():
             raise Exception('Unsupported mode: '+mode)
-        # Extract indices from boolean mask
-        ind = sp.where(ind)[0]
+        mode = modes[mode]
+        if arrs and all([isinstance(a, Bitset) for a in arrs]):
+            # Packed labels are combined word-wise
+            ind = Bitset.combine(arrs, mode=mode, size=self._count(element))
+            ind = ind.indices()
+        else:
+            # Count the labels applied to each location
+            hits = sp.zeros((self._count(element), ), dtype=int)
+            for a in arrs:
+                hits += sp.array(a) if isinstance(a, Bitset) else a
+            if mode == 'or':
+                ind = hits > 0
+            elif mode == 'and':
+                ind = hits == len(arrs)
+            elif mode == 'xor':
+                ind = hits == 1
+            elif mode == 'nor':
+                ind = hits == 0
+            elif mode == 'nand':
+                ind = (hits > 0) * (hits < len(arrs))
+            elif mode == 'xnor':
+                ind = hits > 1
+            ind = sp.where(ind)[0]
         ind = ind.astype(dtype=int)
+        if cacheable:
+            # Cached results are shared between callers so must not change
+            ind.flags.writeable = False
+            _defer(self._cache_label_query, query, (stamps, ind))
+            ind = ind.copy()
         return ind
 
+    def _bump_version(self, key):
+        r"""
+        Assigns a new write version to the given key.  This is called whenever
+        an array is written, deleted, or handed out by ``__getitem__`` (since
+        it may then be changed in-place), so any data derived from the array
+        can be checked for staleness by comparing versions.
+        """
+        _defer(self._versions.__setitem__, key, next(_version_counter))
+
+    def _stamp_arrays(self, sources):
+        r"""
+        Returns the versions of the arrays given as a list of (object, key)
+        tuples, so that ``_unchanged_since`` can tell if any of them has been
+        handed out by ``__getitem__`` since, and may have been edited
+        in-place.  ``None`` is returned if any of them is referenced from
+        outside of its object, as it could then be edited at any time.
+        """
+        stamps = []
+        for obj, key in sources:
+            arr = dict.get(obj, key, None)
+            # Otherwise only held by the dict, 'arr' and getrefcount itself
+            if isinstance(arr, sp.ndarray) and (sys.getrefcount(arr) > 3):
+                return None
+            stamps.append(obj._versions.get(key))
+        return stamps
+
+    def _unchanged_since(self, sources, stamps):
+        r"""
+        Returns ``True`` if none of the arrays given as a list of (object,
+        key) tuples has been written or handed out since ``stamps`` was made
+        by ``_stamp_arrays``.
+        """
+        return [obj._versions.get(key) for obj, key in sources] == stamps
+
+    def subscribe(self, callback, keys=None):
+        r"""
+        Registers a method to be called whenever the data on this object
+        changes, so that anything derived from the data can be updated.
+
+        Parameters
+        ----------
+        callback : bound method
+            A method of an object in the same project, which is called as
+            ``callback(obj, key)`` after ``key`` is changed on ``obj``.
+
+        keys : string or list of strings
+            The keys to observe.  If not given then changes to all keys are
+            reported.
+
+        See Also
+        --------
+        notify
+        unsubscribe
+
+        Notes
+        -----
+        Subscriptions are stored by the name of the subscribing object and
+        method, so they are kept when a project is copied or saved, and
+        apply between the corresponding objects of the copy.  They are
+        removed when the subscribing object is purged from the project.
+
+        Only writes made through the object, such as ``__setitem__``, ``del``
+        and ``set_label``, are reported.  Arrays edited in-place, as in
+        ``obj['pore.foo'][:] = 1.0``, are not, so ``notify`` must be called
+        after doing so.
+
+        Examples
+        --------
+        >>> import openpnm as op
+        >>> pn = op.network.Cubic(shape=[3, 3, 3])
+        >>> geo = op.geometry.GenericGeometry(network=pn, pores=pn.Ps,
+        ...                                   throats=pn.Ts)
+        >>> pn._am.clear()
+        >>> am = pn.get_adjacency_matrix()
+        >>> len(pn._am)
+        1
+        >>> pn['throat.conns'] = pn['throat.conns']  # Clears cached matrices
+        >>> len(pn._am)
+        0
+
+        """
+        if not hasattr(callback, '__self__'):
+            raise Exception('Only methods of OpenPNM objects can subscribe')
+        entry = (callback.__self__.name, callback.__func__.__name__)
+        if keys is None or type(keys) is str:
+            keys = [keys]
+        for key in keys:
+            subs = self._subscribers.setdefault(key, [])
+            if entry not in subs:
+                subs.append(entry)
+
+    def unsubscribe(self, callback, keys=None):
+        r"""
+        Removes a method registered with ``subscribe``
+
+        Parameters
+        ----------
+        callback : bound method
+            The subscribed method
+
+        keys : string or list of strings
+            The keys to stop observing.  If not given then all subscriptions
+            of the method are removed.
+
+        """
+        entry = (callback.__self__.name, callback.__func__.__name__)
+        if keys is None:
+            keys = list(self._subscribers.keys())
+        elif type(keys) is str:
+            keys = [keys]
+        for key in keys:
+            subs = self._subscribers.get(key, [])
+            if entry in subs:
+                subs.remove(entry)
+
+    def _forget_subscriber(self, name):
+        r"""
+        Removes all methods subscribed by the named object, which is done
+        when it's purged since its name may be given to a new object.
+        """
+        for subs in self._subscribers.values():
+            subs[:] = [s for s in subs if s[0] != name]
+
+    def notify(self, key):
+        r"""
+        Records that the data under ``key`` has changed, and calls the methods
+        which subscribed to it.
+
+        Parameters
+        ----------
+        key : string
+            The key which has changed
+
+        Notes
+        -----
+        This is called whenever a key is written with ``__setitem__`` or
+        deleted, and by ``set_label``.  Arrays edited in-place are not
+        reported to subscribers, so this should be called after doing so.
+
+        Each call gives the key a new write revision, which unlike the
+        versions used for model staleness is not changed by reading the key.
+        Any cached label queries involving the key are also discarded, though
+        labels edited in-place are found by ``pores`` and ``throats`` without
+        this call.  Subdomains also notify their Network or Phase, whose
+        interleaved values have changed.
+
+        """
+        self._revisions[key] = next(_version_counter)
+        self._clear_label_cache(key)
+        subs = self._subscribers.get(key, []) + self._subscribers.get(None, [])
+        if not subs:
+            return
+        proj = self.project
+        for name, method in list(subs):
+            try:
+                obj = proj[name]
+            except (KeyError, TypeError):
+                continue  # The subscriber is no longer in the project
+            _defer(getattr(obj, method), self, key)
+
+    def _cache_label_query(self, query, entry):
+        # Stores the stamps of the labels and the result under each label it
+        # depends on, see _get_indices
+        element, labels, mode = query
+        for k in set(labels).union([element+'.all']):
+            self._label_cache.setdefault(k, {})[query] = entry
+
+    def _clear_label_cache(self, key):
+        r"""
+        Removes all cached results of ``_get_indices`` that depend on the
+        given key.
+        """
+        queries = self._label_cache.pop(key, None)
+        if queries:
+            for query in queries.keys():
+                element, labels, mode = query
+                for k in set(labels).union([element+'.all']):
+                    self._label_cache.get(k, {}).pop(query, None)
+
     def pores(self, labels='all', mode='or', asmask=False, target=None):
         r"""
         Returns pore indicies where given labels exist, according to the logic
@@ -953,19 +1385,55 @@ class Base(dict):
 
     def _map(self, ids, element, filtered):
         ids = sp.array(ids, dtype=sp.int64)
-        locations = self._get_indices(element=element)
-        self_in_ids = sp.isin(ids, self[element+'._id'], assume_unique=True)
-        ids_in_self = sp.isin(self[element+'._id'], ids, assume_unique=True)
-        mask = sp.zeros(shape=ids.shape, dtype=bool)
-        mask[self_in_ids] = True
+        sorted_ids, order = self._get_id_index(element=element)
+        # Find where each id would sit in the sorted ids, then check for hits
+        if sorted_ids.size > 0:
+            pos = sp.searchsorted(sorted_ids, ids)
+            pos[pos == sorted_ids.size] = 0
+            mask = sorted_ids[pos] == ids
+        else:
+            pos = sp.zeros_like(ids)
+            mask = sp.zeros(shape=ids.shape, dtype=bool)
         ind = sp.ones_like(mask, dtype=sp.int64) * -1
-        ind[self_in_ids] = locations[ids_in_self]
+        ind[mask] = order[pos[mask]]
         if filtered:
             return ind[mask]
         else:
             t = namedtuple('index_map', ('indices', 'mask'))
             return t(ind, mask)
 
+    def _get_id_index(self, element):
+        r"""
+        Returns the '_id' values of the object in sorted order, along with the
+        location of each on the object, for use by ``_map``.
+
+        Notes
+        -----
+        The index is cached and only rebuilt when the ids change, which
+        happens when pores or throats are added to or removed from the
+        network, or when the object's locations on its boss change.
+
+        """
+        element = self._parse_element(element, single=True)
+        proj = self.project
+        sig = (self._count(element), self._versions.get(element+'._id'))
+        if proj and proj.network:
+            net = proj.network
+            net._gen_ids()
+            sig += (id(net), net._versions.get(element+'._id'))
+            boss = proj.find_full_domain(self)
+            if boss is not self:
+                sig += (id(boss), boss._versions.get(element+'.'+self.name))
+        hit = self._id_index.get(element, None)
+        if (hit is not None) and (hit[0] == sig):
+            return hit[1], hit[2]
+        ids = sp.array(self[element+'._id'], dtype=sp.int64)
+        # Ids are generated in increasing order so are usually presorted
+        order = sp.argsort(ids, kind='stable')
+        sorted_ids = ids[order]
+        self._id_index[element] = (sig, sorted_ids, order)
+        return sorted_ids, order
+
     def map_pores(self, pores, origin, filtered=True):
         r"""
         Given a list of pore on a target object, finds indices of those pores
@@ -1041,7 +1509,7 @@ class Base(dict):
         """
         element = self._parse_element(element, single=True)
         indices = self._parse_indices(indices)
-        N = sp.shape(self[element + '.all'])[0]
+        N = self._count(element)
         ind = sp.array(indices, ndmin=1)
         mask = sp.zeros((N, ), dtype=bool)
         mask[ind] = True
@@ -1183,6 +1651,23 @@ class Base(dict):
         else:
             raise Exception('Unrecognized object type, cannot find dependents')
 
+        # Reuse the previous result if no source array, location label, or
+        # domain size has been written or edited since it was made
+        if self._isa() in ['network', 'phase']:
+            sig = (N, ) + tuple([(id(item), item._revisions.get(prop),
+                                  self._revisions.get(element+'.'+item.name))
+                                 for item in sources])
+            hit = self._interleave_cache.get(prop, None)
+            if (hit is not None) and (hit[0] == sig) \
+                    and self._interleave_unchanged(prop, sources, hit):
+                # Callers may edit the interleaved array, so return a copy
+                return hit[2].copy()
+            # Taken before the arrays are fetched below, which hold them
+            stamps = self._stamp_arrays(self._interleave_sources(prop,
+                                                                 sources))
+        else:
+            stamps = None
+
         # Attempt to fetch the requested array from each object
         arrs = [item.get(prop, None) for item in sources]
         locs = [self._get_indices(element, item.name) for item in sources]
@@ -1191,16 +1676,7 @@ class Base(dict):
             raise KeyError(prop)
 
         # Check the general type of each array
-        atype = []
-        for a in arrs:
-            if a is not None:
-                t = a.dtype.name
-                if t.startswith('int') or t.startswith('float'):
-                    atype.append('numeric')
-                elif t.startswith('bool'):
-                    atype.append('boolean')
-                else:
-                    atype.append('other')
+        atype = [self._array_type(a) for a in arrs if a is not None]
         if not all([item == atype[0] for item in atype]):
             raise Exception('The array types are not compatible')
         else:
@@ -1236,9 +1712,156 @@ class Base(dict):
                     temp_arr *= sp.array([1])*getattr(unyt, units[0])
                 else:
                     raise Exception('Units on the interleaved array are not equal')
+        if stamps is not None:
+            self._interleave_cache[prop] = (sig, stamps, temp_arr.copy())
         return temp_arr
 
-    def interpolate_data(self, propname):
+    def _interleave_sources(self, prop, sources):
+        # The arrays and location labels used to interleave prop, as (object,
+        # key) tuples for _stamp_arrays
+        element = prop.split('.')[0]
+        return [(item, prop) for item in sources] \
+            + [(self, element+'.'+item.name) for item in sources]
+
+    def _interleave_unchanged(self, prop, sources, hit):
+        r"""
+        Returns ``True`` if the cached result of ``interleave_data`` held in
+        ``hit`` still matches the values of ``prop`` on the ``sources``.
+
+        Notes
+        -----
+        Arrays handed out since the result was cached may have been edited
+        in-place, so their values are compared with the result.  If they
+        match and are no longer referenced elsewhere, the entry is stamped
+        again so they need not be compared on later calls.
+        """
+        sig, stamps, arr = hit
+        keys = self._interleave_sources(prop, sources)
+        if self._unchanged_since(keys, stamps):
+            return True
+        element = prop.split('.')[0]
+        for (obj, key), version in zip(keys, stamps):
+            if obj._versions.get(key) == version:
+                continue
+            if (obj is self) or arr.dtype.hasobject:
+                return False  # A location label, or values can't be compared
+            locs = self._get_indices(element, obj.name)
+            if not sp.array_equal(arr[locs], obj._unpack(key, obj.get(key)),
+                                  equal_nan=True):
+                return False
+        stamps = self._stamp_arrays(keys)
+        if stamps is not None:
+            self._interleave_cache[prop] = (sig, stamps, arr)
+        return True
+
+    def _array_type(self, arr):
+        r"""
+        Returns the general type of the given array as 'numeric', 'boolean'
+        or 'other', which is used to decide how missing values are filled.
+        """
+        t = arr.dtype.name
+        if t.startswith('int') or t.startswith('float'):
+            return 'numeric'
+        elif t.startswith('bool'):
+            return 'boolean'
+        else:
+            return 'other'
+
+    def _gather_from_subdomains(self, key, locations):
+        r"""
+        Fetches the values of ``key`` at the given locations from the
+        subdomains holding it, without interleaving the full domain.
+
+        Parameters
+        ----------
+        key : string
+            The property or label to fetch, which is not present on self
+
+        locations : array_like
+            The indices of the locations on self
+
+        Returns
+        -------
+        An array the same length as ``locations``, with missing values filled
+        as done by ``interleave_data``, or ``None`` if the subdomains do not
+        hold the key or the request is better handled by ``interleave_data``
+        (i.e. arrays have units or mixed types).
+
+        """
+        element = key.split('.')[0]
+        subs, owner, local = self._subdomain_locations(element)
+        arrs = [sub._unpack(key, dict.get(sub, key, None)) for sub in subs]
+        found = [a for a in arrs if a is not None]
+        if len(found) == 0:
+            return None
+        if any([hasattr(a, 'units') for a in found]):
+            return None
+        atype = set([self._array_type(a) for a in found])
+        if len(atype) > 1:
+            return None
+        atype = atype.pop()
+        dummy_val = {'numeric': sp.nan, 'boolean': False, 'other': None}
+        # Find which subdomain owns each location, and where in its arrays
+        owners = owner[locations]
+        positions = local[locations]
+        # Ints must be converted to floats to hold nans at missing locations
+        dtype = found[-1].dtype
+        held = [i for i, arr in enumerate(arrs) if arr is not None]
+        if dtype.name.startswith('int') and \
+                not sp.all(sp.isin(owners, held)):
+            dtype = float
+        vals = sp.zeros((sp.size(locations), *found[-1].shape[1:]),
+                        dtype=dtype)
+        vals.fill(dummy_val[atype])
+        for i in held:
+            hits = owners == i
+            if sp.any(hits):
+                vals[hits] = arrs[i][positions[hits]]
+        return vals
+
+    def _subdomain_locations(self, element):
+        r"""
+        Returns maps showing which subdomain owns each location on this object,
+        and the index of each location within that subdomain's arrays.
+
+        Parameters
+        ----------
+        element : string
+            Either 'pore' or 'throat'
+
+        Returns
+        -------
+        A tuple containing the list of subdomains, an array with the position
+        in this list of the subdomain owning each location (-1 if none), and
+        an array with the index of each location on its subdomain.
+
+        Notes
+        -----
+        The maps are cached and only rebuilt when the location labels of the
+        subdomains change.
+
+        """
+        element = self._parse_element(element, single=True)
+        subs = self._subdomains()
+        N = self._count(element)
+        sig = (N, ) + tuple([(id(item),
+                              self._versions.get(element+'.'+item.name))
+                             for item in subs])
+        hit = self._location_maps.get(element, None)
+        if (hit is not None) and (hit[0] == sig):
+            return (subs, hit[1], hit[2])
+        owner = sp.ones((N, ), dtype=int)*-1
+        local = sp.zeros((N, ), dtype=int)
+        for i, item in enumerate(subs):
+            if element+'.'+item.name in self.keys():
+                locs = self._get_indices(element=element, labels=item.name)
+                owner[locs] = i
+                local[locs] = sp.arange(locs.size)
+        self._location_maps[element] = (sig, owner, local)
+        return (subs, owner, local)
+
+    def interpolate_data(self, propname, mode='mean', weights=None,
+                         ignore_nans=False):
         r"""
         Determines a pore (or throat) property as the average of it's
         neighboring throats (or pores)
@@ -1248,14 +1871,34 @@ class Base(dict):
         propname: string
             The dictionary key to the values to be interpolated.
 
+        mode : string
+            How the neighboring values are combined.  Options are 'mean'
+            (default), 'min' and 'max'.
+
+        weights : string or array_like, optional
+            The dictionary key to, or an array of, the weights of the values
+            being interpolated (e.g. 'throat.volume'), in which case a weighted
+            mean is found.  Only used when ``mode`` is 'mean'.
+
+        ignore_nans : boolean
+            If ``True`` then neighbors with ``nan`` values are left out,
+            otherwise (default) the result is ``nan`` if any neighbor is.
+
         Returns
         -------
         An array containing interpolated pore (or throat) data
 
         Notes
         -----
-        This uses an unweighted average, without attempting to account for
-        distances or sizes of pores and throats.
+        Only the throats of a pore which are on the same object as the pore
+        are used, so pores whose throats all belong to another Geometry or
+        Physics give ``nan``.  Throat values are found from the pores at both
+        ends, and pores on other objects count as ``nan``.
+
+        The values are combined by ``topotools.reduce_neighbor_values``, using
+        the network's incidence matrix restricted to the locations of this
+        object, which is cached until the topology or the object's locations
+        change.
 
         Examples
         --------
@@ -1264,40 +1907,84 @@ class Base(dict):
         >>> pn['pore.value'] = [1, 2, 3]
         >>> pn.interpolate_data('pore.value')
         array([1.5, 2.5])
+        >>> pn.interpolate_data('pore.value', mode='max')
+        array([2., 3.])
 
         """
-        boss = self.project.find_full_domain(self)
-        net = self.project.network
-        if boss is self:
-            Ts = boss.throats()
-            Ps = boss.pores()
-            label = 'all'
-        else:
-            Ts = boss.throats(self.name)
-            Ps = boss.pores(self.name)
-            label = self.name
-        if propname.startswith('throat'):
-            # Upcast data to full network size
-            temp = sp.ones((boss.Nt,))*sp.nan
-            temp[Ts] = self[propname]
+        element = propname.split('.')[0]
+        im = self._interpolation_matrix(element)
+        vals = self[propname]
+        data = vals
+        if type(weights) is str:
+            weights = self[weights]
+        if element == 'pore':
+            # Upcast data to full network size, since pores at the ends of
+            # the throats may not be on self
+            net = self.project.network
+            boss = self.project.find_full_domain(self)
+            Ps = net.Ps if boss is self else boss.pores(self.name)
+            temp = sp.ones((net.Np, ))*sp.nan
+            temp[Ps] = data
             data = temp
-            temp = sp.ones((boss.Np,))*sp.nan
-            for pore in Ps:
-                neighborTs = net.find_neighbor_throats(pore)
-                neighborTs = net.filter_by_label(throats=neighborTs,
-                                                 labels=label)
-                temp[pore] = sp.mean(data[neighborTs])
-            values = temp[Ps]
-        elif propname.startswith('pore'):
-            # Upcast data to full network size
-            data = sp.ones((net.Np, ))*sp.nan
-            data[Ps] = self[propname]
-            Ps12 = net['throat.conns'][Ts]
-            values = sp.mean(data[Ps12], axis=1)
-        if hasattr(self[propname], 'units'):
-            values *= self[propname].units
+            if weights is not None:
+                temp = sp.zeros((net.Np, ))
+                temp[Ps] = weights
+                weights = temp
+        values = topotools.reduce_neighbor_values(im, values=data, mode=mode,
+                                                  weights=weights,
+                                                  ignore_nans=ignore_nans)
+        if hasattr(vals, 'units'):
+            values *= vals.units
         return values
 
+    def _interpolation_matrix(self, element):
+        r"""
+        Returns the incidence matrix used by ``interpolate_data`` to combine
+        the values of ``element`` on this object.
+
+        Notes
+        -----
+        For throat values this has a row for each pore of the object and a
+        column for each throat, while for pore values it has a row for each
+        throat and a column for each pore of the *network*.  The matrices are
+        cached, and only rebuilt when the network's ``'throat.conns'`` are
+        written or the locations of the object change.
+
+        """
+        proj = self.project
+        net = proj.network
+        boss = proj.find_full_domain(self)
+        # conns are read far more often than written, so the write revision
+        # is used rather than the version
+        sig = (id(net), net.Np, net.Nt, net._revisions.get('throat.conns'))
+        if boss is not self:
+            sig += (id(boss), boss._versions.get('pore.'+self.name),
+                    boss._versions.get('throat.'+self.name))
+        hit = self._interpolation_maps.get(element, None)
+        if (hit is not None) and (hit[0] == sig):
+            return hit[1]
+        if boss is self:
+            Ps, Ts = net.Ps, net.Ts
+        else:
+            Ps, Ts = boss.pores(self.name), boss.throats(self.name)
+        conns = net['throat.conns'][Ts]
+        # Connect the throats of self to the pores of self at their ends
+        lookup = -sp.ones((net.Np, ), dtype=int)
+        lookup[Ps] = sp.arange(len(Ps))
+        rows = lookup[conns].flatten()
+        cols = sp.repeat(sp.arange(len(Ts)), 2)
+        keep = rows >= 0
+        maps = {'throat': sprs.csr_matrix((sp.ones((keep.sum(), )),
+                                           (rows[keep], cols[keep])),
+                                          shape=(len(Ps), len(Ts))),
+                'pore': sprs.csr_matrix((sp.ones((2*len(Ts), )),
+                                         conns.flatten(),
+                                         2*sp.arange(len(Ts)+1)),
+                                        shape=(len(Ts), net.Np))}
+        for key in maps.keys():
+            self._interpolation_maps[key] = (sig, maps[key])
+        return maps[element]
+
     def filter_by_label(self, pores=[], throats=[], labels=None, mode='or'):
         r"""
         Returns which of the supplied pores (or throats) has the specified
@@ -1550,6 +2237,84 @@ class Base(dict):
         temp = sp.size(super(Base, self).__getitem__(element+'.all'))
         return temp
 
+    @property
+    def nbytes(self):
+        r"""
+        The number of bytes used by all arrays stored on the object
+        """
+        return nbytes_of(list(dict.values(self)))
+
+    def _memory_rows(self, caches=True):
+        # Lists the arrays held by the object for memory_to_table.  Arrays
+        # are read from the dict directly so their versions are not bumped.
+        rows = []
+        seen = set()  # Arrays held in several places are only counted once
+        for key, vals in dict.items(self):
+            if '@' in key:
+                kind = 'transient'
+            elif getattr(vals, 'dtype', None) == bool:
+                kind = 'label'
+            else:
+                kind = 'prop'
+            if isinstance(vals, Bitset):
+                storage = 'packed'
+            elif isinstance(vals, sp.memmap):
+                storage = 'memmap'
+            elif getattr(vals, 'shared', False):
+                storage = 'shared'
+            else:
+                storage = 'memory'
+            rows.append({'object': self.name, 'key': key,
+                         'element': key.split('.')[0], 'type': kind,
+                         'dtype': str(getattr(vals, 'dtype', '---')),
+                         'storage': storage, 'bytes': nbytes_of(vals, seen)})
+        if caches:
+            items = list(vars(self).items())
+            # Memoized models keep the values of their recent runs
+            for prop, wrapper in getattr(self, '_models_dict', {}).items():
+                memo = wrapper.__dict__.get('_memo', [])
+                items.append(('memo.'+prop, [vals for p, i, vals in memo]))
+            for attr, item in items:
+                size = nbytes_of(item, seen)
+                if size > 0:
+                    rows.append({'object': self.name, 'key': attr,
+                                 'element': '---', 'type': 'cache',
+                                 'dtype': '---', 'storage': 'memory',
+                                 'bytes': size})
+        return rows
+
+    def memory_report(self, caches=False, astype='table'):
+        r"""
+        Reports the memory used by each array stored on the object
+
+        Parameters
+        ----------
+        caches : boolean
+            If ``True`` the cached arrays and matrices held as attributes of
+            the object, such as the adjacency matrices of a network, are
+            also included.  The default is ``False``.
+
+        astype : string
+            The format of the report, either 'table' (default), 'pandas' or
+            'dict'.  See ``openpnm.utils.misc.memory_to_table`` for details.
+
+        See Also
+        --------
+        nbytes
+
+        Examples
+        --------
+        >>> import openpnm as op
+        >>> pn = op.network.Cubic(shape=[5, 5, 5])
+        >>> report = pn.memory_report(astype='dict')
+        >>> report[pn.name]['pore.coords']
+        3000
+        >>> sum(report[pn.name].values()) == pn.nbytes
+        True
+
+        """
+        return memory_to_table(self, caches=caches, astype=astype)
+
     def show_hist(self,
                   props=['pore.diameter', 'throat.diameter', 'throat.length'],
                   bins=20, fontsize=22, **kwargs):
@@ -1,4 +1,10 @@
 import inspect
+import time
+import hashlib
+import tracemalloc
+import numpy as np
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from networkx import DiGraph, simple_cycles, draw_spectral
 from networkx.algorithms.dag import lexicographical_topological_sort
 from openpnm.utils import PrintableDict, logging, Workspace
@@ -6,6 +12,100 @@ ws = Workspace()
 logger = logging.getLogger(__name__)
 
 
+def _checksum(arr):
+    # Object arrays have no buffer of values, so can't be compared this way
+    if arr.dtype.hasobject:
+        return None
+    # A 128 bit digest, along with the shape and type, makes it vanishingly
+    # unlikely that changed values are mistaken for the old ones
+    arr = np.ascontiguousarray(arr)
+    digest = hashlib.blake2b(arr.view(np.uint8), digest_size=16).digest()
+    return (arr.shape, arr.dtype.str, digest)
+
+
+def _same_params(old, new):
+    # Arrays are compared by identity, and all else by value
+    if old.keys() != new.keys():
+        return False
+    for k, v in new.items():
+        if (old[k] is not v) and (isinstance(v, np.ndarray)
+                                  or type(old[k]) != type(v)
+                                  or old[k] != v):
+            return False
+    return True
+
+
+# Changes made to objects by models running on worker threads are queued
+# here, for the main thread to apply once the models are done
+_deferred = threading.local()
+
+
+def _defer(func, *args):
+    # Calls func now, unless on a worker thread of _regenerate
+    queue = getattr(_deferred, 'queue', None)
+    if queue is None:
+        return func(*args)
+    queue.append((func, args))
+
+
+def _run_on_worker(obj, item):
+    # Runs a model on a worker thread, returning its outcome along with the
+    # changes it made to the objects
+    _deferred.queue = []
+    try:
+        return obj._run_model(item), _deferred.queue
+    finally:
+        _deferred.queue = None
+
+
+def _regenerate(jobs, mode, workers):
+    # Runs the models on each object in jobs, given as (object, propnames)
+    if jobs and jobs[0][0]._lazy_models():
+        # Models are run when next read, which is done if they are stale
+        if mode == 'all':
+            for obj, propnames in jobs:
+                for item in propnames:
+                    obj._model_stamps.pop(item, None)
+        return
+    jobs = [(obj, obj._models_to_run(props, mode)) for obj, props in jobs]
+    checksums = (mode == 'incremental')
+    if workers <= 1:
+        for obj, propnames in jobs:
+            for item in propnames:
+                obj._regen(item, checksums=checksums)
+        return
+    # Models without inputs likely use random numbers, so are run first, in
+    # the same order as by a single worker
+    for obj, propnames in jobs:
+        for item in propnames:
+            if not obj._input_names(item):
+                obj._regen(item, checksums=checksums)
+    # Sort models into levels, so each only depends on models in earlier ones
+    levels = []
+    for obj, propnames in jobs:
+        dtree = obj.models._dependencies()[0]
+        depth = {}
+        for item in propnames:  # Already in order of dependency_list
+            if not obj._input_names(item):
+                continue
+            upstream = [depth[i] + 1 for i in dtree.predecessors(item)
+                        if i in depth.keys()]
+            depth[item] = max(upstream + [0])
+            if len(levels) <= depth[item]:
+                levels.append([])
+            levels[depth[item]].append((obj, item))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for level in levels:
+            outcomes = [pool.submit(_run_on_worker, obj, item)
+                        for obj, item in level]
+            # Apply all changes in a fixed order once all models are done
+            for (obj, item), outcome in zip(level, outcomes):
+                outcome, changes = outcome.result()
+                for func, args in changes:
+                    func(*args)
+                obj._store_model(item, outcome, checksums=checksums)
+
+
 class ModelsDict(PrintableDict):
     r"""
     This subclassed dictionary is assigned to the ``models`` attribute of
@@ -19,6 +119,87 @@ class ModelsDict(PrintableDict):
 
     """
 
+    def __init__(self, *args, **kwargs):
+        self._dependency_cache = None
+        self._dependency_hits = 0
+        self._dependency_misses = 0
+        super().__init__(*args, **kwargs)
+
+    def __setitem__(self, key, value):
+        self._dependency_cache = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._dependency_cache = None
+        super().__delitem__(key)
+
+    def pop(self, *args):
+        self._dependency_cache = None
+        return super().pop(*args)
+
+    def popitem(self, *args, **kwargs):
+        self._dependency_cache = None
+        return super().popitem(*args, **kwargs)
+
+    def clear(self):
+        self._dependency_cache = None
+        super().clear()
+
+    def update(self, *args, **kwargs):
+        self._dependency_cache = None
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        self._dependency_cache = None
+        return super().setdefault(key, default)
+
+    def _dependencies(self):
+        # Returns the cached (graph, order) tuple, rebuilding it if any model
+        # was added or removed, or any model's parameters were edited since
+        cache = getattr(self, '_dependency_cache', None)
+        if (cache is not None) and (cache[0] == ModelWrapper._edits):
+            self._dependency_hits = getattr(self, '_dependency_hits', 0) + 1
+            return cache[1], cache[2]
+        self._dependency_misses = getattr(self, '_dependency_misses', 0) + 1
+        edits = ModelWrapper._edits
+        dtree = DiGraph()
+        for propname in self.keys():
+            dtree.add_node(propname)
+            for dependency in self[propname].values():
+                if dependency in list(self.keys()):
+                    dtree.add_edge(dependency, propname)
+        cycles = list(simple_cycles(dtree))
+        if cycles:
+            order = None
+        else:
+            order = list(lexicographical_topological_sort(dtree, sorted))
+        self._dependency_cache = (edits, dtree, order)
+        return dtree, order
+
+    def dependency_cache_info(self):
+        r"""
+        Returns a dictionary describing the cached dependency graph, which is
+        shared by ``dependency_list`` and ``dependency_graph``.
+
+        Returns
+        -------
+        A dictionary containing the number of look-ups served from the cache
+        (``'hits'``), the number which required the graph to be rebuilt
+        (``'misses'``), and whether the cache is currently valid
+        (``'valid'``).
+
+        Notes
+        -----
+        The cache is discarded whenever a model is added or removed, or the
+        parameters of any model are changed.
+
+        """
+        cache = getattr(self, '_dependency_cache', None)
+        valid = (cache is not None) and (cache[0] == ModelWrapper._edits)
+        return {'hits': getattr(self, '_dependency_hits', 0),
+                'misses': getattr(self, '_dependency_misses', 0),
+                'valid': valid}
+
     def dependency_list(self):
         r'''
         Returns a list of dependencies in the order with which they should be
@@ -32,19 +213,22 @@ class ModelsDict(PrintableDict):
         models can be called that will work).  In this case it is possible
         to visually inspect the graph using ``dependency_graph``.
 
+        The order is cached, and only recomputed when a model is added or
+        removed, or the parameters of a model are changed (see
+        ``dependency_cache_info``).
+
         See Also
         --------
         dependency_graph
         dependency_map
 
         '''
-        dtree = self.dependency_graph()
-        cycles = list(simple_cycles(dtree))
-        if cycles:
+        dtree, order = self._dependencies()
+        if order is None:
+            cycles = list(simple_cycles(dtree))
             raise Exception('Cyclic dependency found: ' + ' -> '.join(
                             cycles[0] + [cycles[0][0]]))
-        d = lexicographical_topological_sort(dtree, sorted)
-        return list(d)
+        return list(order)
 
     def dependency_graph(self):
         r"""
@@ -64,14 +248,11 @@ class ModelsDict(PrintableDict):
                          node_size=2000, width=3.0, edge_color='lightgrey',
                          font_weight='bold')
 
+        The returned graph is a copy of the cached one, so may be edited
+        freely.
+
         """
-        dtree = DiGraph()
-        for propname in self.keys():
-            dtree.add_node(propname)
-            for dependency in self[propname].values():
-                if dependency in list(self.keys()):
-                    dtree.add_edge(dependency, propname)
-        return dtree
+        return self._dependencies()[0].copy()
 
     def dependency_map(self):
         r"""
@@ -117,6 +298,54 @@ class ModelWrapper(dict):
     This class is used to hold individual models and provide some extra
     functionality, such as pretty-printing.
     """
+    # Counts edits to the parameters of any model, which invalidates the
+    # cached dependency graphs held by each ModelsDict
+    _edits = 0
+
+    def __setitem__(self, key, value):
+        ModelWrapper._edits += 1
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        ModelWrapper._edits += 1
+        super().__delitem__(key)
+
+    def pop(self, *args):
+        ModelWrapper._edits += 1
+        return super().pop(*args)
+
+    def popitem(self):
+        ModelWrapper._edits += 1
+        return super().popitem()
+
+    def clear(self):
+        ModelWrapper._edits += 1
+        super().clear()
+
+    def update(self, *args, **kwargs):
+        ModelWrapper._edits += 1
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        ModelWrapper._edits += 1
+        return super().setdefault(key, default)
+
+    def _recall(self, params, inputs):
+        # Returns the stored result of a previous run with the same
+        # parameters and input checksums, or None if there is none
+        memo = self.__dict__.get('_memo', [])
+        for i, (p, sig, vals) in enumerate(memo):
+            if (sig == inputs) and _same_params(p, params):
+                memo.append(memo.pop(i))  # Most recently used go last
+                return vals
+        return None
+
+    def _memorize(self, params, inputs, vals, size):
+        # Stores a result, dropping the least recently used beyond size
+        memo = self.__dict__.setdefault('_memo', [])
+        memo.append((params, inputs, vals))
+        del memo[:max(len(memo) - size, 0)]
+
     @property
     def propname(self):
         for proj in ws.values():
@@ -165,6 +394,10 @@ class ModelsMixin():
     +----------------------+--------------------------------------------------+
     | ``regenerate_model`` | Runs the model(s) to recalculate data            |
     +----------------------+--------------------------------------------------+
+    | ``stale_models``     | Lists the models whose inputs have changed       |
+    +----------------------+--------------------------------------------------+
+    | ``profile_models``   | Reports the time and memory used by each model   |
+    +----------------------+--------------------------------------------------+
     | ``remove_model``     | Removes specified model as well as it's data     |
     +----------------------+--------------------------------------------------+
 
@@ -233,6 +466,28 @@ class ModelsMixin():
             *'deferred'* Is not run upon being assigned, but is run the first
             time that ``regenerate_models`` is called.
 
+            *'memoized'* : Like 'normal', but the results of the most recent
+            runs are stored along with a checksum of the properties named in
+            the model's parameters.  If the model is called again with the
+            same parameters and inputs the stored result is used instead of
+            running the model.  The number of results kept for each model
+            is given by ``settings['memo_size']`` if present, else 4.
+
+        Notes
+        -----
+        Memoized models are only safe to use when the model is a pure
+        function of its parameters and the properties they name.  Models
+        that read other data, or that use random numbers, will return stale
+        results.
+
+        If ``settings['lazy_models']`` is ``True`` on the project (or on the
+        Workspace) then models are not run when assigned.  Instead a model is
+        run when its values are read with ``__getitem__`` and are missing or
+        stale (see ``stale_models``), after first updating any of its inputs
+        that are made by models, and ``regenerate_models`` only marks models
+        to be run when next read.  Values fetched with ``get`` or found
+        through ``keys`` are not updated.
+
         """
         if propname in kwargs.values():  # Prevent infinite loops of look-ups
             raise Exception(propname+' can\'t be both dependency and propname')
@@ -253,10 +508,13 @@ class ModelsMixin():
                     kwargs.update({k: v})
         self.models[propname] = ModelWrapper(kwargs)  # Store all kwargs
         # Regenerate model values if necessary
-        if regen_mode not in ['deferred', 'explicit']:
+        if regen_mode in ['deferred', 'explicit']:
+            return
+        if not self._lazy_models():
             self._regen(propname)
 
-    def regenerate_models(self, propnames=None, exclude=[], deep=False):
+    def regenerate_models(self, propnames=None, exclude=[], deep=False,
+                          mode='all', workers=None):
         r"""
         Re-runs the specified model or models.
 
@@ -279,10 +537,84 @@ class ModelsMixin():
             The default is ``False``.  The method does not work in reverse,
             so regenerating models on a Physics will not update a Phase.
 
+        mode : string
+            Controls which of the requested models are actually run.
+            Options are:
+
+            *'all'* : (default) All requested models are run.
+
+            *'incremental'* : Only models that are stale are run, meaning
+            their data is missing, their parameters were changed, or any of
+            their input properties was written since they were last run (see
+            ``stale_models``).
+
+        workers : int
+            The number of threads used to run models.  If not given then the
+            value in ``settings['regen_workers']`` is used if present, else 1.
+            When greater than 1, models which don't depend on each other are
+            run at the same time, as are the models on each Physics of a Phase
+            or each Geometry of a Network when ``deep`` is ``True`` (see
+            Notes).
+
+        Notes
+        -----
+        In ``'incremental'`` mode the staleness of a model is determined
+        from the properties named in its parameters, which are looked up on
+        the Network and Geometries, and also on the Phase and Physics when
+        called on one of these.  Since upstream models are run first, and
+        writing their results changes their output, changes propagate through
+        the ``dependency_graph``, including from a Phase to its Physics when
+        ``deep`` is ``True``.  Models run in ``'incremental'`` mode keep a
+        checksum of their inputs, so that inputs which were only retrieved
+        from an object (which also gives them a new version) don't cause
+        models to re-run.
+
+        Models which read data that is not named in their parameters will not
+        be detected as stale, nor will models that produce different results
+        each time they are run (i.e. random seeds).
+
+        When several ``workers`` are used, models without any pore or throat
+        properties in their parameters, which are usually those drawing
+        random numbers, are first run one at a time in the same order as by a
+        single worker, so the results for a given random seed do not change.
+        The values made on worker threads are written, and any other changes
+        to the objects are made, by the calling thread.
+
         """
         # If empty list of propnames was given, do nothing and return
         if type(propnames) is list and len(propnames) == 0:
             return
+        propnames = self._parse_propnames(propnames, exclude=exclude)
+        self_models = self.models.dependency_list()
+        mode = self._parse_mode(mode, allowed=['all', 'incremental'],
+                                single=True)
+        # Look for default number of workers in settings if present, else 1
+        if workers is None:
+            if 'regen_workers' in self.settings.keys():
+                workers = self.settings['regen_workers']
+            else:
+                workers = 1
+
+        if deep:
+            other_models = None  # Will trigger regen of ALL models
+        else:
+            # Make list of given propnames that are not in self
+            other_models = list(set(propnames).difference(set(self_models)))
+        # Find associated objects, if any, which are regenerated after self
+        if self._isa('phase'):
+            others = self.project.find_physics(phase=self)
+        elif self._isa('network'):
+            others = list(self.project.geometries().values())
+        else:
+            others = []
+        _regenerate([(self, propnames)], mode=mode, workers=workers)
+        if type(other_models) is list and len(other_models) == 0:
+            return
+        jobs = [(obj, obj._parse_propnames(other_models, exclude=[]))
+                for obj in others]
+        _regenerate(jobs, mode=mode, workers=workers)
+
+    def _parse_propnames(self, propnames, exclude):
         if type(propnames) is str:  # Convert string to list if necessary
             propnames = [propnames]
         if propnames is None:  # If no props given, then regenerate them all
@@ -294,54 +626,314 @@ class ModelsMixin():
         # Re-order given propnames according to dependency tree
         self_models = self.models.dependency_list()
         propnames = [i for i in self_models if i in propnames]
-
-        if deep:
-            other_models = None  # Will trigger regen of ALL models
-        else:
-            # Make list of given propnames that are not in self
-            other_models = list(set(propnames).difference(set(self_models)))
-        # The following has some redundant lines, but is easier to understand
-        if self._isa('phase'):
-            # Start be regenerating models on self
-            for item in propnames:
-                self._regen(item)
-            # Then regen models on associated objects, if any in other_models
-            for phys in self.project.find_physics(phase=self):
-                phys.regenerate_models(propnames=other_models, deep=False)
-        elif self._isa('network'):  # Repeat for other object types
-            for item in propnames:
-                self._regen(item)
-            for geom in self.project.geometries().values():
-                geom.regenerate_models(propnames=other_models, deep=False)
-        else:
+        return propnames
+
+    def _models_to_run(self, propnames, mode):
+        if mode == 'incremental':
+            # Find all stale models first, since the inputs read by each
+            # model are handed out, which bumps their versions
+            stale = self.stale_models(propnames=propnames)
+            # Models which are current but were run in 'all' mode need a
+            # checksum of their inputs, which are not changed until now
             for item in propnames:
-                self._regen(item)
+                if (item not in stale) and (item in self._model_stamps):
+                    inputs = self._model_stamps[item][1].values()
+                    if any([v[1] is None for v in inputs]):
+                        self._stamp_model(item, checksums=True)
+            propnames = [i for i in propnames if i in stale]
+        return propnames
+
+    def stale_models(self, propnames=None):
+        r"""
+        Returns a list of the models whose data is out of date, and which
+        would be run by ``regenerate_models`` in ``'incremental'`` mode.
+
+        Parameters
+        ----------
+        propnames : string or list of strings
+            The models to check.  If not given then all models are checked.
+
+        Returns
+        -------
+        A list of property names, in the order the models would be run.
+
+        Notes
+        -----
+        A model is considered stale if its data is missing, it has not been
+        run since its parameters were changed, or any of the properties named
+        in its parameters has changed since it was last run.  Staleness is
+        then passed down the edges of the ``dependency_graph`` so that all
+        models which depend on a stale model are also stale.
+
+        Properties are counted as changed when their write version differs
+        from the one seen when the model was run, unless the model was last
+        run in ``'incremental'`` mode and the contents of the array are the
+        same.  This is needed since arrays are given a new version whenever
+        they are retrieved from an object, as they may be edited in-place.
 
-    def _regen(self, prop):
+        """
+        if propnames is None:
+            propnames = list(self.models.keys())
+        if type(propnames) is str:
+            propnames = [propnames]
+        dtree = self.models._dependencies()[0]
+        checksums = {}
+        stale = []
+        for item in self.models.dependency_list():
+            upstream = [i in stale for i in dtree.predecessors(item)]
+            if any(upstream) or self._model_is_stale(item, checksums):
+                stale.append(item)
+        return [i for i in stale if i in propnames]
+
+    def _model_is_stale(self, prop, checksums=None):
+        if checksums is None:
+            checksums = {}
+        if (prop not in self.keys()) and (prop not in self._namespace):
+            return True
+        if prop not in self._model_stamps.keys():
+            return True
+        params, inputs = self._model_stamps[prop]
+        if not _same_params(params, self.models[prop]):
+            return True
+        current = self._model_inputs(prop)
+        if current.keys() != inputs.keys():
+            return True
+        for (i, key), (obj, version) in current.items():
+            old_version, old_checksum = inputs[(i, key)]
+            if version == old_version:
+                continue
+            if old_checksum is None:
+                return True
+            if (i, key, version) not in checksums.keys():
+                checksums[(i, key, version)] = _checksum(dict.get(obj, key))
+            if checksums[(i, key, version)] != old_checksum:
+                return True
+            # Array was only handed out, so avoid checking it again
+            inputs[(i, key)] = (version, old_checksum)
+        return False
+
+    def _related_objects(self):
+        # The objects on which the inputs of models may be found
+        objs = [self]
+        net = self.project.network
+        if net is not None:
+            objs.extend([net] + net._subdomains())
+        if self._isa('phase') or self._isa('physics'):
+            try:
+                phase = self.project.find_phase(self)
+                objs.extend([phase] + phase._subdomains())
+            except Exception:
+                pass
+        return objs
+
+    def _input_names(self, prop):
+        # The properties named in the parameters of the given model
+        return [item for item in self.models[prop].values()
+                if isinstance(item, str) and ('.' in item)
+                and (item.split('.')[0] in ['pore', 'throat'])]
+
+    def _model_inputs(self, prop):
+        # Find the write version of all arrays used by the given model
+        objs = self._related_objects()
+        inputs = {}
+        for item in self._input_names(prop):
+            for obj in objs:
+                keys = [item] + list(obj._namespace.get(item, []))
+                for k in keys:
+                    if dict.__contains__(obj, k):
+                        inputs[(id(obj), k)] = (obj, obj._versions.get(k))
+        return inputs
+
+    def _stamp_model(self, prop, checksums=False):
+        inputs = self._model_inputs(prop)
+        for (i, key), (obj, version) in inputs.items():
+            if checksums:
+                inputs[(i, key)] = (version, _checksum(dict.get(obj, key)))
+            else:
+                inputs[(i, key)] = (version, None)
+        self._model_stamps[prop] = (dict(self.models[prop]), inputs)
+
+    def _update_model(self, prop):
+        r"""
+        Runs the model for ``prop`` if its values are missing or stale, after
+        first updating those of its inputs which are also made by models.
+        This is how models are run when ``settings['lazy_models']`` is set.
+        """
+        if prop in self._lazy_active:  # Model is reading its own output
+            return
+        self._lazy_active.add(prop)
+        try:
+            objs = self._related_objects()
+            for item in self._input_names(prop):
+                for obj in objs:
+                    if item in getattr(obj, '_models_dict', {}).keys():
+                        obj._update_model(item)
+            if self._model_is_stale(prop):
+                self._regen(prop, checksums=True)
+        finally:
+            self._lazy_active.discard(prop)
+
+    def _regen(self, prop, checksums=False):
+        self._store_model(prop, self._run_model(prop), checksums=checksums)
+
+    def _run_model(self, prop):
+        # Runs the model without writing its values, so this may be called
+        # from several threads at once.  The outcome is passed to
+        # _store_model as a tuple of (action, values), and any other changes
+        # are made through _defer.
+        profile = self.settings.get('profile_models', False)
+        if not profile:
+            return self._evaluate_model(prop)
+        memory = (profile == 'memory')
+        if memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            if hasattr(tracemalloc, 'reset_peak'):
+                tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        outcome = self._evaluate_model(prop)
+        elapsed = time.perf_counter() - start
+        if outcome[0] != 'write':  # Model was not actually run
+            return outcome
+        vals = outcome[1]
+        if isinstance(vals, dict):  # Models may return several arrays
+            vals = list(vals.values())
+        else:
+            vals = [vals]
+        size = sum([getattr(v, 'nbytes', 0) for v in vals])
+        allocated = None
+        if memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if hasattr(tracemalloc, 'reset_peak'):
+                allocated = peak - before
+            else:  # Only the memory still held is known
+                allocated = current - before
+        _defer(self._record_profile, prop, elapsed, size, allocated)
+        return outcome
+
+    def _record_profile(self, prop, elapsed, size, allocated):
+        stats = self._model_profile.setdefault(
+            prop, {'calls': 0, 'time': 0.0, 'last': 0.0, 'size': 0,
+                   'allocated': None})
+        stats['calls'] += 1
+        stats['time'] += elapsed
+        stats['last'] = elapsed
+        stats['size'] = size
+        if allocated is not None:
+            stats['allocated'] = allocated
+
+    def _evaluate_model(self, prop):
         # Create a temporary dict of all model arguments
         try:
             kwargs = self.models[prop].copy()
         except KeyError:
             logger.info(prop+' not found, will retry if deep is True')
-            return
+            return ('skip', None)
         # Pop model and regen_mode from temporary dict
         model = kwargs.pop('model')
         regen_mode = kwargs.pop('regen_mode', None)
         # Only regenerate model if regen_mode is correct
         if self.settings['freeze_models']:
             # Don't run ANY models if freeze_models is set to True
-            pass
+            return ('skip', None)
         elif regen_mode == 'constant':
             # Only regenerate if data not already in dictionary
-            if prop not in self.keys():
-                self[prop] = model(target=self, **kwargs)
+            if prop in self.keys():
+                return ('keep', None)
+            return ('write', model(target=self, **kwargs))
+        elif regen_mode == 'memoized':
+            try:
+                return ('write', self._run_memoized(prop))
+            except KeyError as e:
+                return ('fail', e)
         else:
             try:
-                self[prop] = model(target=self, **kwargs)
+                return ('write', model(target=self, **kwargs))
             except KeyError as e:
-                logger.error(prop + ' was not run since the following '
-                             + 'property is missing: ' + e.__str__())
-                self.models[prop]['regen_mode'] = 'deferred'
+                return ('fail', e)
+
+    def _run_memoized(self, prop):
+        wrapper = self.models[prop]
+        params = dict(wrapper)
+        inputs = {}
+        for (i, key), (obj, version) in self._model_inputs(prop).items():
+            inputs[(i, key)] = _checksum(dict.get(obj, key))
+        # Arrays without a checksum can't be recognized, so always run
+        memoize = None not in inputs.values()
+        vals = wrapper._recall(params, inputs) if memoize else None
+        if vals is None:
+            kwargs = params.copy()
+            model = kwargs.pop('model')
+            kwargs.pop('regen_mode', None)
+            vals = model(target=self, **kwargs)
+            if not memoize:
+                return vals
+            # Keep a copy, since the written values may be edited in-place
+            if isinstance(vals, np.ndarray):
+                vals = vals.copy()
+            if 'memo_size' in self.settings.keys():
+                size = self.settings['memo_size']
+            else:
+                size = 4
+            _defer(wrapper._memorize, params, inputs, vals, size)
+        if isinstance(vals, np.ndarray):
+            vals = vals.copy()
+        return vals
+
+    def _store_model(self, prop, outcome, checksums=False):
+        action, vals = outcome
+        if action == 'write':
+            self[prop] = vals
+        if action in ['write', 'keep']:
+            self._stamp_model(prop, checksums=checksums)
+        elif action == 'fail':
+            logger.error(prop + ' was not run since the following '
+                         + 'property is missing: ' + vals.__str__())
+            self.models[prop]['regen_mode'] = 'deferred'
+
+    def profile_models(self, reset=False):
+        r"""
+        Returns the timing and memory use of each model, as recorded while
+        ``settings['profile_models']`` is enabled.
+
+        Parameters
+        ----------
+        reset : boolean
+            If ``True`` the recorded values are cleared after being returned.
+            The default is ``False``.
+
+        Returns
+        -------
+        A dictionary keyed by property name, with each value being a
+        dictionary containing the number of times the model was run
+        (``'calls'``), the total and most recent run times in seconds
+        (``'time'`` and ``'last'``), the size in bytes of the values it
+        returned (``'size'``), and the bytes allocated during its most recent
+        run (``'allocated'``).
+
+        Notes
+        -----
+        Profiling is enabled by setting ``settings['profile_models']`` to
+        ``True``, in which case times, calls and sizes are recorded, or to
+        ``'memory'`` which also records allocations using ``tracemalloc``.
+        Tracing allocations slows down all code, and is started if it is not
+        already running, so should be stopped by calling
+        ``tracemalloc.stop()`` once done.  Allocations are the peak during
+        the model run on Python 3.9 and newer, otherwise only the memory
+        still held when the model returns.  They are not reliable when
+        models are run on several ``workers``.
+
+        See Also
+        --------
+        openpnm.utils.misc.profile_to_table
+
+        """
+        stats = getattr(self, '_model_profile', {})
+        profile = {k: v.copy() for k, v in stats.items()}
+        if reset:
+            stats.clear()
+        return profile
 
     def remove_model(self, propname=None, mode=['model', 'data']):
         r"""
@@ -376,6 +968,12 @@ class ModelsMixin():
     def _get_models(self):
         if not hasattr(self, '_models_dict'):
             self._models_dict = ModelsDict()
+        if not hasattr(self, '_model_stamps'):
+            self._model_stamps = {}
+        if not hasattr(self, '_model_profile'):
+            self._model_profile = {}
+        if not hasattr(self, '_lazy_active'):
+            self._lazy_active = set()
         return self._models_dict
 
     def _set_models(self, dict_):
@@ -32,12 +32,24 @@ class Subdomain(Base):
 
     def __getitem__(self, key):
         element = key.split('.')[0]
-        # Find boss object (either phase or network)
-        boss = self.project.find_full_domain(self)
+        self._refresh_lazy(key)
         # Try to get vals directly first
         vals = self.get(key)
+        if vals is not None:  # Values may now be edited in-place
+            vals = self._unpack(key, vals)
+            self._bump_version(key)
+            return vals
+        # Find boss object (either phase or network)
+        boss = self.project.find_full_domain(self)
+        inds = boss._get_indices(element=element, labels=self.name)
+        # Run any lazy models making the key on the boss or its subdomains
+        boss._refresh_lazy(key)
+        # Gather only the values at these locations, from the boss if present
+        if key in boss.keys():
+            return boss.get(key)[inds]
+        # or from the sibling subdomains which hold the key
+        vals = boss._gather_from_subdomains(key=key, locations=inds)
         if vals is None:  # Otherwise invoke search
-            inds = boss._get_indices(element=element, labels=self.name)
             try:  # Will invoke interleave data if necessary
                 vals = boss[key]  # Will return nested dict if present
                 if type(vals) is dict:  # Index into each array in nested dict
@@ -49,18 +61,30 @@ class Subdomain(Base):
                 vals = super().__getitem__(key)
         return vals
 
+    def notify(self, key):
+        super().notify(key)
+        # The interleaved values on the boss have changed as well
+        proj = self.project
+        if proj is None:
+            return
+        try:
+            boss = proj.find_full_domain(self)
+        except Exception:  # Not yet assigned to a phase
+            return
+        if boss not in [None, self]:
+            boss.notify(key)
+
+    notify.__doc__ = Base.notify.__doc__
+
     def __setitem__(self, key, value):
         # If value is a dict, skip all this.  The super class will parse
         # the dict individually, at which point the below is called.
         if self.project and not hasattr(value, 'keys'):
-            proj = self.project
-            boss = proj.find_full_domain(self)
-            keys = boss.keys(mode='all', deep=True)
+            boss = self.project.find_full_domain(self)
             # Prevent 'pore.foo' on subdomain when already present on boss
-            if key in set(boss.keys()).difference(set(self.keys())):
-                hit = [i for i in keys if i.startswith(key)][0]
-                raise Exception('Cannot create ' + key + ' when ' +
-                                hit + ' is already defined')
+            if (key in boss) and (key not in self):
+                raise Exception('Cannot create ' + key + ' when it is' +
+                                ' already defined on ' + boss.name)
         super().__setitem__(key, value)
 
     def _add_locations(self, pores=[], throats=[]):
@@ -0,0 +1,135 @@
+from openpnm.utils import Workspace, logging
+ws = Workspace()
+logger = logging.getLogger(__name__)
+
+
+class ViewMixin():
+    r"""
+    This class is meant to be combined with a Network or Phase class in
+    multiple inheritence, to make an object which reads its data from a subset
+    of the pores and throats of a *parent* object in another project, rather
+    than holding a copy of it.  It is used by the objects returned by
+    ``GenericNetwork.view``.
+
+    Notes
+    -----
+    Any key which is not stored on the view is looked for on the parent, or
+    the parent's subdomains, and the values at the view's locations are
+    gathered from it each time the key is read.  This means that changes to
+    the parent are seen by the view, but arrays read from the view are
+    copies, so editing them in-place does not change the parent.  Values
+    written to the view are stored on the view, and take the place of the
+    parent's values.
+
+    Data derived from gathered values, such as the cached coefficient
+    matrices of algorithms, are notified when the parent's values are
+    written, as described in ``notify``.
+
+    The following table gives a brief overview of the attributes added to
+    the object by this mixin.
+
+    +----------------------+--------------------------------------------------+
+    | Method or Attribute  | Functionality                                    |
+    +======================+==================================================+
+    | ``parent``           | The object from which data is gathered           |
+    +----------------------+--------------------------------------------------+
+    | ``pore_map``         | The parent's index of each pore and throat in    |
+    | ``throat_map``       | the view                                         |
+    +----------------------+--------------------------------------------------+
+
+    """
+
+    def _set_parent(self, parent, pores, throats):
+        # The parent is found by name, so views can be copied and saved
+        self._parent_name = (parent.project.name, parent.name)
+        self._maps = {'pore': pores, 'throat': throats}
+        # The parent's revision of each key when it was last gathered
+        self._gathered = {}
+
+    def _get_parent(self):
+        proj, name = self._parent_name
+        try:
+            return ws[proj][name]
+        except KeyError:
+            raise Exception('The parent of ' + self.name + ' (' + name
+                            + ' in ' + proj + ') no longer exists')
+
+    parent = property(fget=_get_parent)
+
+    @property
+    def pore_map(self):
+        return self._maps['pore']
+
+    @property
+    def throat_map(self):
+        return self._maps['throat']
+
+    def __getitem__(self, key):
+        # Keys found only on the parent are gathered from it
+        if (not dict.__contains__(self, key)) and self._on_parent(key):
+            self._refresh_lazy(key)
+            return self._gather(key)
+        return super().__getitem__(key)
+
+    def keys(self, element=None, mode=None, deep=False):
+        r"""
+        Works as ``Base.keys``, but when a ``mode`` is given the keys which
+        can be gathered from the parent are included as well.  Without a
+        ``mode`` only the keys stored on the view are returned.
+        """
+        keys = super().keys(element=element, mode=mode, deep=deep)
+        if mode is None:
+            return keys
+        parent = self.parent.keys(element=element, mode=mode, deep=True)
+        models = getattr(self, '_models_dict', {})
+        keys += [k for k in parent if (k not in keys) and (k not in models)]
+        return keys
+
+    def interleave_data(self, prop):
+        if (not dict.__contains__(self, prop)) and self._on_parent(prop):
+            return self._gather(prop)
+        return super().interleave_data(prop)
+
+    def _on_parent(self, key):
+        r"""
+        Returns ``True`` if ``key`` can be gathered from the parent, because
+        it is on the parent or one of its subdomains and the view has no model
+        of its own to compute it.
+        """
+        if key in getattr(self, '_models_dict', {}).keys():
+            return False
+        parent = self.parent
+        lazy = parent._lazy_models()
+        for obj in [parent] + parent._subdomains():
+            if dict.__contains__(obj, key):
+                return True
+            if lazy and (key in getattr(obj, '_models_dict', {}).keys()):
+                return True
+        return False
+
+    def _gather(self, key):
+        r"""
+        Returns the values of ``key`` on the parent at the view's locations
+        """
+        parent = self.parent
+        parent._refresh_lazy(key)
+        locations = self._maps[key.split('.')[0]]
+        # Only the view's locations are read, rather than the full array
+        if dict.__contains__(parent, key):
+            vals = parent._unpack(key, dict.__getitem__(parent, key))
+            vals = vals[locations]
+        else:
+            vals = parent._gather_from_subdomains(key, locations)
+            if vals is None:
+                vals = parent[key][locations]
+        self._gathered[key] = parent._revisions.get(key, None)
+        return vals
+
+    def _refresh_lazy(self, key):
+        super()._refresh_lazy(key)
+        # Announce any writes to the parent since the key was last gathered,
+        # so data derived from it on the view can be discarded
+        if key in self._gathered.keys():
+            if self.parent._revisions.get(key, None) != self._gathered[key]:
+                del self._gathered[key]
+                self.notify(key)
@@ -99,9 +99,19 @@ models and their associated parameters.  When ``regenerate_models`` is called
 the function and all the given parameters are retrieved from this dictionary
 and run.
 
+----
+
+**The ViewMixin Class**
+
+The ``ViewMixin`` is combined with Network and Phase classes to make *views*,
+which read their data from a subset of the pores and throats of a parent
+object instead of holding a copy of it.  Views are created by
+``GenericNetwork.view``.
+
 
 """
 
 from .ModelsMixin import ModelsMixin, ModelsDict
 from .Base import Base
 from .Subdomain import Subdomain
+from .ViewMixin import ViewMixin
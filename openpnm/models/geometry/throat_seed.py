@@ -14,4 +14,4 @@ def from_neighbor_pores(target, pore_prop='pore.seed', mode='min'):
                                      mode=mode)
 
 
-random.__doc__ = _misc.from_neighbor_pores.__doc__
+from_neighbor_pores.__doc__ = _misc.from_neighbor_pores.__doc__
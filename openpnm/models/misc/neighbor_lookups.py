@@ -6,6 +6,8 @@ r"""
 """
 
 import numpy as np
+import scipy.sparse as sprs
+from openpnm import topotools
 from openpnm.utils import logging
 logger = logging.getLogger(__name__)
 
@@ -37,6 +39,11 @@ def from_neighbor_throats(target, prop=None, throat_prop='pore.seed',
     value : ND-array
         Array containing customized values based on those of adjacent throats.
 
+    Notes
+    -----
+    Pores with no throats, or whose throats all have ``nan`` values when
+    ``ignore_nans`` is ``True``, are given ``nan``.
+
     """
     prj = target.project
     network = prj.network
@@ -45,22 +52,13 @@ def from_neighbor_throats(target, prop=None, throat_prop='pore.seed',
     if prop is not None:
         throat_prop = prop
     data = lookup[throat_prop]
-    if ignore_nans:
-        data = np.ma.MaskedArray(data=data, mask=np.isnan(data))
-    neighborTs = network.find_neighbor_throats(pores=Ps,
-                                               flatten=False,
-                                               mode='or')
-    values = np.ones((np.shape(Ps)[0],))*np.nan
-    if mode == 'min':
-        for pore in range(len(Ps)):
-            values[pore] = np.amin(data[neighborTs[pore]])
-    if mode == 'max':
-        for pore in range(len(Ps)):
-            values[pore] = np.amax(data[neighborTs[pore]])
-    if mode == 'mean':
-        for pore in range(len(Ps)):
-            values[pore] = np.mean(data[neighborTs[pore]])
-    return np.array(values)
+    # Reduce the values in each pore's row of the incidence matrix
+    im = network.get_incidence_matrix(fmt='csr')
+    if len(Ps) < network.Np:
+        im = im[Ps]
+    values = topotools.reduce_neighbor_values(im, values=data, mode=mode,
+                                              ignore_nans=ignore_nans)
+    return values
 
 
 def from_neighbor_pores(target, prop=None, pore_prop='pore.seed', mode='min',
@@ -90,6 +88,11 @@ def from_neighbor_pores(target, prop=None, pore_prop='pore.seed', mode='min',
     value : ND-array
         Array containing customized values based on those of adjacent pores.
 
+    Notes
+    -----
+    Throats whose pores both have ``nan`` values are given ``nan``, even when
+    ``ignore_nans`` is ``True``.
+
     """
     prj = target.project
     network = prj.network
@@ -98,13 +101,11 @@ def from_neighbor_pores(target, prop=None, pore_prop='pore.seed', mode='min',
     lookup = prj.find_full_domain(target)
     if prop is not None:
         pore_prop = prop
-    pvalues = lookup[pore_prop][P12]
-    if ignore_nans:
-        pvalues = np.ma.MaskedArray(data=pvalues, mask=np.isnan(pvalues))
-    if mode == 'min':
-        value = np.amin(pvalues, axis=1)
-    if mode == 'max':
-        value = np.amax(pvalues, axis=1)
-    if mode == 'mean':
-        value = np.mean(pvalues, axis=1)
-    return np.array(value)
+    # Each throat's row holds the two pores it connects
+    im = sprs.csr_matrix((np.ones((P12.size, )), P12.flatten(),
+                          2*np.arange(len(throats)+1)),
+                         shape=(len(throats), network.Np))
+    value = topotools.reduce_neighbor_values(im, values=lookup[pore_prop],
+                                             mode=mode,
+                                             ignore_nans=ignore_nans)
+    return value
@@ -69,6 +69,9 @@ class GenericNetwork(Base, ModelsMixin):
     | ``check_network_health``    | Check the topology for any problems such  |
     |                             | as isolated pores                         |
     +-----------------------------+-------------------------------------------+
+    | ``view``                    | Create a subnetwork of some pores which   |
+    |                             | reads its data from this network          |
+    +-----------------------------+-------------------------------------------+
 
     Examples
     --------
@@ -117,6 +120,9 @@ class GenericNetwork(Base, ModelsMixin):
         self.settings.setdefault('prefix', 'net')
         self.settings.update(settings)
         super().__init__(project=project, **kwargs)
+        # Discard the stored matrices whenever the topology is changed
+        self.subscribe(self._clear_topology_cache,
+                       keys=['throat.conns', 'pore.all', 'throat.all'])
         if coords is not None:
             Np = sp.shape(coords)[0]
             self['pore.all'] = sp.ones(Np, dtype=bool)
@@ -155,6 +161,12 @@ class GenericNetwork(Base, ModelsMixin):
         vals = super().__getitem__(key)
         return vals
 
+    def _clear_topology_cache(self, obj, key):
+        if hasattr(self, '_am'):
+            self._am.clear()
+        if hasattr(self, '_im'):
+            self._im.clear()
+
     def _gen_ids(self):
         IDs = self.get('pore._id', sp.array([], ndmin=1, dtype=sp.int64))
         if len(IDs) < self.Np:
@@ -254,6 +266,75 @@ class GenericNetwork(Base, ModelsMixin):
 
     am = property(fget=get_adjacency_matrix)
 
+    def view(self, pores, throats=None):
+        r"""
+        Returns a subnetwork of the given pores, which reads its data from
+        this network rather than holding a trimmed copy of it.
+
+        Parameters
+        ----------
+        pores : array_like
+            The pores to include in the subnetwork.  These are numbered in
+            ascending order of their indices on this network.
+
+        throats : array_like, optional
+            The throats to include, which must only connect the given pores.
+            If not given then all throats between the given pores are
+            included.
+
+        Returns
+        -------
+        A ``NetworkView`` object in a new project, which also contains a
+        ``PhaseView`` of each Phase in this network's project, with the same
+        names as the originals.
+
+        Notes
+        -----
+        Views only store their renumbered ``'throat.conns'`` and the indices
+        of their pores and throats on this network, which are given by the
+        ``pore_map`` and ``throat_map`` attributes.  All other data, including
+        that of Geometry and Physics objects, is gathered from this network
+        and its phases when it is read, so subsequent changes are seen by the
+        view.  Values written to the view are stored on the view only.
+
+        Algorithms can be run on the view and its phases in the usual way,
+        without affecting this network's project.
+
+        Examples
+        --------
+        >>> import openpnm as op
+        >>> pn = op.network.Cubic(shape=[5, 5, 5])
+        >>> geo = op.geometry.StickAndBall(network=pn, pores=pn.Ps,
+        ...                                throats=pn.Ts)
+        >>> sub = pn.view(pores=pn.pores('left'))
+        >>> print(sub.Np, sub.Nt)
+        25 40
+        >>> sub.find_neighbor_pores(pores=0)
+        array([1, 5])
+        >>> d = pn['pore.diameter'][sub.pore_map]
+        >>> bool((sub['pore.diameter'] == d).all())
+        True
+
+        """
+        from openpnm.network import NetworkView
+        from openpnm.phases import PhaseView
+        pores = sp.unique(self._parse_indices(pores))
+        if throats is None:
+            mask = self.tomask(pores=pores)
+            conns = self['throat.conns']
+            throats = sp.where(mask[conns[:, 0]] * mask[conns[:, 1]])[0]
+        else:
+            throats = sp.unique(self._parse_indices(throats))
+        proj = ws.new_project()
+        for key in ['precision', 'lazy_models']:
+            if self.project.settings.get(key, None) is not None:
+                proj.settings[key] = self.project.settings[key]
+        net = NetworkView(parent=self, pores=pores, throats=throats,
+                          project=proj)
+        for phase in self.project.phases().values():
+            PhaseView(parent=phase, network=net)
+        return net
+
     def create_adjacency_matrix(self, weights=None, fmt='coo', triu=False,
                                 drop_zeros=False):
         r"""
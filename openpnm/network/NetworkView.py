@@ -0,0 +1,54 @@
+import scipy as sp
+from openpnm.core import ViewMixin
+from openpnm.network import GenericNetwork
+from openpnm.utils import logging
+logger = logging.getLogger(__name__)
+
+
+class NetworkView(ViewMixin, GenericNetwork):
+    r"""
+    A subnetwork which reads its data from a subset of the pores and throats
+    of a parent network, rather than holding a trimmed copy of it.  These are
+    created using ``GenericNetwork.view``.
+
+    Parameters
+    ----------
+    parent : OpenPNM Network object
+        The network from which data is read
+
+    pores : array_like
+        The parent's indices of the pores in the view, in ascending order
+
+    throats : array_like
+        The parent's indices of the throats in the view, which must only
+        connect the given pores
+
+    project : OpenPNM Project object
+        The project to which the view is added, which must not be the
+        parent's project
+
+    Notes
+    -----
+    Only the renumbered ``'throat.conns'``, the ``'all'`` labels and the
+    ``'_id'`` of each pore and throat are stored on the view.  All other data
+    is gathered from the parent when it is read, as described in
+    ``ViewMixin``.
+
+    """
+
+    def __init__(self, parent, pores, throats, project=None, settings={},
+                 **kwargs):
+        self._set_parent(parent, pores=pores, throats=throats)
+        # Renumber the conns of the included throats
+        lookup = -sp.ones((parent.Np, ), dtype=int)
+        lookup[pores] = sp.arange(len(pores))
+        conns = lookup[parent['throat.conns'][throats]]
+        if sp.any(conns < 0):
+            raise Exception('The given throats connect pores not in the view')
+        kwargs.setdefault('name', parent.name)
+        super().__init__(conns=conns, project=project, settings=settings,
+                         **kwargs)
+        self['pore.all'] = sp.ones((len(pores), ), dtype=bool)
+        # Keep the parent's ids so locations can be mapped between them
+        self['pore._id'] = parent['pore._id'][pores]
+        self['throat._id'] = parent['throat._id'][throats]
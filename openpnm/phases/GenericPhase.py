@@ -86,15 +86,20 @@ class GenericPhase(Base, ModelsMixin):
             return net[element+'._id']
         if prop == self.name:
             return self[element+'.all']
+        keys = self.keys()
+        if (key not in keys) and self._lazy_models():
+            # Models which have not been run yet count as present
+            keys = list(keys) + list(self.models.keys())
         # An attempt at automatic interpolation if key not found
-        if key not in self.keys():
+        if key not in keys:
             not_el = list(set(['pore', 'throat']).difference(set([element])))[0]
-            if (not_el + '.' + prop) in self.keys():
+            source = not_el + '.' + prop
+            if source in keys:
                 mod = {'pore': mods.misc.from_neighbor_throats,
                        'throat': mods.misc.from_neighbor_pores}
                 self.add_model(propname=key,
                                model=mod[element],
-                               prop=not_el + '.' + prop,
+                               prop=source,
                                mode='mean')
         vals = super().__getitem__(key)
         return vals
@@ -0,0 +1,41 @@
+from openpnm.core import ViewMixin
+from openpnm.phases import GenericPhase
+from openpnm.utils import logging
+logger = logging.getLogger(__name__)
+
+
+class PhaseView(ViewMixin, GenericPhase):
+    r"""
+    A phase which reads its data from the pores and throats of a parent phase
+    that are included in a ``NetworkView``.  A view of each phase is created
+    along with the network view by ``GenericNetwork.view``.
+
+    Parameters
+    ----------
+    parent : OpenPNM Phase object
+        The phase from which data is read
+
+    network : NetworkView object
+        The view of the parent phase's network, whose project this phase is
+        added to
+
+    Notes
+    -----
+    The data of the parent phase, including that of its physics, is gathered
+    when it is read, as described in ``ViewMixin``, so a view has no physics
+    of its own.  Unlike other phases the temperature and pressure are not
+    set to standard conditions when the view is created, since they are read
+    from the parent as well.
+
+    """
+
+    def __init__(self, parent, network, settings={}, **kwargs):
+        self._set_parent(parent, pores=network.pore_map,
+                         throats=network.throat_map)
+        self.settings.update({'prefix': 'phase'})
+        self.settings.update(settings)
+        kwargs.setdefault('name', parent.name)
+        # Skip the standard conditions set by GenericPhase
+        super(GenericPhase, self).__init__(project=network.project,
+                                           Np=network.Np, Nt=network.Nt,
+                                           **kwargs)
@@ -81,3 +81,4 @@ from .Air import Air
 from .Water import Water
 from .Mercury import Mercury
 from .MultiPhase import MultiPhase
+from .PhaseView import PhaseView
@@ -41,6 +41,7 @@ from .topotools import plot_coordinates
 from .topotools import plot_networkx
 from .topotools import plot_vpython
 from .topotools import reduce_coordination
+from .topotools import reduce_neighbor_values
 from .topotools import reflect_base_points
 from .topotools import remove_isolated_clusters
 from .topotools import rotate_coords
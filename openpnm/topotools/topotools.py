@@ -1,3 +1,4 @@
+import numpy as np
 import scipy as sp
 import scipy.ndimage as spim
 import scipy.sparse as sprs
@@ -363,6 +364,103 @@ def find_connecting_bonds(sites, am):
     return neighbors
 
 
+def reduce_neighbor_values(im, values, mode='mean', weights=None,
+                           ignore_nans=False):
+    r"""
+    Combines the values of the neighbors of each site (or bond) into a single
+    value, such as the mean of the values of the bonds connected to each site.
+
+    Parameters
+    ----------
+    im : scipy.sparse matrix
+        An incidence matrix, or any other matrix with a row for each result
+        and a column for each value, with non-zero entries indicating which
+        values are combined into each result.  The values of the entries are
+        not used.
+
+    values : array_like
+        The 1D array of values to be combined, with one for each column of
+        ``im``.
+
+    mode : string
+        How the values are combined.  Options are:
+
+        **'mean'** : (default) The average of the values, which is weighted
+        if ``weights`` are given
+
+        **'sum'** : The sum of the values
+
+        **'min'** : The smallest of the values
+
+        **'max'** : The largest of the values
+
+    weights : array_like, optional
+        The weight of each value, which is only used when ``mode`` is 'mean'.
+
+    ignore_nans : boolean
+        If ``True`` then ``nan`` values are left out, otherwise (default) the
+        result is ``nan`` if any of the values are.
+
+    Returns
+    -------
+    An array with one value for each row of ``im``.  Rows with no values
+    give ``nan``, except in 'sum' mode where they give 0.
+
+    Notes
+    -----
+    This is done with sparse matrix products and ``reduceat``, without
+    looping over the sites or bonds.  It is fastest when ``im`` is in CSR
+    format with all non-zero values equal to 1, since otherwise a copy of
+    the matrix is made in this form.
+
+    Examples
+    --------
+    >>> import openpnm as op
+    >>> pn = op.network.Cubic(shape=[3, 1, 1])
+    >>> im = pn.get_incidence_matrix(fmt='csr')
+    >>> op.topotools.reduce_neighbor_values(im, values=[1.0, 2.0])
+    array([1. , 1.5, 2. ])
+
+    """
+    im = im.tocsr()
+    values = sp.array(values, dtype=float, ndmin=1)  # Drops any units
+    if not sp.all(im.data == 1):  # Only the positions of the entries count
+        im = sprs.csr_matrix((sp.ones((im.nnz, )), im.indices, im.indptr),
+                             shape=im.shape)
+    if mode in ['mean', 'sum']:
+        if (weights is None) or (mode == 'sum'):
+            w = sp.ones_like(values)
+        else:
+            w = sp.array(weights, dtype=float, ndmin=1)
+        if ignore_nans:
+            nans = sp.isnan(values)
+            values = sp.where(nans, 0.0, values)
+            w = sp.where(nans, 0.0, w)
+        total = im @ (w*values)
+        if mode == 'sum':
+            return total
+        if (weights is None) and not ignore_nans:
+            norm = sp.diff(im.indptr)
+        else:
+            norm = im @ w
+        with sp.errstate(divide='ignore', invalid='ignore'):
+            result = total/norm
+        result[norm == 0] = sp.nan
+        return result
+    if mode == 'min':
+        func = np.fmin if ignore_nans else np.minimum
+    elif mode == 'max':
+        func = np.fmax if ignore_nans else np.maximum
+    else:
+        raise Exception('Unrecognized mode: ' + str(mode))
+    result = sp.ones((im.shape[0], ))*sp.nan
+    # Consecutive non-empty rows delimit each other's entries
+    rows = sp.where(sp.diff(im.indptr) > 0)[0]
+    if rows.size:
+        result[rows] = func.reduceat(values[im.indices], im.indptr[rows])
+    return result
+
+
 def find_complement(am, sites=None, bonds=None, asmask=False):
     r"""
     Finds the complementary sites (or bonds) to a given set of inputs
@@ -1127,14 +1225,10 @@ def extend(network, pore_coords=[], throat_conns=[], labels=[]):
             label = label.split('.')[-1]
             if sp.size(pore_coords) > 0:
                 Ps = sp.r_[Np_old:Np]
-                if 'pore.'+label not in network.labels():
-                    network['pore.'+label] = False
-                network['pore.'+label][Ps] = True
+                network.set_label(label='pore.'+label, pores=Ps)
             if sp.size(throat_conns) > 0:
                 Ts = sp.r_[Nt_old:Nt]
-                if 'throat.'+label not in network.labels():
-                    network['throat.'+label] = False
-                network['throat.'+label][Ts] = True
+                network.set_label(label='throat.'+label, throats=Ts)
 
     # Clear adjacency and incidence matrices which will be out of date now
     network._am.clear()
@@ -1153,8 +1247,7 @@ def reduce_coordination(network, z):
     # Label throats on spanning tree to avoid deleting them
     Ts = network.find_connecting_throat(mst.row, mst.col)
     Ts = sp.hstack(Ts)
-    network['throat.mst'] = False
-    network['throat.mst'][Ts] = True
+    network.set_label(label='throat.mst', throats=Ts, mode='overwrite')
 
     # Trim throats not on the spanning tree to acheive desired coordination
     Ts = sp.random.permutation(network.throats('mst', mode='nor'))
@@ -1302,9 +1395,7 @@ def find_surface_pores(network, markers=None, label='surface'):
         neighbors = indptr[indices[k]:indices[k+1]]
         inds = sp.where(neighbors < network.Np)
         neighbors = neighbors[inds]
-        if 'pore.'+label not in network.keys():
-            network['pore.'+label] = False
-        network['pore.'+label][neighbors] = True
+        network.set_label(label='pore.'+label, pores=neighbors)
 
 
 def dimensionality(network):
@@ -2881,10 +2972,8 @@ def add_boundary_pores(network, pores, offset=None, move_to=None,
     label = apply_label.split('.')[-1]
     plabel = 'pore.' + label
     tlabel = 'throat.' + label
-    network[plabel] = False
-    network[plabel][newPs] = True
-    network[tlabel] = False
-    network[tlabel][newTs] = True
+    network.set_label(label=plabel, pores=newPs, mode='overwrite')
+    network.set_label(label=tlabel, throats=newTs, mode='overwrite')
 
 
 def find_path(network, pore_pairs, weights=None):
@@ -0,0 +1,212 @@
+import numpy as np
+
+# Number of set bits in each possible byte
+_popcount = np.array([bin(i).count('1') for i in range(256)], dtype=np.int64)
+
+
+class Bitset():
+    r"""
+    A 1D boolean array stored as packed bits, using 1 bit per element
+    rather than the 1 byte used by a numpy boolean array.
+
+    Parameters
+    ----------
+    mask : array_like
+        The boolean values to store.
+
+    size : int
+        If no ``mask`` is given, an array of this many False values is made.
+
+    Notes
+    -----
+    The bits are stored in the ``words`` attribute in the order used by
+    ``numpy.packbits``, and any unused bits at the end of the last word are
+    always zero.  Bitsets can be combined word-wise using the ``&``, ``|``,
+    ``^`` and ``~`` operators, or using ``combine`` for the modes used by
+    label queries.
+
+    A Bitset mimics enough of the numpy interface that it can be stored in
+    the dictionary of an OpenPNM object in place of a boolean array.  It has
+    ``dtype``, ``shape`` and ``size`` attributes, can be converted with
+    ``numpy.array``, and can be indexed and assigned to.  Indexing returns
+    a boolean array.
+
+    Examples
+    --------
+    >>> from openpnm.utils import Bitset
+    >>> b = Bitset([True, False, True, True])
+    >>> b.words
+    array([176], dtype=uint8)
+    >>> b.indices()
+    array([0, 2, 3])
+    >>> b[1] = True
+    >>> print(b[0:2])
+    [ True  True]
+
+    """
+    dtype = np.dtype(bool)
+    ndim = 1
+
+    def __init__(self, mask=None, size=None):
+        if mask is not None:
+            mask = np.asarray(mask, dtype=bool)
+            if mask.ndim != 1:
+                raise Exception('Only 1D arrays can be stored as a Bitset')
+            self.words = np.packbits(mask)
+            self.size = mask.size
+        else:
+            self.words = np.zeros(((size + 7)//8, ), dtype=np.uint8)
+            self.size = int(size)
+
+    @property
+    def shape(self):
+        return (self.size, )
+
+    @property
+    def nbytes(self):
+        return self.words.nbytes
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return 'Bitset(' + np.array(self).__repr__() + ')'
+
+    def __array__(self, dtype=None):
+        mask = np.unpackbits(self.words, count=self.size).view(bool)
+        if dtype is not None:
+            mask = mask.astype(dtype)
+        return mask
+
+    def _locations(self, ind):
+        # Converts integer indices to an array of non-negative ints, or
+        # returns None for any other kind of index
+        if isinstance(ind, slice):
+            return None
+        ind = np.asarray(ind)
+        if (ind.dtype == bool) or (ind.dtype.kind not in 'iu'):
+            return None
+        ind = np.where(ind < 0, ind + self.size, ind)
+        if ind.size and ((ind.min() < 0) or (ind.max() >= self.size)):
+            raise IndexError('Index is out of bounds for size '
+                             + str(self.size))
+        return ind.astype(np.int64)
+
+    def __getitem__(self, ind):
+        locs = self._locations(ind)
+        if locs is None:
+            return np.array(self)[ind]
+        bits = (self.words[locs >> 3] >> (7 - (locs & 7))) & 1
+        return bits.astype(bool)
+
+    def __setitem__(self, ind, value):
+        locs = self._locations(ind)
+        value = np.asarray(value, dtype=bool)
+        if (locs is None) or (value.ndim > 0):
+            mask = np.array(self)
+            mask[ind] = value
+            self.words = np.packbits(mask)
+            return
+        bits = (128 >> (locs & 7)).astype(np.uint8)
+        if value:
+            np.bitwise_or.at(self.words, locs >> 3, bits)
+        else:
+            np.bitwise_and.at(self.words, locs >> 3, ~bits)
+
+    def _new(self, words):
+        b = Bitset(size=0)
+        b.words = words
+        b.size = self.size
+        return b
+
+    def _tail(self):
+        # Mask which keeps only the bits within size in the last word
+        tail = np.full_like(self.words, 255)
+        if self.size % 8:
+            tail[-1] = (255 << (8 - self.size % 8)) & 255
+        return tail
+
+    def __and__(self, other):
+        return self._new(self.words & other.words)
+
+    def __or__(self, other):
+        return self._new(self.words | other.words)
+
+    def __xor__(self, other):
+        return self._new(self.words ^ other.words)
+
+    def __invert__(self):
+        return self._new(~self.words & self._tail())
+
+    def copy(self):
+        return self._new(self.words.copy())
+
+    def count(self):
+        r"""
+        Returns the number of True elements
+        """
+        return int(_popcount[self.words].sum())
+
+    def indices(self):
+        r"""
+        Returns the indices of the True elements
+        """
+        return np.flatnonzero(np.array(self))
+
+    @classmethod
+    def combine(cls, bitsets, mode, size):
+        r"""
+        Combines several Bitsets word-wise according to the given mode
+
+        Parameters
+        ----------
+        bitsets : list of Bitsets
+            The Bitsets to combine, which must all have the given size.
+
+        mode : string
+            How the Bitsets are combined.  Options are:
+
+            **'or'** : Elements which are True in *any* of the Bitsets.
+
+            **'and'** : Elements which are True in *all* of the Bitsets.
+
+            **'xor'** : Elements which are True in *only one* Bitset.
+
+            **'nor'** : Elements which are True in *none* of the Bitsets.
+
+            **'nand'** : Elements which are True in *some but not all* of
+            the Bitsets.
+
+            **'xnor'** : Elements which are True in *more than one* Bitset.
+
+        size : int
+            The number of elements, which is needed when no Bitsets are given.
+
+        Returns
+        -------
+        A new Bitset.
+
+        """
+        result = cls(size=size)
+        any_ = result.words.copy()
+        all_ = ~result.words & result._tail()
+        more = result.words.copy()
+        for b in bitsets:
+            more |= any_ & b.words
+            any_ |= b.words
+            all_ &= b.words
+        if mode == 'or':
+            result.words = any_
+        elif mode == 'and':
+            result.words = all_
+        elif mode == 'xor':
+            result.words = any_ & ~more
+        elif mode == 'nor':
+            result.words = ~any_ & result._tail()
+        elif mode == 'nand':
+            result.words = any_ & ~all_
+        elif mode == 'xnor':
+            result.words = more
+        else:
+            raise Exception('Unsupported mode: '+mode)
+        return result
@@ -4,6 +4,7 @@ import numpy as np
 import openpnm
 from copy import deepcopy
 from openpnm.utils import SettingsDict, HealthDict, Workspace, logging
+from openpnm.utils import SharedArray
 logger = logging.getLogger(__name__)
 ws = Workspace()
 
@@ -60,6 +61,8 @@ class Project(list):
     +------------------+-------------------------------------------------+
     | check_physics... | Perform a check to find pores which have ove... |
     +------------------+-------------------------------------------------+
+    | storage          | Backend which holds the arrays of all objects   |
+    +------------------+-------------------------------------------------+
 
     """
 
@@ -69,6 +72,7 @@ class Project(list):
         # Register self with workspace
         ws[name] = self
         self.settings = SettingsDict()
+        self._storage = None
         self.comments = 'Using OpenPNM ' + openpnm.__version__
 
     def extend(self, obj):
@@ -88,6 +92,8 @@ class Project(list):
                 # Must use append since extend breaks the dicts up into
                 # separate objects, while append keeps it as a single object.
                 super().append(item)
+                if self.storage is not item._storage:
+                    item._set_storage(self.storage)
             else:
                 raise Exception('Only OpenPNM objects can be added')
 
@@ -196,10 +202,31 @@ class Project(list):
         proj : list
             A new Project object containing copies of all objects
 
+        Notes
+        -----
+        The numerical arrays of the objects are not copied.  Instead both
+        projects hold read-only views of the same data, which is only copied
+        when it is written to in-place on either project (see
+        ``SharedArray``).  Writing an array with ``__setitem__`` replaces it
+        as usual, so copying a project takes a time proportional to the
+        number of arrays rather than their size.
+
         """
         if name is None:
             name = ws._gen_name()
-        proj = deepcopy(self)
+        memo = {}
+        views = []
+        for obj in self:
+            for key, arr in list(dict.items(obj)):
+                if (type(arr) not in [np.ndarray, np.memmap, SharedArray]) \
+                        or (arr.dtype.kind == 'O'):
+                    continue  # Arrays with units or objects are copied
+                view = SharedArray.share(obj, key)
+                memo[id(dict.__getitem__(obj, key))] = view
+                views.append((obj, key, view))
+        proj = deepcopy(self, memo)
+        for obj, key, view in views:
+            view.attach(memo[id(obj)], key)
         ws[name] = proj
         return proj
 
@@ -207,6 +234,16 @@ class Project(list):
     def workspace(self):
         return ws
 
+    def _get_storage(self):
+        return getattr(self, '_storage', None)
+
+    def _set_storage(self, storage):
+        for obj in self:
+            obj._set_storage(storage)
+        self._storage = storage
+
+    storage = property(fget=_get_storage, fset=_set_storage)
+
     def _set_name(self, name):
         if name is None:
             name = ws._gen_name()
@@ -463,6 +500,10 @@ class Project(list):
             for key in list(item.keys()):
                 if key.split('.')[-1] == obj.name:
                     del item[key]
+            item._forget_subscriber(obj.name)
+        # Move the object's arrays out of any files, which are removed
+        if obj._storage is not None:
+            obj._set_storage(None)
         super().remove(obj)
 
     def save_object(self, obj):
@@ -982,6 +1023,68 @@ class Project(list):
             else:
                 obj.regenerate_models()
 
+    def profile_models(self, sort='time', reset=False):
+        r"""
+        Reports the time and memory used by the models on all objects in
+        the project.
+
+        Parameters
+        ----------
+        sort : string
+            The column by which models are ordered, from largest to smallest.
+            Options are 'time' (default), 'calls', 'size' and 'allocated'.
+
+        reset : boolean
+            If ``True`` the recorded values on each object are cleared after
+            the report is made.  The default is ``False``.
+
+        Returns
+        -------
+        A ReST compatible table with one row per model, as made by
+        ``openpnm.utils.misc.profile_to_table``.
+
+        Notes
+        -----
+        Models are only profiled while ``settings['profile_models']`` is
+        enabled on their object.  See ``profile_models`` on any object with
+        models for details.
+
+        """
+        from openpnm.utils.misc import profile_to_table
+        table = profile_to_table(list(self), sort=sort)
+        if reset:
+            for obj in self:
+                if hasattr(obj, 'models'):
+                    obj.profile_models(reset=True)
+        return table
+
+    def memory_report(self, caches=True, astype='table'):
+        r"""
+        Reports the memory used by the arrays on all objects in the project
+
+        Parameters
+        ----------
+        caches : boolean
+            If ``True`` (default) the cached arrays and matrices held as
+            attributes of each object are included, such as the adjacency and
+            incidence matrices of the network (``_am`` and ``_im``) and the
+            coefficient matrices of algorithms (``_pure_A``, ``_A_t``, etc).
+
+        astype : string
+            The format of the report.  Options are 'table' (default), 'pandas'
+            and 'dict'.  See ``openpnm.utils.misc.memory_to_table`` for
+            details.
+
+        Notes
+        -----
+        The time steps stored by transient algorithms are reported with the
+        type 'transient', so a DataFrame of the report can be grouped by
+        object, element and type to see where memory is being used.
+
+        """
+        from openpnm.utils.misc import memory_to_table
+        return memory_to_table(list(self), caches=caches, astype=astype)
+
     def get_grid(self, astype='table'):
         from pandas import DataFrame as df
         geoms = self.geometries().keys()
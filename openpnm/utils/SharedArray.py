@@ -0,0 +1,231 @@
+import weakref
+import numpy as np
+
+# Numpy functions which write into their first argument
+_writers = {np.copyto, np.place, np.putmask, np.put, np.fill_diagonal}
+
+
+class _Share():
+    r"""
+    The data behind a group of SharedArrays, and the objects holding them
+    """
+
+    def __init__(self, data):
+        # Handles to the array taken before it was shared must not change the
+        # data, so it is read-only until the first holder writes to it
+        self.source = data
+        self.writeable = data.flags.writeable
+        data.flags.writeable = False
+        if isinstance(data, SharedArray):  # A previously shared array
+            data = data.view(np.ndarray)
+        self.data = data
+        self.holders = []  # (weakref to object, key) for each view
+
+    def release(self, arr):
+        # Makes arr, a view of the data, writeable.  The data itself is only
+        # made writeable again if arr belongs to the first holder, which had
+        # the array before it was shared.
+        if not self.writeable:
+            return
+        owner = False
+        if self.holders:
+            ref, key = self.holders[0]
+            obj = ref()
+            owner = (obj is not None) and (dict.get(obj, key) is arr)
+        self.source.flags.writeable = True
+        self.data.flags.writeable = True
+        arr.flags.writeable = True
+        if not owner:
+            self.data.flags.writeable = False
+            self.source.flags.writeable = False
+
+    def view(self):
+        arr = self.data.view(SharedArray)
+        arr.flags.writeable = False
+        arr._cow = self
+        return arr
+
+
+class SharedArray(np.ndarray):
+    r"""
+    A read-only view of an array whose data is shared between the objects of
+    several projects, which is copied when it is first written to.
+
+    Shared arrays are made by ``Project.copy``, so that a copied project
+    initially holds views of the same data as the original rather than
+    copies of it.
+
+    Notes
+    -----
+    Arrays are replaced as usual when written with ``__setitem__`` on an
+    object, so shared data is never changed this way.  When a shared array
+    is written in-place, for instance ``pn['pore.coords'][0] = 0`` or using
+    ``+=``, the other objects holding the same data are given a new copy of
+    it, after which the array being written is no longer shared and can be
+    edited freely.  This means that any handle to the written array remains
+    valid, but handles to the arrays of the *other* objects which were taken
+    before the write will see the change.
+
+    The original array, which may still be held by handles taken before
+    the project was copied, is made read-only while it is shared, so that
+    writing to such a handle raises an error rather than changing the
+    copies.  It becomes writeable again if the original object writes to
+    its array first, since the handle then refers to that object's data.
+
+    ``copy``, ``deepcopy`` and ``pickle`` produce ordinary arrays.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import openpnm as op
+    >>> pn = op.network.Cubic(shape=[3, 3, 3])
+    >>> proj = pn.project.copy()
+    >>> coords = proj.network['pore.coords']
+    >>> np.shares_memory(coords, pn['pore.coords'])
+    True
+    >>> coords[0] = 10.0
+    >>> np.shares_memory(coords, pn['pore.coords'])
+    False
+    >>> print(pn['pore.coords'][0])
+    [0.5 0.5 0.5]
+
+    """
+    _cow = None
+    _root = None
+
+    def __array_finalize__(self, obj):
+        # Views of a SharedArray are read-only, and unshare their root
+        self._cow = None
+        if isinstance(obj, SharedArray):
+            self._root = obj if obj._root is None else obj._root
+
+    @classmethod
+    def share(cls, obj, key):
+        r"""
+        Replaces the array stored under ``key`` on ``obj`` with a read-only
+        view, and returns another view of the same data which can be given to
+        a copy of the object.
+
+        Parameters
+        ----------
+        obj : OpenPNM object
+            The object holding the array
+
+        key : string
+            The dictionary key of the array
+
+        Returns
+        -------
+        A SharedArray which must be registered with the object it is given to
+        using ``attach``.
+
+        """
+        arr = dict.__getitem__(obj, key)
+        if (not isinstance(arr, cls)) or (arr._cow is None):
+            share = _Share(arr)
+            arr = share.view()
+            arr.attach(obj, key)
+            dict.__setitem__(obj, key, arr)
+        return arr._cow.view()
+
+    @property
+    def shared(self):
+        r"""
+        Whether the data of this array is still shared with other objects
+        """
+        return self._cow is not None
+
+    def attach(self, obj, key):
+        r"""
+        Records that this array is held under ``key`` on ``obj``, so a new
+        copy can be given to it when another holder writes the data.
+        """
+        self._cow.holders.append((weakref.ref(obj), key))
+
+    def _detach(self):
+        # Called before any in-place write
+        if self.flags.writeable:
+            return
+        root = self if self._root is None else self._root
+        root._unshare()
+        if (root is not self) and root.flags.writeable:
+            self.flags.writeable = True
+
+    def _unshare(self):
+        share = self._cow
+        if share is None:
+            return
+        others = []
+        for ref, key in share.holders:
+            obj = ref()
+            if obj is None:
+                continue
+            arr = dict.get(obj, key)
+            if (arr is not self) and isinstance(arr, SharedArray) \
+                    and (arr._cow is share):
+                others.append((obj, key))
+        # The other holders move to a single new copy of the data
+        if len(others) == 1:
+            obj, key = others[0]
+            dict.__setitem__(obj, key, np.array(share.data))
+        elif len(others) > 1:
+            new = _Share(np.array(share.data))
+            for obj, key in others:
+                arr = new.view()
+                arr.attach(obj, key)
+                dict.__setitem__(obj, key, arr)
+        share.release(self)
+        share.holders = []
+        self._cow = None
+
+    def __setitem__(self, ind, value):
+        self._detach()
+        super().__setitem__(ind, value)
+
+    def fill(self, value):
+        self._detach()
+        super().fill(value)
+
+    def put(self, *args, **kwargs):
+        self._detach()
+        super().put(*args, **kwargs)
+
+    def sort(self, *args, **kwargs):
+        self._detach()
+        super().sort(*args, **kwargs)
+
+    def partition(self, *args, **kwargs):
+        self._detach()
+        super().partition(*args, **kwargs)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        out = kwargs.get('out', ())
+        targets = inputs[:1] if method == 'at' else out
+        for arr in targets:
+            if isinstance(arr, SharedArray):
+                arr._detach()
+        # Results are ordinary arrays
+        inputs = [i.view(np.ndarray) if isinstance(i, SharedArray) else i
+                  for i in inputs]
+        if out:
+            kwargs['out'] = tuple([o.view(np.ndarray)
+                                   if isinstance(o, SharedArray) else o
+                                   for o in out])
+        result = getattr(ufunc, method)(*inputs, **kwargs)
+        if out and (method != 'at'):
+            return out[0] if len(out) == 1 else out
+        return result
+
+    def __array_function__(self, func, types, args, kwargs):
+        if (func in _writers) and isinstance(args[0], SharedArray):
+            args[0]._detach()
+        return super().__array_function__(func, types, args, kwargs)
+
+    def __copy__(self):
+        return np.array(self)
+
+    def __deepcopy__(self, memo):
+        return np.array(self)
+
+    def __reduce_ex__(self, protocol):
+        return np.array(self).__reduce_ex__(protocol)
@@ -0,0 +1,132 @@
+import os
+import shutil
+import tempfile
+import itertools
+import numpy as np
+from openpnm.utils import logging
+logger = logging.getLogger(__name__)
+
+
+class MemmapStorage():
+    r"""
+    A storage backend which keeps the arrays of OpenPNM objects in
+    memory-mapped files in a scratch directory, rather than in RAM.
+
+    Parameters
+    ----------
+    path : string or Path
+        The directory in which the files are kept.  If not given then a new
+        temporary directory is created.
+
+    min_bytes : int
+        Arrays smaller than this are kept in memory.  The default is 0, so
+        all arrays are written to file.
+
+    Notes
+    -----
+    A backend is assigned to a Project using its ``storage`` attribute, after
+    which every array written to any object in the project is copied into a
+    ``numpy.memmap``.  Since this is a subclass of ``ndarray`` the objects
+    behave exactly as before, and in-place edits are written through to the
+    files.  Frequently used arrays stay in the operating system's page cache,
+    while rarely used ones are moved to disk as memory is needed.
+
+    Unlike in-memory storage, the written array is copied, so the stored
+    array is never the same object as the one that was given.  Arrays with
+    no elements, or containing Python objects or strings, are always kept in
+    memory.
+
+    Each file is named after the project, object and key of its array.
+    Files are removed when their array is deleted or overwritten, or when
+    the object is purged from its project, and the whole directory is removed
+    by ``close``.  Copies and pickles of objects hold their arrays in memory.
+
+    Examples
+    --------
+    >>> import openpnm as op
+    >>> pn = op.network.Cubic(shape=[5, 5, 5])
+    >>> storage = op.utils.MemmapStorage()
+    >>> pn.project.storage = storage
+    >>> print(type(pn['pore.coords']).__name__)
+    memmap
+
+    Setting the storage to ``None`` moves all arrays back into memory, after
+    which the files can be removed:
+
+    >>> pn.project.storage = None
+    >>> storage.close()
+
+    """
+
+    def __init__(self, path=None, min_bytes=0):
+        if path is None:
+            path = tempfile.mkdtemp(prefix='openpnm_')
+        self.path = str(path)
+        self.min_bytes = min_bytes
+        self._files = {}
+        self._count = itertools.count()
+
+    def __deepcopy__(self, memo):
+        # Copied projects share the scratch directory
+        return self
+
+    def __getstate__(self):
+        # Pickled objects hold their arrays in memory, so have no files
+        return {'path': self.path, 'min_bytes': self.min_bytes}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def store(self, obj, key, value):
+        r"""
+        Returns the array to place in the object's dictionary, which is a
+        memory-mapped copy of ``value`` unless it should stay in memory.
+        """
+        name = self._files.get((id(obj), key), None)
+        if isinstance(value, np.memmap) and (value.filename is not None):
+            if os.path.abspath(value.filename) == name:
+                return value  # The stored array was written back to itself
+        # Any previous file is removed before writing the new one
+        self.release(obj, key)
+        if (value.size == 0) or (value.nbytes < self.min_bytes) \
+                or (value.dtype.kind in 'OUSV'):
+            return value
+        os.makedirs(self.path, exist_ok=True)
+        fname = self._file_name(obj, key)
+        if os.path.exists(fname):  # An old file could not be removed
+            fname = fname[:-4] + '_' + str(next(self._count)) + '.dat'
+        arr = np.memmap(fname, dtype=value.dtype, mode='w+',
+                        shape=value.shape)
+        arr[:] = value
+        self._files[(id(obj), key)] = fname
+        return arr
+
+    def _file_name(self, obj, key):
+        # Files are named after the object and key, and also the project
+        # since copied projects share the directory
+        names = [obj.name, key]
+        proj = obj.project
+        if proj is not None:
+            names.insert(0, proj.name)
+        fname = '_'.join(names) + '.dat'
+        return os.path.abspath(os.path.join(self.path, fname))
+
+    def release(self, obj, key):
+        r"""
+        Removes the file holding the given array, if any
+        """
+        fname = self._files.pop((id(obj), key), None)
+        if fname is not None:
+            try:  # Views of the array stay valid on posix systems
+                os.remove(fname)
+            except OSError:
+                logger.warning('Could not remove ' + fname)
+
+    def close(self):
+        r"""
+        Removes the scratch directory and all files within it.  Arrays which
+        are still stored on objects should be moved to memory first by
+        setting the Project's ``storage`` to ``None``.
+        """
+        self._files.clear()
+        shutil.rmtree(self.path, ignore_errors=True)
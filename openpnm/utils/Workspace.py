@@ -66,6 +66,10 @@ class Workspace(dict):
             Workspace.__instance__ = dict.__new__(cls)
             cls.settings = SettingsDict()
             cls.settings['loglevel'] = 40
+            # Use 'single' to store network and model arrays as float32/int32
+            cls.settings['precision'] = 'double'
+            # Use True to only run models when their values are first read
+            cls.settings['lazy_models'] = False
         return Workspace.__instance__
 
     def __init__(self):
@@ -245,6 +249,11 @@ class Workspace(dict):
         proj : list
             A handle to the new Project
 
+        Notes
+        -----
+        The arrays of the new Project share their data with the original
+        until either is written to in-place.  See ``Project.copy``.
+
         """
         proj = project.copy(name)
         return proj
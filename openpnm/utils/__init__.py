@@ -15,12 +15,16 @@ from .misc import PrintableList
 from .misc import NestedDict
 from .misc import SettingsDict
 from .misc import HealthDict
+from .misc import FixedPointAccelerator
 from .misc import flat_list
 from .misc import sanitize_dict
 from .misc import unique_list
 from .misc import tic, toc
 from .misc import is_symmetric
 from .Workspace import Workspace
+from .Storage import MemmapStorage
+from .Bitset import Bitset
+from .SharedArray import SharedArray
 from .Project import Project
 
 
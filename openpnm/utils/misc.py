@@ -1,6 +1,8 @@
 import inspect
 import warnings
+import weakref
 import functools
+import numpy as _np
 import scipy as _sp
 import time as _time
 from collections import OrderedDict
@@ -102,11 +104,20 @@ class SettingsDict(PrintableDict):
     None
 
     """
+    # The settings in which each of these keys has been set to a true value,
+    # so that code which rarely needs them can check all settings at once
+    _enabled = {'lazy_models': weakref.WeakValueDictionary()}
+
     def __setitem__(self, key, value):
         if hasattr(value, 'Np'):
             raise Exception('Cannot store OpenPNM objects in settings, ' +
                             'store object\'s name instead')
         super().__setitem__(key, value)
+        if key in self._enabled.keys():
+            if value:
+                self._enabled[key][id(self)] = self
+            else:
+                self._enabled[key].pop(id(self), None)
 
     def __missing__(self, key):
         self[key] = None
@@ -200,6 +211,121 @@ class HealthDict(PrintableDict):
     health = property(fget=_get_health)
 
 
+class FixedPointAccelerator():
+    r"""
+    Speeds up the convergence of a fixed point iteration, ``x = g(x)``, such
+    as the Picard iterations of the reactive transport algorithms.
+
+    Parameters
+    ----------
+    mode : string or None
+        The method used to choose the next iterate.  Options are:
+
+        - ``'anderson'``: Anderson mixing, which combines the last ``depth``
+        iterates to make the change in ``x`` as small as possible.
+
+        - ``'aitken'``: Aitken's adaptive relaxation, which adjusts the
+        relaxation factor after each iteration from the last two changes.
+
+        - ``None``: (Default) Fixed relaxation by the factor ``relaxation``.
+
+    depth : int
+        The number of previous iterates used by Anderson mixing.  The default
+        is 5.
+
+    relaxation : scalar
+        The relaxation factor applied to each change in ``x``, which is also
+        the starting factor of Aitken's method.  The default is 1.
+
+    max_step : scalar or None
+        The longest step allowed to either method, as a multiple of the
+        length of the unrelaxed step, ``g(x) - x``.  The default is ``None``,
+        which leaves the steps unbounded.
+
+    Notes
+    -----
+    The previous iterates are forgotten whenever the change in ``x`` grows
+    from one iteration to the next, so a poor step does not spoil the
+    following ones.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from openpnm.utils import FixedPointAccelerator
+    >>> acc = FixedPointAccelerator(mode='anderson')
+    >>> x = np.zeros(3)
+    >>> for i in range(10):
+    ...     x = acc.update(x, np.cos(x))
+    >>> np.allclose(x, np.cos(x))
+    True
+
+    """
+
+    def __init__(self, mode=None, depth=5, relaxation=1.0, max_step=None):
+        if mode not in [None, 'anderson', 'aitken']:
+            raise Exception('Unrecognized acceleration mode: ' + str(mode))
+        self.mode = mode
+        self.depth = depth
+        self.relaxation = relaxation
+        self.max_step = max_step
+        self.reset()
+
+    def reset(self):
+        r"""
+        Forgets the previous iterates, so a new iteration can be started
+        """
+        self._x = []
+        self._f = []
+        self._omega = self.relaxation
+
+    def update(self, x, gx):
+        r"""
+        Returns the next iterate
+
+        Parameters
+        ----------
+        x : ND-array
+            The current iterate
+
+        gx : ND-array
+            The result of the iteration applied to ``x``
+        """
+        x = _np.array(x, dtype=float)
+        gx = _np.array(gx, dtype=float)
+        w = self.relaxation
+        if self.mode is None:
+            return w*gx + (1-w)*x
+        f = gx - x
+        # Start afresh when the last step made things worse
+        if self._f and _np.linalg.norm(f) > _np.linalg.norm(self._f[-1]):
+            self.reset()
+        if self.mode == 'aitken':
+            if self._f:
+                df = f - self._f[0]
+                omega = -self._omega * _np.dot(self._f[0], df) / _np.dot(df, df)
+                if _np.isfinite(omega):
+                    self._omega = omega
+                if self.max_step is not None:
+                    self._omega = _np.clip(self._omega, -self.max_step,
+                                           self.max_step)
+            self._f = [f]
+            return x + self._omega*f
+        self._x = (self._x + [x])[-(self.depth + 1):]
+        self._f = (self._f + [f])[-(self.depth + 1):]
+        if len(self._f) == 1:
+            return x + w*f
+        dX = _np.diff(_np.stack(self._x, axis=1), axis=1)
+        dF = _np.diff(_np.stack(self._f, axis=1), axis=1)
+        gamma = _np.linalg.lstsq(dF, f, rcond=None)[0]
+        dx = w*f - (dX + w*dF) @ gamma
+        if self.max_step is not None:
+            max_norm = self.max_step * _np.linalg.norm(f)
+            norm_dx = _np.linalg.norm(dx)
+            if norm_dx > max_norm:
+                dx *= max_norm / norm_dx
+        return x + dx
+
+
 def tic():
     r"""
     Homemade version of matlab tic and toc function, tic starts or resets
@@ -372,6 +498,204 @@ def models_to_table(obj, params=True):
     return '\n'.join(lines)
 
 
+def profile_to_table(obj, sort='time'):
+    r"""
+    Converts the model profile of an object, or of all objects in a project,
+    to a ReST compatible table
+
+    Parameters
+    ----------
+    obj : OpenPNM object or Project
+        Any object that has a ``models`` attribute, or a Project, in which
+        case the profiles of all its objects are included.
+
+    sort : string
+        The column by which rows are ordered, from largest to smallest.
+        Options are 'time' (default), 'calls', 'size' and 'allocated'.
+
+    See Also
+    --------
+    models_to_table
+
+    Notes
+    -----
+    Only models that were run while ``settings['profile_models']`` was
+    enabled on their object are included (see ``profile_models``).
+
+    """
+    if hasattr(obj, 'models'):
+        objs = [obj]
+    elif isinstance(obj, list):
+        objs = [i for i in obj if hasattr(i, 'models')]
+    else:
+        raise Exception('Received object does not have any models')
+    rows = []
+    for item in objs:
+        for prop, stats in item.profile_models().items():
+            rows.append((item.name, prop, stats))
+    rows.sort(key=lambda r: -(r[2][sort] or 0))
+    row = '+' + '-'*4 + '+' + '-'*22 + '+' + '-'*22 + '+' + '-'*8 + '+' \
+        + '-'*12 + '+' + '-'*12 + '+' + '-'*12 + '+'
+    fmt = '{0:1s} {1:2s} {0:1s} {2:20s} {0:1s} {3:20s} {0:1s} {4:>6s} ' \
+        + '{0:1s} {5:>10s} {0:1s} {6:>10s} {0:1s} {7:>10s} {0:1s}'
+    lines = []
+    lines.append(row)
+    lines.append(fmt.format('|', '#', 'Object', 'Property Name', 'Calls',
+                            'Time (s)', 'Size (kB)', 'Alloc (kB)'))
+    lines.append(row.replace('-', '='))
+    for i, (name, prop, stats) in enumerate(rows):
+        if len(name) > 20:
+            name = name[:17] + '...'
+        if len(prop) > 20:
+            prop = prop[:17] + '...'
+        alloc = stats['allocated']
+        alloc = '---' if alloc is None else '{:0.1f}'.format(alloc/1024)
+        lines.append(fmt.format('|', str(i+1), name, prop,
+                                str(stats['calls']),
+                                '{:0.4f}'.format(stats['time']),
+                                '{:0.1f}'.format(stats['size']/1024),
+                                alloc))
+        lines.append(row)
+    return '\n'.join(lines)
+
+
+def nbytes_of(item, seen=None):
+    r"""
+    Returns the number of bytes held by an array, sparse matrix or Bitset,
+    or by all such items within a dict, list or tuple
+
+    Parameters
+    ----------
+    item : array, sparse matrix, Bitset, dict, list or tuple
+        The item to measure
+
+    seen : set
+        The ids of items which were already counted, so are not counted
+        again.  The ids of the newly counted items are added to it.  If not
+        given then items found several times in ``item`` are counted once.
+
+    Notes
+    -----
+    Only the plain ``dict``, ``list`` and ``tuple`` types are searched, so
+    OpenPNM objects found within a container are not counted.  The size of a
+    sparse matrix in 'lil' or 'dok' format is estimated from its number of
+    nonzeros.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from openpnm.utils.misc import nbytes_of
+    >>> a = np.ones(10)
+    >>> nbytes_of({'a': a, 'b': [np.ones(5, dtype=bool), 1.0], 'c': a})
+    85
+
+    """
+    if seen is None:
+        seen = set()
+    if type(item) in [dict, list, tuple]:
+        if type(item) is dict:
+            item = list(item.values())
+        return int(sum([nbytes_of(i, seen) for i in item]))
+    if id(item) in seen:
+        return 0
+    if _sp.sparse.issparse(item):
+        seen.add(id(item))
+        if hasattr(item, 'indptr'):
+            arrs = [item.data, item.indices, item.indptr]
+        elif hasattr(item, 'row'):
+            arrs = [item.data, item.row, item.col]
+        else:
+            return int(item.nnz*(item.dtype.itemsize + 8))
+        return int(sum([a.nbytes for a in arrs]))
+    if hasattr(item, 'nbytes') and hasattr(item, 'dtype'):
+        seen.add(id(item))
+        return int(item.nbytes)
+    return 0
+
+
+def memory_to_table(obj, caches=True, astype='table'):
+    r"""
+    Reports the memory used by an object, or by all objects in a project
+
+    Parameters
+    ----------
+    obj : OpenPNM object or Project
+        The object to report on, or a Project, in which case all its objects
+        are included.
+
+    caches : boolean
+        If ``True`` (default) the cached arrays and sparse matrices held
+        as attributes of each object, such as the adjacency and incidence
+        matrices of a network or the coefficient matrices of an algorithm,
+        are also included.
+
+    astype : string
+        The format of the report.  Options are:
+
+        **'table'** : (default) A ReST compatible table with one row per
+        array, from largest to smallest.
+
+        **'pandas'** : A DataFrame with one row per array and the columns
+        'object', 'key', 'element', 'type', 'dtype', 'storage' and 'bytes',
+        which can be grouped as needed.
+
+        **'dict'** : A dictionary of the number of bytes of each array, keyed
+        first by object name then by key.
+
+    Notes
+    -----
+    Each array is classed as a 'label', 'prop', 'transient' (for the time
+    steps stored by transient algorithms, which contain an '@') or 'cache'.
+    The results kept by memoized models are listed as caches under the key
+    'memo.' followed by the model's property name.  An array found several
+    times on an object, such as a cached label query, is counted once.
+    Its storage is 'memory', 'memmap' (see ``MemmapStorage``), 'packed'
+    (see ``Base.pack_labels``) or 'shared' with a copied project (see
+    ``SharedArray``), in which case its bytes are counted on each holder.
+
+    """
+    objs = obj if isinstance(obj, list) else [obj]
+    rows = []
+    for item in objs:
+        rows.extend(item._memory_rows(caches=caches))
+    rows.sort(key=lambda r: -r['bytes'])
+    if astype == 'pandas':
+        from pandas import DataFrame
+        return DataFrame(rows, columns=['object', 'key', 'element', 'type',
+                                        'dtype', 'storage', 'bytes'])
+    elif astype == 'dict':
+        report = {item.name: {} for item in objs}
+        for r in rows:
+            report[r['object']][r['key']] = r['bytes']
+        return report
+    elif astype != 'table':
+        raise Exception('Unsupported astype: ' + astype)
+    row = '+' + '-'*6 + '+' + '-'*22 + '+' + '-'*32 + '+' + '-'*11 + '+' \
+        + '-'*9 + '+' + '-'*12 + '+'
+    fmt = '{0:1s} {1:4s} {0:1s} {2:20s} {0:1s} {3:30s} {0:1s} {4:9s} ' \
+        + '{0:1s} {5:7s} {0:1s} {6:>10s} {0:1s}'
+    lines = []
+    lines.append(row)
+    lines.append(fmt.format('|', '#', 'Object', 'Key', 'Type', 'Storage',
+                            'Size (kB)'))
+    lines.append(row.replace('-', '='))
+    for i, r in enumerate(rows):
+        name, key = r['object'], r['key']
+        if len(name) > 20:
+            name = name[:17] + '...'
+        if len(key) > 30:
+            key = key[:27] + '...'
+        lines.append(fmt.format('|', str(i+1), name, key, r['type'],
+                                r['storage'],
+                                '{:0.1f}'.format(r['bytes']/1024)))
+        lines.append(row)
+    total = sum([r['bytes'] for r in rows])
+    lines.append(fmt.format('|', '', 'Total', '', '', '',
+                            '{:0.1f}'.format(total/1024)))
+    lines.append(row)
+    return '\n'.join(lines)
+
+
 def ignore_warnings(warning=RuntimeWarning):
     r"""
     Decorator for catching warnings. Useful in pore-scale models where nans
@@ -0,0 +1,113 @@
+r"""
+Compares the number of iterations needed by the Picard iterations of
+``ReactiveTransport`` and the Gummel iterations of ``IonicTransport`` with
+fixed relaxation, Anderson mixing and Aitken's adaptive relaxation, which are
+selected with the ``acceleration`` setting.
+"""
+import io
+import contextlib
+import numpy as np
+import openpnm as op
+from openpnm.phases import mixtures
+ws = op.Workspace()
+ws.settings['loglevel'] = 50
+modes = [None, 'anderson', 'aitken']
+
+
+def reactive(acceleration, relaxation, prefactor, exponent):
+    # A power law reaction in the lower half of a cubic network
+    proj = ws.new_project()
+    net = op.network.Cubic(shape=[15, 15, 15], project=proj)
+    geo = op.geometry.GenericGeometry(network=net, pores=net.Ps,
+                                      throats=net.Ts)
+    phase = op.phases.GenericPhase(network=net)
+    phys = op.physics.GenericPhysics(network=net, phase=phase, geometry=geo)
+    phys['throat.diffusive_conductance'] = 1e-15
+    phys['pore.A'] = prefactor
+    phys['pore.k'] = exponent
+    mod = op.models.physics.generic_source_term.standard_kinetics
+    phys.add_model(propname='pore.reaction', model=mod,
+                   prefactor='pore.A', exponent='pore.k',
+                   quantity='pore.concentration', regen_mode='deferred')
+    rt = op.algorithms.ReactiveTransport(network=net, phase=phase)
+    rt.setup(conductance='throat.diffusive_conductance',
+             quantity='pore.concentration', rxn_tolerance=1e-8,
+             max_iter=1000, relaxation_quantity=relaxation,
+             acceleration=acceleration)
+    rt.set_source(pores=net.Ps[net['pore.coords'][:, 2] < 7.5],
+                  propname='pore.reaction')
+    rt.set_value_BC(pores=net.pores('top'), values=1.0)
+    rt.run()
+    ws.close_project(proj)
+    return rt.convergence['iterations']
+
+
+def ionic(acceleration):
+    # The setup of scripts/example_PNP_2D.py
+    np.random.seed(0)
+    proj = ws.new_project()
+    net = op.network.Cubic(shape=[23, 15, 1], spacing=1e-6, project=proj)
+    prs = (net['pore.back'] * net['pore.right'] + net['pore.back']
+           * net['pore.left'] + net['pore.front'] * net['pore.right']
+           + net['pore.front'] * net['pore.left'])
+    op.topotools.trim(network=net, pores=net.Ps[prs],
+                      throats=net.Ts[net['throat.surface']])
+    op.topotools.reduce_coordination(net, 3)
+    geo = op.geometry.StickAndBall(network=net, pores=net.Ps, throats=net.Ts)
+    sw = mixtures.SalineWater(network=net)
+    Cl, Na, H2O = sw.components.values()
+    phys = op.physics.GenericPhysics(network=net, phase=sw, geometry=geo)
+    mods = op.models.physics
+    phys.add_model(propname='throat.hydraulic_conductance',
+                   pore_viscosity='pore.viscosity',
+                   throat_viscosity='throat.viscosity',
+                   model=mods.hydraulic_conductance.hagen_poiseuille_2D)
+    phys.add_model(propname='throat.ionic_conductance',
+                   model=mods.ionic_conductance.electroneutrality_2D,
+                   ions=[Na.name, Cl.name])
+    for ion in [Na, Cl]:
+        phys.add_model(propname='throat.diffusive_conductance.' + ion.name,
+                       pore_diffusivity='pore.diffusivity.' + ion.name,
+                       throat_diffusivity='throat.diffusivity.' + ion.name,
+                       model=mods.diffusive_conductance.ordinary_diffusion_2D)
+    sf = op.algorithms.StokesFlow(network=net, phase=sw)
+    sf.set_value_BC(pores=net.pores('back'), values=2010)
+    sf.set_value_BC(pores=net.pores('front'), values=10)
+    sf.run()
+    sw.update(sf.results())
+    p = op.algorithms.ChargeConservation(network=net, phase=sw)
+    p.set_value_BC(pores=net.pores('left'), values=0.02)
+    p.set_value_BC(pores=net.pores('right'), values=0.01)
+    p.settings['rxn_tolerance'] = 1e-12
+    p.settings['charge_conservation'] = 'electroneutrality_2D'
+    ions = []
+    for ion in [Na, Cl]:
+        e = op.algorithms.NernstPlanck(network=net, phase=sw, ion=ion.name)
+        e.set_value_BC(pores=net.pores('back'), values=20)
+        e.set_value_BC(pores=net.pores('front'), values=10)
+        e.settings['rxn_tolerance'] = 1e-12
+        phys.add_model(propname='throat.ad_dif_mig_conductance.' + ion.name,
+                       model=mods.ad_dif_mig_conductance.ad_dif_mig,
+                       ion=ion.name, s_scheme='powerlaw')
+        ions.append(e.name)
+    pnp = op.algorithms.IonicTransport(network=net, phase=sw)
+    pnp.setup(potential_field=p.name, ions=ions, i_max_iter=50,
+              i_tolerance=1e-8, acceleration=acceleration)
+    with contextlib.redirect_stdout(io.StringIO()):
+        pnp.run()
+    ws.close_project(proj)
+    return pnp.convergence['iterations']
+
+
+print('Picard iterations of ReactiveTransport')
+for prefactor, exponent in [(-1e-15, 2), (-1e-11, 3)]:
+    for relaxation in [1.0, 0.5]:
+        its = [reactive(mode, relaxation, prefactor, exponent)
+               for mode in modes]
+        print(f'A = {prefactor:.0e}, k = {exponent}, '
+              + f'relaxation = {relaxation}: '
+              + ', '.join(f'{m}: {i}' for m, i in zip(modes, its)))
+
+print('Gummel iterations of IonicTransport')
+its = [ionic(mode) for mode in modes]
+print(', '.join(f'{m}: {i}' for m, i in zip(modes, its)))
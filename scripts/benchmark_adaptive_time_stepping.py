@@ -0,0 +1,62 @@
+r"""
+Compares fixed and adaptive time stepping of ``TransientFickianDiffusion`` on
+the setup of scripts/example_transient_diffusion.py, until it is close to
+steady state.  Reports the number of linear solves, the run time, and the
+largest error at the output times, relative to a reference found with a tight
+error tolerance.
+"""
+import time
+import numpy as np
+import openpnm as op
+ws = op.Workspace()
+ws.settings['loglevel'] = 50
+outputs = [10, 100, 1000]
+
+
+def diffusion(**settings):
+    np.random.seed(7)
+    proj = ws.new_project()
+    net = op.network.Cubic(shape=[51, 19, 1], spacing=1e-4, project=proj)
+    geo = op.geometry.StickAndBall(network=net, pores=net.Ps, throats=net.Ts)
+    phase = op.phases.Water(network=net)
+    phys = op.physics.GenericPhysics(network=net, phase=phase, geometry=geo)
+    phase['pore.diffusivity'] = 2e-09
+    phase['throat.diffusivity'] = 2e-09
+    mod = op.models.physics.diffusive_conductance.ordinary_diffusion
+    phys.add_model(propname='throat.diffusive_conductance', model=mod)
+    fd = op.algorithms.TransientFickianDiffusion(network=net, phase=phase)
+    fd.set_value_BC(pores=net.pores('front'), values=0.5)
+    fd.set_value_BC(pores=net.pores('back'), values=0.1)
+    fd.setup(t_final=1000, t_output=outputs, t_step=0.5, **settings)
+    # March to 't_final' rather than stopping at a small change per step, and
+    # solve at every fixed step
+    fd.settings.update({'t_tolerance': 0, 'rxn_tolerance': 1e-12})
+    # Count the linear solves
+    solves = []
+    solve = fd._solve
+
+    def counted_solve(*args, **kwargs):
+        solves.append(1)
+        return solve(*args, **kwargs)
+
+    fd._solve = counted_solve
+    tic = time.time()
+    fd.run()
+    toc = time.time() - tic
+    ws.close_project(proj)
+    return fd, len(solves), toc
+
+
+ref = diffusion(t_adaptive=True, t_error_tolerance=1e-6)[0]
+cases = {'fixed, t_step = 0.5': {},
+         'adaptive, t_error_tolerance = 1e-3': {'t_adaptive': True},
+         'adaptive, t_error_tolerance = 1e-4': {'t_adaptive': True,
+                                                't_error_tolerance': 1e-4},
+         'adaptive cranknicolson, t_error_tolerance = 1e-4': {
+             't_adaptive': True, 't_error_tolerance': 1e-4,
+             't_scheme': 'cranknicolson'}}
+for case, settings in cases.items():
+    fd, n, toc = diffusion(**settings)
+    x, x_ref = fd.results(times=outputs), ref.results(times=outputs)
+    err = max(np.absolute(x[k] - x_ref[k]).max() for k in x)
+    print(f'{case}: {n} solves, {toc:.1f} s, max error at outputs {err:.1e}')
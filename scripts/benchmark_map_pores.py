@@ -0,0 +1,54 @@
+r"""
+Compares the sorted '_id' index used by ``map_pores`` and ``map_throats``
+with the previous approach based on ``isin``, on a network with over one
+million pores split between two geometries.
+"""
+import time
+import numpy as np
+import openpnm as op
+ws = op.Workspace()
+ws.settings['loglevel'] = 50
+
+
+def map_with_isin(obj, ids, element):
+    # This is the approach used by Base._map before the index was added
+    ids = np.array(ids, dtype=np.int64)
+    locations = obj._get_indices(element=element)
+    self_in_ids = np.isin(ids, obj[element+'._id'], assume_unique=True)
+    ids_in_self = np.isin(obj[element+'._id'], ids, assume_unique=True)
+    ind = np.ones_like(ids, dtype=np.int64) * -1
+    ind[self_in_ids] = locations[ids_in_self]
+    return ind[self_in_ids]
+
+
+def timeit(f, repeats=5):
+    f()  # Warm up, which also builds any cached index
+    t = time.perf_counter()
+    for _ in range(repeats):
+        f()
+    return (time.perf_counter() - t)/repeats
+
+
+pn = op.network.Cubic(shape=[110, 110, 110])
+Ps = pn.Ps[pn['pore.coords'][:, 0] < 55]
+Ts = pn.find_neighbor_throats(pores=Ps, mode='xnor')
+geo1 = op.geometry.GenericGeometry(network=pn, pores=Ps, throats=Ts)
+geo2 = op.geometry.GenericGeometry(network=pn,
+                                   pores=pn.pores(geo1.name, mode='not'),
+                                   throats=pn.throats(geo1.name, mode='not'))
+print(f'Np = {pn.Np}, Nt = {pn.Nt}')
+
+ids = pn['pore._id'][Ps]
+cases = {
+    'network <- geometry': (pn, geo1['pore._id']),
+    'geometry <- network (all pores)': (geo1, pn['pore._id']),
+    'geometry <- network (1000 pores)': (geo1, ids[::ids.size//1000]),
+}
+for name, (obj, ids) in cases.items():
+    a = obj._map(ids=ids, element='pore', filtered=True)
+    b = map_with_isin(obj, ids=ids, element='pore')
+    assert np.all(a == b)
+    t_new = timeit(lambda: obj._map(ids=ids, element='pore', filtered=True))
+    t_old = timeit(lambda: map_with_isin(obj, ids=ids, element='pore'))
+    print(f'{name:35s} isin: {t_old:0.4f} s, index: {t_new:0.4f} s, '
+          + f'speed-up: {t_old/t_new:0.1f}x')
@@ -1,6 +1,7 @@
 import openpnm as op
 import scipy as sp
 import pytest
+from openpnm.algorithms.metrics import FormationFactor, RelativePermeability
 
 
 class GenericTransportTest:
@@ -117,6 +118,128 @@ class GenericTransportTest:
         # Revert back changes to objects
         self.setup_class()
 
+    def test_cache_A_cleared_on_write(self):
+        alg = op.algorithms.GenericTransport(network=self.net,
+                                             phase=self.phase)
+        alg.settings['conductance'] = 'throat.diffusive_conductance'
+        alg.settings['quantity'] = 'pore.mole_fraction'
+        self.phys['throat.diffusive_conductance'] = 1.0
+        alg._build_A()
+        x = alg._A.diagonal().sum()
+        assert alg._pure_A is not None
+        # Writing the conductance on the physics discards the cached matrix
+        self.phys['throat.diffusive_conductance'] = 2.0
+        assert alg._pure_A is None
+        alg._build_A()
+        assert alg._A.diagonal().sum() == 2*x
+        # In-place edits are only seen once the change is announced
+        self.phys['throat.diffusive_conductance'][1] = 50.0
+        assert alg._pure_A is not None
+        self.phys.notify('throat.diffusive_conductance')
+        assert alg._pure_A is None
+        # Revert back changes to objects
+        self.setup_class()
+
+    def test_cached_b_cleared_on_trim(self):
+        pn = op.network.Cubic(shape=[5, 5, 1])
+        phase = op.phases.GenericPhase(network=pn)
+        phase['throat.diffusive_conductance'] = 1.0
+        alg = op.algorithms.FickianDiffusion(network=pn, phase=phase)
+        alg.set_value_BC(pores=pn.pores('left'), values=1)
+        alg.set_value_BC(pores=pn.pores('right'), values=0)
+        alg.run()
+        op.topotools.trim(network=pn, pores=[12])
+        assert alg._pure_A is None
+        assert alg._pure_b is None
+        alg.run()
+        assert alg['pore.concentration'].shape == (24, )
+        # Boundary conditions that no longer fit the network are reported
+        dict.__setitem__(alg, 'pore.bc_value', sp.ones(25))
+        with pytest.raises(Exception):
+            alg.run()
+
+    def test_run_batch(self):
+        alg = op.algorithms.GenericTransport(network=self.net,
+                                             phase=self.phase)
+        alg.settings['conductance'] = 'throat.diffusive_conductance'
+        alg.settings['quantity'] = 'pore.mole_fraction'
+        self.phys['throat.diffusive_conductance'] = 1.0
+        alg.set_value_BC(pores=self.net.pores('left'), values=5)
+        top, bottom = self.net.pores('top'), self.net.pores('bottom')
+        front = self.net.pores('front')
+        bc_sets = {'a': [{'pores': top, 'values': 1},
+                         {'pores': bottom, 'values': 0}],
+                   'b': [{'pores': top, 'values': 2},
+                         {'pores': bottom, 'values': 0}],
+                   'c': [{'pores': front, 'values': 1, 'bctype': 'rate'},
+                         {'pores': bottom, 'values': 0}]}
+        batch = alg.run_batch(bc_sets)
+        # Each case matches a separate run with the same conditions
+        for case, specs in bc_sets.items():
+            ref = op.algorithms.GenericTransport(network=self.net,
+                                                 phase=self.phase)
+            ref.settings.update(alg.settings)
+            for spec in specs:
+                ref._set_BC(pores=spec['pores'], bcvalues=spec['values'],
+                            bctype=spec.get('bctype', 'value'))
+            ref.run()
+            x = batch[case]['pore.mole_fraction']
+            assert sp.allclose(x, ref['pore.mole_fraction'])
+            rates = [ref.rate(pores=spec['pores'])[0] for spec in specs]
+            assert sp.allclose(batch[case]['rate'], rates)
+            self.net.project.purge_object(ref)
+        assert sp.allclose(batch['b']['pore.mole_fraction'],
+                           2*batch['a']['pore.mole_fraction'])
+        # The boundary conditions of the algorithm are kept
+        assert sp.sum(sp.isfinite(alg['pore.bc_value'])) == 81
+        assert 'pore.mole_fraction' not in alg.keys()
+        # Lists of cases are named by position
+        batch = alg.run_batch([bc_sets['a']])
+        assert list(batch.keys()) == [0]
+
+    def test_run_batch_in_formation_factor(self):
+        net = op.network.Cubic(shape=[6, 7, 8], spacing=1e-4)
+        op.geometry.StickAndBall(network=net, pores=net.Ps, throats=net.Ts)
+        FF = FormationFactor(network=net)
+        FF.run()
+        # Each direction matches a separate run with the same conditions
+        phase = op.phases.GenericPhase(network=net)
+        phase['pore.diffusivity'] = 1.0
+        phase['throat.diffusivity'] = 1.0
+        mod = op.models.physics.diffusive_conductance.ordinary_diffusion
+        phase.add_model(propname='throat.diffusive_conductance', model=mod)
+        for d in ['x', 'y', 'z']:
+            Pin = net.pores(FF.settings['inlets'][d])
+            Pout = net.pores(FF.settings['outlets'][d])
+            fd = op.algorithms.FickianDiffusion(network=net, phase=phase)
+            fd.set_value_BC(pores=Pin, values=1.0)
+            fd.set_value_BC(pores=Pout, values=0.0)
+            fd.run()
+            R = fd.rate(pores=Pin)[0]
+            A, L = FF.settings['areas'][d], FF.settings['lengths'][d]
+            assert sp.allclose(FF.results[d], A/(R*L), rtol=1e-6, atol=0)
+        net.project.purge_object(phase)
+
+    def test_run_batch_in_absolute_permeability(self):
+        net = op.network.Cubic(shape=[6, 7, 8], spacing=1e-4)
+        op.geometry.StickAndBall(network=net, pores=net.Ps, throats=net.Ts)
+        air = op.phases.Air(network=net)
+        mod = op.models.physics.hydraulic_conductance.hagen_poiseuille
+        air.add_model(propname='throat.hydraulic_conductance', model=mod)
+        rp = RelativePermeability(network=net)
+        flow_pores = {'x': [net.pores('left'), net.pores('right')],
+                      'y': [net.pores('front'), net.pores('back')],
+                      'z': [net.pores('top'), net.pores('bottom')]}
+        K_abs = rp._abs_perm_calc(air, flow_pores)
+        # Each direction matches a separate run with the same conditions
+        for d, (Pin, Pout) in flow_pores.items():
+            sf = op.algorithms.StokesFlow(network=net, phase=air)
+            sf.set_value_BC(pores=Pin, values=1)
+            sf.set_value_BC(pores=Pout, values=0)
+            sf.run()
+            K = abs(sf.rate(pores=Pout)[0])
+            assert sp.allclose(K_abs[d], K, rtol=1e-6, atol=0)
+
     def test_rate_single(self):
         alg = op.algorithms.ReactiveTransport(network=self.net,
                                               phase=self.phase)
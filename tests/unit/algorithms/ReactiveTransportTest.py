@@ -37,6 +37,47 @@ class ReactiveTransportTest:
         c_mean = rt['pore.concentration'].mean()
         assert_allclose(c_mean, c_mean_desired, rtol=1e-6)
 
+    def test_newton(self):
+        iterations = {}
+        for mode in ['picard', 'newton']:
+            rt = op.algorithms.ReactiveTransport(network=self.net,
+                                                 phase=self.phase)
+            rt.setup(rxn_tolerance=1e-10, rxn_solver=mode,
+                     relaxation_source=0.5, relaxation_quantity=0.5)
+            rt.settings.update({'conductance': 'throat.diffusive_conductance',
+                                'quantity': 'pore.concentration'})
+            rt.set_source(pores=self.net.pores('bottom'),
+                          propname='pore.reaction')
+            rt.set_value_BC(pores=self.net.pores('top'), values=1.0)
+            rt.run()
+            c_mean = rt['pore.concentration'].mean()
+            assert_allclose(c_mean, 0.648268, rtol=1e-6)
+            conv = rt.convergence
+            assert len(conv['residuals']) == conv['iterations'] + 1
+            assert conv['residuals'][-1] < conv['residuals'][0]
+            iterations[mode] = conv['iterations']
+        # Relaxation settings are not used by Newton steps
+        assert iterations['newton'] < iterations['picard']
+
+    def test_acceleration(self):
+        iterations = {}
+        for mode in [None, 'anderson', 'aitken']:
+            rt = op.algorithms.ReactiveTransport(network=self.net,
+                                                 phase=self.phase)
+            rt.setup(rxn_tolerance=1e-10, acceleration=mode,
+                     relaxation_quantity=0.5)
+            rt.settings.update({'conductance': 'throat.diffusive_conductance',
+                                'quantity': 'pore.concentration'})
+            rt.set_source(pores=self.net.pores('bottom'),
+                          propname='pore.reaction')
+            rt.set_value_BC(pores=self.net.pores('top'), values=1.0)
+            rt.run()
+            c_mean = rt['pore.concentration'].mean()
+            assert_allclose(c_mean, 0.648268, rtol=1e-6)
+            iterations[mode] = rt.convergence['iterations']
+        assert iterations['anderson'] < iterations[None]
+        assert iterations['aitken'] < iterations[None]
+
     def test_source_over_BCs(self):
         rt = op.algorithms.ReactiveTransport(network=self.net,
                                              phase=self.phase)
@@ -1,6 +1,7 @@
 import openpnm as op
 import scipy as sp
 import importlib
+import pytest
 import numpy.testing as nt
 
 
@@ -86,6 +87,71 @@ class SolversTest:
         with nt.assert_raises(Exception):
             ad.run()
 
+    def test_scipy_iterative_ilu(self):
+        solvers = ['bicgstab', 'gmres', 'qmr']
+        self.alg.settings.update(solver_family='scipy', solver_rtol=1e-08,
+                                 solver_maxiter=5000,
+                                 solver_preconditioner='ilu', solver_reuse=2,
+                                 cache_solver=True)
+        for solver in solvers:
+            self.alg.settings['solver_type'] = solver
+            self.alg.run()
+            self.alg.run()
+            xmean = self.alg['pore.x'].mean()
+            nt.assert_allclose(actual=xmean, desired=0.587595, rtol=1e-4)
+            assert self.alg._solver_cache['uses'] == 2
+        self.alg.settings['solver_type'] = 'cg'
+        with nt.assert_raises(Exception):
+            self.alg.run()
+        self.alg.settings.update(solver_preconditioner='jacobi',
+                                 solver_maxiter=100, solver_reuse=10,
+                                 cache_solver=False)
+
+    def test_pyamg_preconditioner_reused(self):
+        pytest.importorskip('pyamg')
+        self.alg.settings.update(solver_family='pyamg', solver_reuse=2,
+                                 cache_solver=True)
+        self.alg.run()
+        ml = self.alg._solver_cache['M']
+        # New values of A are solved with the old hierarchy as preconditioner
+        self.phys['throat.conductance'] = sp.linspace(5, 1, num=self.net.Nt)
+        self.alg._build_A()
+        self.alg.run()
+        assert self.alg._solver_cache['M'] is ml
+        x = self.alg['pore.x'].copy()
+        self.alg.settings.update(solver_family='scipy', solver_type='spsolve')
+        self.alg.run()
+        nt.assert_allclose(x, self.alg['pore.x'], rtol=1e-6)
+        self.phys['throat.conductance'] = sp.linspace(1, 5, num=self.net.Nt)
+        self.alg._build_A()
+        self.alg.settings.update(solver_reuse=10, cache_solver=False)
+
+    def test_factorization_reused_while_A_unchanged(self):
+        self.alg.settings.update(solver_family='scipy', solver_type='spsolve')
+        # The factorization is freed after each run by default
+        self.alg.run()
+        assert self.alg._solver_cache == {}
+        self.alg.settings['cache_solver'] = True
+        self.alg.run()
+        lu = self.alg._solver_cache['lu']
+        x = self.alg._solve(b=2*self.alg.b)
+        assert self.alg._solver_cache['lu'] is lu
+        nt.assert_allclose(x, 2*self.alg['pore.x'])
+        # New values of A give a new factorization
+        self.phys['throat.conductance'] = sp.linspace(5, 1, num=self.net.Nt)
+        self.alg._build_A()
+        self.alg.run()
+        assert self.alg._solver_cache['lu'] is not lu
+        self.phys['throat.conductance'] = sp.linspace(1, 5, num=self.net.Nt)
+        self.alg._build_A()
+        # Nothing is kept in copies of the algorithm, or if caching is off
+        alg = self.alg.project.copy()[self.alg.name]
+        assert alg._solver_cache == {}
+        lu = self.alg._solver_cache['lu']
+        self.alg.settings['cache_solver'] = False
+        self.alg._solve()
+        assert self.alg._solver_cache['lu'] is not lu
+
 
 if __name__ == '__main__':
     t = SolversTest()
@@ -48,6 +48,41 @@ class TransientImplicitReactiveTransportTest:
         y = sp.around(alg[alg.settings['quantity']], decimals=5)
         assert sp.all(x == y)
 
+    def test_transient_adaptive_reactive_transport(self):
+        alg = op.algorithms.TransientReactiveTransport(network=self.net,
+                                                       phase=self.phase,
+                                                       settings=self.settings)
+        alg.setup(t_initial=1, t_final=1000, t_step=0.1,
+                  t_output=[1.001, 1.01], t_tolerance=1e-07, t_precision=14,
+                  t_scheme='implicit', t_adaptive=True,
+                  t_error_tolerance=1e-02)
+        alg.settings.update({'rxn_tolerance': 1e-06})
+        alg.set_IC(0)
+        alg.set_value_BC(pores=self.net.pores('left'), values=2)
+        alg.set_source(propname='pore.reaction', pores=self.net.pores('right'))
+        alg.run()
+        x = [2., 1.00158, 0.00316,
+             2., 1.00158, 0.00316,
+             2., 1.00158, 0.00316]
+        y = sp.around(alg[alg.settings['quantity']], decimals=5)
+        assert sp.all(x == y)
+        # Output times are hit exactly
+        times = ['pore.concentration@1', 'pore.concentration@1001e-3',
+                 'pore.concentration@101e-2']
+        assert set(times).issubset(set(alg.keys()))
+        assert alg.settings['t_step'] == 0.1
+        # The time step is restored when the run fails
+        alg = op.algorithms.TransientReactiveTransport(network=self.net,
+                                                       phase=self.phase,
+                                                       settings=self.settings)
+        alg.setup(t_initial=1, t_final=1000, t_step=0.1, t_precision=1,
+                  t_adaptive=True, t_error_tolerance=1e-30)
+        alg.set_IC(0)
+        alg.set_value_BC(pores=self.net.pores('left'), values=2)
+        with pytest.raises(Exception):
+            alg.run()
+        assert alg.settings['t_step'] == 0.1
+
     def test_transient_cranknicolson_reactive_transport(self):
         alg = op.algorithms.TransientReactiveTransport(network=self.net,
                                                        phase=self.phase,
@@ -111,6 +111,41 @@ class BaseTest:
         b = self.net.pores(labels=['top', 'front'], mode='or')
         assert sp.all(sp.where(a)[0] == b)
 
+    def test_pores_cached_label_queries(self):
+        pn = op.network.Cubic(shape=[5, 5, 5])
+        a = pn.pores(['top', 'front'], mode='xnor')
+        query = ('pore', ('pore.front', 'pore.top'), 'xnor')
+        assert query in pn._label_cache['pore.all']
+        # Callers receive their own copy of the cached result
+        a += 1
+        assert sp.all(pn.pores(['front', 'top'], mode='xnor') == a - 1)
+        # In-place edits to a label read after the query are seen
+        pn['pore.top'][0] = True
+        assert 0 in pn.pores(['top', 'front'], mode='xnor')
+        pn['pore.foo'] = False
+        assert pn.pores('foo').size == 0
+        pn['pore.foo'][[1, 2, 3]] = True
+        assert sp.all(pn.pores('foo') == [1, 2, 3])
+        assert pn.num_pores('foo') == 3
+        # and so are edits to a label which is held during the query
+        h = pn['pore.foo']
+        assert pn.num_pores('foo') == 3
+        h[4] = True
+        assert pn.num_pores('foo') == 4
+        # Queries are cached again once no label is held elsewhere
+        del h
+        pn.pores('foo')
+        hit = pn._label_cache['pore.all'][('pore', ('pore.foo', ), 'or')]
+        assert pn.pores('foo') is not hit[1]
+        assert pn._unchanged_since([(pn, 'pore.foo'), (pn, 'pore.all')],
+                                   hit[0])
+        pn.set_label(label='top', pores=[0], mode='remove')
+        assert 0 not in pn.pores(['top', 'front'], mode='xnor')
+        # Trimming changes the size of all label arrays
+        op.topotools.trim(network=pn, pores=[124])
+        assert pn.pores('all').size == 124
+        assert pn.num_pores('top') == 24
+
     def test_pores_with_target(self):
         net = op.network.Cubic(shape=[2, 2, 2])
         geo1 = op.geometry.GenericGeometry(network=net,
@@ -638,6 +673,29 @@ class BaseTest:
         with pytest.raises(Exception):
             self.geo['throat.foo'] = 1
 
+    def test_setitem_subdict_conflicts_across_subdomains(self):
+        pn = op.network.Cubic(shape=[5, 5, 5])
+        geo1 = op.geometry.GenericGeometry(network=pn,
+                                           pores=pn.Ps[:75],
+                                           throats=pn.Ts[:75])
+        geo2 = op.geometry.GenericGeometry(network=pn,
+                                           pores=pn.Ps[75:],
+                                           throats=pn.Ts[75:])
+        geo1['pore.foo.bar'] = 1
+        with pytest.raises(Exception):
+            geo2['pore.foo'] = 1
+        with pytest.raises(Exception):
+            pn['pore.foo'] = 1
+        # A similarly named but different root is not a conflict
+        pn['pore.fo'] = 1
+        # Namespace index must follow deletions and pops
+        del geo1['pore.foo.bar']
+        geo2['pore.foo'] = 1
+        geo2.pop('pore.foo')
+        geo1.update({'pore.foo.baz': geo1['pore.all']})
+        with pytest.raises(Exception):
+            pn['pore.foo'] = 1
+
     def test_object_name_name_conflict(self):
         with pytest.raises(Exception):
             self.geo.name = self.net.name
@@ -711,6 +769,19 @@ class BaseTest:
         b = self.geo22.map_pores(pores=Ps, origin=self.net2)
         assert len(b) == 0
 
+    def test_map_pores_unsorted_and_after_trim(self):
+        pn = op.network.Cubic(shape=[5, 5, 5])
+        geo = op.geometry.GenericGeometry(network=pn, pores=pn.Ps[50:],
+                                          throats=pn.Ts)
+        b = geo.map_pores(pores=[60, 52, 10, 124], origin=pn, filtered=False)
+        assert sp.all(b.indices == [10, 2, -1, 74])
+        assert sp.all(b.mask == [True, True, False, True])
+        op.topotools.trim(network=pn, pores=[0, 51])
+        b = geo.map_pores(pores=[58, 50, 122], origin=pn)
+        assert sp.all(b == [9, 1, 73])
+        b = pn.map_pores(pores=[0, 73], origin=geo)
+        assert sp.all(b == [49, 122])
+
     def test_interleave_data_bool(self):
         net = op.network.Cubic(shape=[2, 2, 2])
         Ps = net.pores('top')
@@ -758,6 +829,50 @@ class BaseTest:
         # Ensure missing values are floats
         assert sp.sum(sp.isnan(net['pore.blah'])) == 4
 
+    def test_interleave_data_cached(self):
+        net = op.network.Cubic(shape=[2, 2, 2])
+        Ps = net.pores('top')
+        geom1 = op.geometry.GenericGeometry(network=net, pores=Ps)
+        Ps = net.pores('bottom')
+        geom2 = op.geometry.GenericGeometry(network=net, pores=Ps)
+        geom1['pore.blah'] = 1.0
+        geom2['pore.blah'] = 2.0
+        a = net['pore.blah']
+        assert 'pore.blah' in net._interleave_cache.keys()
+        # Editing the returned array must not affect the cached values
+        a[:] = 0.0
+        assert sp.sum(net['pore.blah']) == 12.0
+        # Writing to a source, in-place or not, must be seen
+        geom1['pore.blah'][0] = 5.0
+        assert sp.sum(net['pore.blah']) == 16.0
+        geom2['pore.blah'] = 3.0
+        assert sp.sum(net['pore.blah']) == 20.0
+        # Moving locations must also be seen
+        geom2._drop_locations(pores=geom2.Ps[:1])
+        assert sp.sum(sp.isnan(net['pore.blah'])) == 1
+
+    def test_interleave_data_cached_with_handles(self):
+        net = op.network.Cubic(shape=[3, 3, 1])
+        g1 = op.geometry.GenericGeometry(network=net, pores=[0, 1, 2, 3],
+                                         throats=net.Ts)
+        g2 = op.geometry.GenericGeometry(network=net, pores=[4, 5, 6, 7, 8])
+        g1['pore.d'] = sp.arange(4.0)
+        g2['pore.d'] = sp.arange(4.0, 9.0)
+        # Edits through an array handed out earlier are seen
+        h = g1['pore.d']
+        net['pore.d']
+        h[:] = 10
+        assert net['pore.d'].sum() == 70.0
+        del h
+        # Reading a subdomain between reads of the network keeps the result
+        net['pore.d']
+        hit = net._interleave_cache['pore.d']
+        g1['pore.d']
+        net['pore.d']
+        assert net._interleave_cache['pore.d'][2] is hit[2]
+        g1['pore.d'][0] = 0.0
+        assert net['pore.d'].sum() == 60.0
+
     def test_interleave_data_object(self):
         net = op.network.Cubic(shape=[2, 2, 2])
         Ps = net.pores('top')
@@ -811,6 +926,46 @@ class BaseTest:
         a = self.geo.interpolate_data(propname='pore.diameter')
         assert a.size == self.geo.Nt
 
+    def test_interpolate_data_modes(self):
+        pn = op.network.Cubic(shape=[5, 5, 1])
+        geo = op.geometry.GenericGeometry(network=pn, pores=pn.Ps[:10],
+                                          throats=pn.Ts[:12])
+        geo['throat.test'] = sp.rand(geo.Nt)
+        geo['throat.test'][0] = sp.nan
+        Ps = pn.pores(geo.name)
+        funcs = {'mean': [sp.mean, sp.nanmean],
+                 'min': [sp.amin, sp.nanmin],
+                 'max': [sp.amax, sp.nanmax]}
+        for mode in funcs.keys():
+            a = geo.interpolate_data('throat.test', mode=mode)
+            b = geo.interpolate_data('throat.test', mode=mode,
+                                     ignore_nans=True)
+            for i, P in enumerate(Ps):
+                # Only the throats on geo are used
+                Ts = pn.find_neighbor_throats(pores=P)
+                Ts = geo.map_throats(pn.filter_by_label(throats=Ts,
+                                                        labels=geo.name), pn)
+                vals = geo['throat.test'][Ts]
+                if len(Ts) == 0:
+                    assert sp.isnan(a[i]) and sp.isnan(b[i])
+                else:
+                    assert sp.allclose(a[i], funcs[mode][0](vals),
+                                       equal_nan=True)
+                    assert sp.allclose(b[i], funcs[mode][1](vals),
+                                       equal_nan=True)
+        # Weighted mean of the pores at each end, which are nan if not on geo
+        geo['pore.test'] = sp.rand(geo.Np)
+        geo['pore.weight'] = sp.rand(geo.Np)
+        a = geo.interpolate_data('pore.test', weights='pore.weight')
+        vals = sp.ones((pn.Np, ))*sp.nan
+        vals[Ps] = geo['pore.test']
+        w = sp.zeros((pn.Np, ))
+        w[Ps] = geo['pore.weight']
+        P12 = pn['throat.conns'][pn.throats(geo.name)]
+        b = sp.sum(vals[P12]*w[P12], axis=1)/sp.sum(w[P12], axis=1)
+        assert sp.any(sp.isnan(b))
+        assert sp.allclose(a, b, equal_nan=True)
+
     def test_get_no_matches(self):
         self.geo.pop('pore.blah', None)
         with pytest.raises(KeyError):
@@ -1043,6 +1198,106 @@ class BaseTest:
         pn.set_label(label='tester', mode='purge')
         # Should only issue warning
 
+    def test_pack_labels(self):
+        pn = op.network.Cubic(shape=[5, 5, 5])
+        modes = ['or', 'and', 'xor', 'nor', 'nand', 'xnor']
+        labels = ['top', 'left', 'front']
+        expected = [pn.pores(labels, mode=m) for m in modes]
+        found = pn.labels(pores=[0, 1, 2], mode='xor')
+        pn.pack_labels()
+        assert isinstance(dict.get(pn, 'pore.top'), op.utils.Bitset)
+        assert not isinstance(dict.get(pn, 'pore.all'), op.utils.Bitset)
+        for m, Ps in zip(modes, expected):
+            assert sp.all(pn.pores(labels, mode=m) == Ps)
+        assert pn.labels(pores=[0, 1, 2], mode='xor') == found
+        assert 'pore.top' in pn.labels()
+        # set_label edits the packed bits
+        pn.set_label(label='top', pores=[0, 1])
+        assert isinstance(dict.get(pn, 'pore.top'), op.utils.Bitset)
+        assert set([0, 1]).issubset(pn.pores('top'))
+        pn.set_label(label='top', pores=[0], mode='remove')
+        assert 0 not in pn.pores('top')
+        # Retrieving a label gives a read-only copy and keeps it packed
+        top = pn['pore.top']
+        assert top.dtype == bool
+        assert sp.all(sp.where(top)[0] == pn.pores('top'))
+        with pytest.raises(ValueError):
+            top[2] = True
+        assert isinstance(dict.get(pn, 'pore.top'), op.utils.Bitset)
+        # Queries mixing packed and unpacked labels are also supported
+        pn['pore.left'] = pn['pore.left'].copy()
+        assert not isinstance(dict.get(pn, 'pore.left'), op.utils.Bitset)
+        for m, Ps in zip(modes, expected):
+            if m in ['or', 'nor']:  # Unaffected by the label changes above
+                assert sp.all(pn.pores(labels, mode=m) == Ps)
+        # Labels are packed on writing if requested
+        pn.settings['pack_labels'] = True
+        pn['pore.new'] = True
+        assert isinstance(dict.get(pn, 'pore.new'), op.utils.Bitset)
+        assert pn.num_pores('new') == pn.Np
+
+    def test_single_precision_policy(self):
+        ws = op.Workspace()
+        proj = ws.new_project()
+        proj.settings['precision'] = 'single'
+        pn = op.network.Cubic(shape=[4, 4, 4], project=proj)
+        assert pn['throat.conns'].dtype == sp.int32
+        assert pn['pore.coords'].dtype == sp.float32
+        geo = op.geometry.StickAndBall(network=pn, pores=pn.Ps,
+                                       throats=pn.Ts)
+        assert geo['pore.diameter'].dtype == sp.float32
+        # Integers which don't fit are left as they are
+        pn['pore.big'] = 2**40
+        assert pn['pore.big'].dtype == sp.int64
+        # Solvers are assembled and run in double precision
+        water = op.phases.Water(network=pn)
+        phys = op.physics.Standard(network=pn, phase=water, geometry=geo)
+        assert phys['throat.hydraulic_conductance'].dtype == sp.float32
+        sf = op.algorithms.StokesFlow(network=pn, phase=water)
+        sf.set_value_BC(pores=pn.pores('left'), values=1)
+        sf.set_value_BC(pores=pn.pores('right'), values=0)
+        sf.run()
+        assert sf.A.dtype == sp.float64
+        assert sf['pore.pressure'].dtype == sp.float64
+        # The Workspace setting is used if the project has none
+        proj.settings['precision'] = None
+        ws.settings['precision'] = 'single'
+        pn['pore.test'] = 1.0
+        assert pn['pore.test'].dtype == sp.float32
+        ws.settings['precision'] = 'double'
+        pn['pore.test'] = 1.0
+        assert pn['pore.test'].dtype == sp.float64
+
+    def test_memory_report(self):
+        pn = op.network.Cubic(shape=[4, 4, 4])
+        pn['pore.test'] = 1.0
+        report = pn.memory_report(astype='dict')[pn.name]
+        assert report['pore.test'] == pn.Np*8
+        assert report['pore.all'] == pn.Np
+        assert sum(report.values()) == pn.nbytes
+        # Cached matrices are only included on request
+        pn.get_adjacency_matrix(fmt='csr')
+        assert '_am' not in report.keys()
+        report = pn.memory_report(caches=True, astype='dict')[pn.name]
+        assert report['_am'] > 0
+        # Cached label queries are stored under several keys but counted once
+        pn.pores(['top', 'left'])
+        inds = {id(v[1]): v[1] for q in pn._label_cache.values()
+                for v in q.values()}
+        report = pn.memory_report(caches=True, astype='dict')[pn.name]
+        assert report['_label_cache'] == sum([v.nbytes for v in inds.values()])
+        # The results kept by memoized models are included
+        geo = op.geometry.GenericGeometry(network=pn, pores=pn.Ps)
+        geo.add_model(propname='pore.seed', model=op.models.misc.random,
+                      element='pore', regen_mode='memoized')
+        report = geo.memory_report(caches=True, astype='dict')[geo.name]
+        assert report['memo.pore.seed'] == pn.Np*8
+        df = pn.memory_report(astype='pandas')
+        assert df.groupby('type')['bytes'].sum()['label'] > 0
+        s = pn.memory_report().split('\n')
+        assert len(s) == 3 + 2*len(pn.keys()) + 2
+        assert s[3].split('|')[3].strip() == 'throat.conns'
+
 
 if __name__ == '__main__':
 
@@ -2,6 +2,7 @@ import openpnm as op
 import numpy as np
 import openpnm.models as mods
 import pytest
+import tracemalloc
 from testfixtures import LogCapture
 
 
@@ -175,6 +176,267 @@ class ModelsTest:
         geo.regenerate_models()
         assert len(geo.props()) == 16
 
+    def test_regenerate_models_incremental(self):
+        pn = op.network.Cubic(shape=[5, 5, 5])
+        geo = op.geometry.StickAndBall(network=pn, pores=pn.Ps, throats=pn.Ts)
+        phase = op.phases.Water(network=pn)
+        phys = op.physics.Standard(network=pn, phase=phase, geometry=geo)
+        phase.regenerate_models(deep=True, mode='incremental')
+        assert phase.stale_models() == []
+        assert phys.stale_models() == []
+        # Retrieving data does not make models stale
+        phase['pore.temperature']
+        assert phase.stale_models() == []
+        # Changing an input makes its models and their dependents stale
+        phase['pore.temperature'][0] = 350.0
+        assert 'pore.viscosity' in phase.stale_models()
+        assert 'throat.viscosity' in phase.stale_models()
+        assert 'pore.surface_tension' in phase.stale_models()
+        mu = phase['pore.viscosity'].copy()
+        g = phys['throat.hydraulic_conductance'].copy()
+        phase.regenerate_models(deep=True, mode='incremental')
+        assert mu[0] != phase['pore.viscosity'][0]
+        assert not np.all(g == phys['throat.hydraulic_conductance'])
+        assert phase.stale_models() == []
+        assert phys.stale_models() == []
+        # Changing parameters or removing data also makes models stale
+        phase.models['pore.density']['temperature'] = 'pore.temperature'
+        assert phase.stale_models() == []
+        phase.models['pore.density']['salinity'] = 'pore.foo'
+        assert phase.stale_models(propnames='pore.density') == ['pore.density']
+        phase.models['pore.density']['salinity'] = 'pore.salinity'
+        phase.regenerate_models(mode='incremental')
+        del phase['pore.density']
+        assert phase.stale_models() == ['pore.density', 'pore.molar_density']
+        phase.regenerate_models(mode='incremental')
+        assert 'pore.density' in phase.keys()
+        with pytest.raises(Exception):
+            phase.regenerate_models(mode='blah')
+
+    def test_input_checksums_include_shape_and_dtype(self):
+        from openpnm.core.ModelsMixin import _checksum
+        a = np.zeros(4, dtype=np.int32)
+        assert _checksum(a) == _checksum(a.copy())
+        # The same bytes viewed as another type or shape are not the same
+        assert _checksum(a) != _checksum(a.view(np.float64))
+        assert _checksum(a) != _checksum(a.reshape(2, 2))
+        a[0] = 1
+        assert _checksum(a) != _checksum(np.zeros(4, dtype=np.int32))
+
+    def test_regenerate_models_with_workers(self):
+        pn = op.network.Cubic(shape=[5, 5, 5])
+        Ps = pn['pore.coords'][:, 0] < 2
+        Ts = pn.find_neighbor_throats(pores=Ps, mode='xnor')
+        geo1 = op.geometry.StickAndBall(network=pn, pores=Ps, throats=Ts)
+        geo2 = op.geometry.StickAndBall(network=pn, pores=~Ps,
+                                        throats=pn.tomask(throats=Ts) == 0)
+        phase = op.phases.Water(network=pn)
+        phys1 = op.physics.Standard(network=pn, phase=phase, geometry=geo1)
+        phys2 = op.physics.Standard(network=pn, phase=phase, geometry=geo2)
+        objs = [geo1, geo2, phase, phys1, phys2]
+        results = []
+        for workers in [1, 4]:
+            np.random.seed(0)
+            pn.regenerate_models(deep=True, workers=workers)
+            phase.regenerate_models(deep=True, workers=workers)
+            # Only compare model data, since some models also write to phase
+            results.append({(obj.name, k): obj[k].copy()
+                            for obj in objs for k in obj.props()
+                            if k.rsplit('.', 1)[0] in obj.models.keys()
+                            or k in obj.models.keys()})
+        assert results[0].keys() == results[1].keys()
+        for k in results[0].keys():
+            assert np.array_equal(results[0][k], results[1][k])
+        # Number of workers can also be given in settings
+        geo1.clear(mode='model_data')
+        geo1.settings['regen_workers'] = 2
+        geo1.regenerate_models()
+        assert len(geo1.props()) == len(geo2.props())
+
+    def test_regenerate_random_models_with_workers(self):
+        pn = op.network.Cubic(shape=[6, 6, 6])
+        x = pn['pore.coords'][:, 0]
+        geos = []
+        for i in range(4):
+            Ps = (x > i) & (x < i + 1)
+            Ts = pn.find_neighbor_throats(pores=Ps, mode='xnor')
+            geo = op.geometry.GenericGeometry(network=pn, pores=Ps, throats=Ts)
+            geo.settings['profile_models'] = True
+            for j in range(3):
+                geo.add_model(propname='pore.rand_'+str(j),
+                              model=mods.misc.random, element='pore')
+            geo.add_model(propname='pore.sum', model=mods.misc.summation,
+                          props=['pore.rand_0', 'pore.rand_1'])
+            geos.append(geo)
+        results = []
+        for workers in [1, 4]:
+            np.random.seed(0)
+            pn.regenerate_models(deep=True, workers=workers)
+            results.append([geo[k].copy() for geo in geos
+                            for k in geo.models.keys()])
+        for a, b in zip(*results):
+            assert np.array_equal(a, b)
+        # Changes made while running on workers are applied afterwards
+        for geo in geos:
+            assert geo.profile_models()['pore.sum']['calls'] == 3
+            assert geo.stale_models() == []
+
+    def test_dependency_list_cached(self):
+        pn = op.network.Cubic(shape=[3, 3, 3])
+        geo = op.geometry.StickAndBall(network=pn, pores=pn.Ps, throats=pn.Ts)
+        order = geo.models.dependency_list()
+        info = geo.models.dependency_cache_info()
+        assert info['valid']
+        geo.regenerate_models()
+        assert geo.models.dependency_cache_info()['misses'] == info['misses']
+        assert geo.models.dependency_cache_info()['hits'] > info['hits']
+        # Changing the parameters of a model invalidates the cache
+        geo.models['pore.diameter']['prop1'] = 'pore.seed'
+        assert not geo.models.dependency_cache_info()['valid']
+        dtree = geo.models.dependency_graph()
+        assert 'pore.max_size' not in dtree.predecessors('pore.diameter')
+        geo.models['pore.diameter']['prop1'] = 'pore.max_size'
+        assert geo.models.dependency_list() == order
+        # As does adding or removing models
+        geo.add_model(propname='pore.blah', model=mods.misc.constant,
+                      value=1)
+        assert 'pore.blah' in geo.models.dependency_list()
+        geo.remove_model('pore.blah')
+        assert geo.models.dependency_list() == order
+        # The graph handed out is a copy
+        geo.models.dependency_graph().remove_node('pore.seed')
+        assert geo.models.dependency_list() == order
+
+    def test_regen_mode_memoized(self):
+        pn = op.network.Cubic(shape=[3, 3, 3])
+        calls = []
+
+        def double(target, prop='pore.seed'):
+            calls.append(1)
+            return target[prop]*2
+
+        pn['pore.seed'] = np.random.rand(pn.Np)
+        pn.add_model(propname='pore.double', model=double,
+                     regen_mode='memoized')
+        assert len(calls) == 1
+        pn.regenerate_models(propnames='pore.double')
+        assert len(calls) == 1
+        assert np.allclose(pn['pore.double'], pn['pore.seed']*2)
+        # Editing the result in-place does not alter the stored copy
+        pn['pore.double'][:] = 0
+        pn.regenerate_models(propnames='pore.double')
+        assert np.allclose(pn['pore.double'], pn['pore.seed']*2)
+        # A change of inputs re-runs the model
+        old = pn['pore.seed'].copy()
+        pn['pore.seed'] = old + 1
+        pn.regenerate_models(propnames='pore.double')
+        assert len(calls) == 2
+        assert np.allclose(pn['pore.double'], (old + 1)*2)
+        # Previous inputs are recalled
+        pn['pore.seed'] = old
+        pn.regenerate_models(propnames='pore.double')
+        assert len(calls) == 2
+        assert np.allclose(pn['pore.double'], old*2)
+        # As are changes to parameters
+        pn['pore.other'] = old
+        pn.models['pore.double']['prop'] = 'pore.other'
+        pn.regenerate_models(propnames='pore.double')
+        assert len(calls) == 3
+        # Only memo_size results are kept
+        pn.settings['memo_size'] = 1
+        pn['pore.other'] = old + 2
+        pn.regenerate_models(propnames='pore.double')
+        assert len(calls) == 4
+        pn['pore.other'] = old
+        pn.regenerate_models(propnames='pore.double')
+        assert len(calls) == 5
+
+    def test_profile_models(self):
+        pn = op.network.Cubic(shape=[3, 3, 3])
+        geo = op.geometry.StickAndBall(network=pn, pores=pn.Ps, throats=pn.Ts)
+        assert geo.profile_models() == {}
+        geo.settings['profile_models'] = True
+        geo.regenerate_models()
+        geo.regenerate_models(propnames='pore.diameter')
+        profile = geo.profile_models()
+        assert profile.keys() == geo.models.keys()
+        assert profile['pore.diameter']['calls'] == 2
+        assert profile['pore.seed']['calls'] == 1
+        assert profile['pore.diameter']['size'] == pn.Np*8
+        assert profile['pore.diameter']['allocated'] is None
+        assert profile['pore.diameter']['time'] >= 0
+        table = op.utils.misc.profile_to_table(geo, sort='calls')
+        assert 'pore.diameter' in table.split('\n')[3]
+        geo.settings['profile_models'] = 'memory'
+        geo.regenerate_models(propnames='pore.diameter')
+        profile = geo.profile_models(reset=True)
+        tracemalloc.stop()
+        assert profile['pore.diameter']['allocated'] > 0
+        assert geo.profile_models() == {}
+
+    def test_lazy_models(self):
+        pn = op.network.Cubic(shape=[3, 3, 3])
+        pn.project.settings['lazy_models'] = True
+        geo = op.geometry.StickAndBall(network=pn, pores=pn.Ps,
+                                       throats=pn.Ts)
+        # Models are not run when added
+        assert 'pore.diameter' not in geo.keys()
+        # Reading a value runs its model and those it depends on
+        vol = geo['pore.volume'].copy()
+        assert 'pore.diameter' in geo.keys()
+        assert 'throat.volume' not in geo.keys()
+        # Values on subdomains are found when read from the network
+        assert pn['throat.length'].shape == (pn.Nt, )
+        assert 'throat.length' in geo.keys()
+        # Changing an input causes the values to be updated when next read
+        geo['pore.seed'] = 0.5
+        assert not np.allclose(geo['pore.volume'], vol)
+        vol = geo['pore.volume'].copy()
+        geo.models['pore.volume']['model'] = mods.geometry.pore_volume.cube
+        assert not np.allclose(geo['pore.volume'], vol)
+        # Regenerating only marks models to be run when next read
+        geo['pore.diameter'] = 1.0
+        geo.regenerate_models(propnames=['pore.diameter'])
+        assert np.all(geo.get('pore.diameter') == 1.0)
+        assert not np.all(geo['pore.diameter'] == 1.0)
+        # Properties are computed across objects when first read
+        water = op.phases.Water(network=pn)
+        phys = op.physics.GenericPhysics(network=pn, phase=water,
+                                         geometry=geo)
+        phys.add_model(propname='throat.hydraulic_conductance',
+                       model=mods.physics.hydraulic_conductance.hagen_poiseuille)
+        assert 'throat.hydraulic_conductance' not in phys.keys()
+        g = water['throat.hydraulic_conductance']
+        assert np.all(g > 0)
+        assert 'pore.viscosity' in water.keys()
+        # Phase values read through a physics are brought up to date
+        water.add_model(propname='pore.double', model=mods.misc.scaled,
+                        prop='pore.temperature', factor=2)
+        assert np.all(phys['pore.double'] == 2*water['pore.temperature'])
+        water['pore.temperature'] = 400.0
+        assert np.all(phys['pore.double'] == 800.0)
+        # and the models of sibling subdomains gathered by a subdomain are run
+        pn2 = op.network.Cubic(shape=[3, 1, 1])
+        pn2.project.settings['lazy_models'] = True
+        geo1 = op.geometry.GenericGeometry(network=pn2, pores=[1, 2])
+        geo2 = op.geometry.GenericGeometry(network=pn2, pores=[0])
+        geo2['pore.base'] = 1.0
+        geo2.add_model(propname='pore.half', model=mods.misc.scaled,
+                       prop='pore.base', factor=0.5)
+        geo1['pore.half']
+        assert np.all(geo2.get('pore.half') == 0.5)
+        geo2['pore.base'] = 4.0
+        geo1['pore.half']
+        assert np.all(geo2.get('pore.half') == 2.0)
+        pn2.project.settings['lazy_models'] = False
+        # The setting is tracked, so reads only look for it once enabled
+        from openpnm.utils import SettingsDict
+        enabled = SettingsDict._enabled['lazy_models']
+        assert id(pn.project.settings) in enabled.keys()
+        pn.project.settings['lazy_models'] = False
+        assert id(pn.project.settings) not in enabled.keys()
+        assert not geo._lazy_models()
+
 
 if __name__ == '__main__':
 
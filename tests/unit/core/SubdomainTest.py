@@ -125,6 +125,33 @@ class SubdomainTest:
         with pytest.raises(Exception):
             pn['pore.bee.bop'] = 1
 
+    def test_getitem_gathers_from_boss_and_siblings(self):
+        pn = op.network.Cubic(shape=[3, 3, 3])
+        geo1 = op.geometry.GenericGeometry(network=pn,
+                                           pores=pn.Ps[:15],
+                                           throats=pn.Ts[:30])
+        geo2 = op.geometry.GenericGeometry(network=pn,
+                                           pores=pn.Ps[15:],
+                                           throats=pn.Ts[30:])
+        pn['pore.foo'] = sp.arange(pn.Np)
+        assert sp.all(geo2['pore.foo'] == pn['pore.foo'][15:])
+        geo1['pore.int'] = 1
+        geo1['pore.bool'] = True
+        # Values held only on a sibling are missing on this subdomain
+        assert sp.all(sp.isnan(geo2['pore.int']))
+        assert not sp.any(geo2['pore.bool'])
+        assert geo2['pore.bool'].dtype == bool
+        # Results must agree with indexing into the interleaved array
+        Ps = pn.pores(geo2.name)
+        assert sp.all(sp.isnan(pn['pore.int'][Ps]))
+        # Location maps must follow changes to the subdomains' locations
+        geo2._drop_locations(pores=[15])
+        geo1._add_locations(pores=[15])
+        geo1['pore.float'] = 1.0
+        assert sp.sum(pn['pore.float'] == 1.0) == 16
+        assert sp.all(sp.isnan(geo2['pore.float']))
+        assert geo2['pore.foo'][0] == 16
+
 
 if __name__ == '__main__':
 
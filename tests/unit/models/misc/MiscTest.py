@@ -193,6 +193,37 @@ class MiscTest:
                     ignore_nans=True, mode='mean')
         assert sp.all(~sp.isnan(no_nans))
 
+    def test_neighbor_throats_on_subdomain(self):
+        net = op.network.Cubic(shape=[4, 4, 4])
+        geo1 = op.geometry.GenericGeometry(network=net, pores=net.Ps[:20],
+                                           throats=net.Ts[:60])
+        op.geometry.GenericGeometry(network=net, pores=net.Ps[20:],
+                                    throats=net.Ts[60:])
+        net['throat.values'] = sp.rand(net.Nt)
+        net['throat.values'][::4] = sp.nan
+        f = mods.from_neighbor_throats
+        # All neighboring throats are used, including those on other geoms
+        Ts = net.find_neighbor_throats(pores=net.pores(geo1.name),
+                                       flatten=False)
+        vals = net['throat.values']
+        a = f(target=geo1, throat_prop='throat.values', mode='max',
+              ignore_nans=True)
+        assert sp.allclose(a, [sp.nanmax(vals[t]) for t in Ts],
+                           equal_nan=True)
+        a = f(target=geo1, throat_prop='throat.values', mode='mean',
+              ignore_nans=False)
+        assert sp.allclose(a, [sp.mean(vals[t]) for t in Ts], equal_nan=True)
+
+    def test_neighbor_pores_all_nans(self):
+        net = op.network.Cubic(shape=[3, 1, 1])
+        net['pore.values'] = [sp.nan, sp.nan, 1.0]
+        f = mods.from_neighbor_pores
+        for mode in ['min', 'max', 'mean']:
+            a = f(target=net, pore_prop='pore.values', mode=mode,
+                  ignore_nans=True)
+            assert sp.isnan(a[0])
+            assert a[1] == 1.0
+
     def test_from_neighbor_pores_min(self):
         self.geo.remove_model('throat.seed')
         self.geo['pore.seed'] = sp.rand(self.net.Np,)
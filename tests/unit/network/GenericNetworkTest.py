@@ -170,6 +170,20 @@ class GenericNetworkTest:
         assert sp.size(a) == 17
         assert sp.all(sp.in1d([0, 1], a))
 
+    def test_writing_conns_clears_matrices(self):
+        net = op.network.Cubic(shape=[4, 4, 4])
+        net.get_adjacency_matrix(fmt='csr')
+        net.get_incidence_matrix(fmt='coo')
+        net['throat.conns'] = net['throat.conns'][::-1]
+        assert len(net._am) == 0
+        assert len(net._im) == 0
+        assert net.get_adjacency_matrix(fmt='csr').nnz == 2*net.Nt
+        # Subscriptions follow the subscriber when it is renamed
+        net.name = 'renamed'
+        net.get_adjacency_matrix()
+        net['throat.conns'] = net['throat.conns']
+        assert len(net._am) == 0
+
 
 if __name__ == '__main__':
 
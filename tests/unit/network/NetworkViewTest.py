@@ -0,0 +1,112 @@
+import openpnm as op
+import scipy as sp
+import pickle
+import pytest
+
+
+class NetworkViewTest:
+    def setup_class(self):
+        self.net = op.network.Cubic(shape=[6, 6, 6])
+        self.geo = op.geometry.StickAndBall(network=self.net,
+                                            pores=self.net.Ps,
+                                            throats=self.net.Ts)
+        self.air = op.phases.Air(network=self.net)
+        self.phys = op.physics.Standard(network=self.net, phase=self.air,
+                                        geometry=self.geo)
+
+    def teardown_class(self):
+        ws = op.Workspace()
+        ws.clear()
+
+    def test_topology(self):
+        Ps = self.net.pores('left')
+        sub = self.net.view(pores=Ps)
+        assert sub.project is not self.net.project
+        assert sub.Np == 36
+        assert sub.Nt == 60
+        assert sp.all(sub.pore_map == Ps)
+        conns = self.net['throat.conns'][sub.throat_map]
+        assert sp.all(sub.pore_map[sub['throat.conns']] == conns)
+        assert sp.all(sub.find_neighbor_pores(pores=0) == [1, 6])
+        assert sp.all(self.net.map_pores(pores=sub.Ps, origin=sub) == Ps)
+
+    def test_given_throats(self):
+        Ps = self.net.pores('left')
+        Ts = self.net.find_neighbor_throats(pores=Ps, mode='xnor')
+        sub = self.net.view(pores=Ps, throats=Ts[:10])
+        assert sub.Nt == 10
+        with pytest.raises(Exception):
+            self.net.view(pores=Ps, throats=self.net.Ts)
+
+    def test_gathered_data(self):
+        sub = self.net.view(pores=self.net.pores('top'))
+        vals = self.net['pore.diameter'][sub.pore_map]
+        assert sp.all(sub['pore.diameter'] == vals)
+        assert 'pore.diameter' in sub.props()
+        assert 'pore.diameter' not in sub.keys()
+        assert sp.all(sub.pores('left') == sp.where(sub['pore.left'])[0])
+        assert 'pore.left' in sub.labels(pores=0)
+        # Values held by subdomains are read without interleaving them all
+        self.net._interleave_cache.clear()
+        sub['throat.length']
+        assert 'throat.length' not in self.net._interleave_cache.keys()
+        # Changes to the parent are seen by the view
+        self.geo['pore.diameter'] = 2.0
+        assert sp.all(sub['pore.diameter'] == 2.0)
+        # Values written to the view are stored on it only
+        sub['pore.diameter'] = 3.0
+        assert sp.all(sub['pore.diameter'] == 3.0)
+        assert sp.all(self.geo['pore.diameter'] == 2.0)
+        self.geo.regenerate_models()
+
+    def test_phase_views(self):
+        sub = self.net.view(pores=self.net.pores('front'))
+        phase = sub.project[self.air.name]
+        assert isinstance(phase, op.phases.PhaseView)
+        assert phase.Nt == sub.Nt
+        T = self.air['pore.temperature'][sub.pore_map]
+        assert sp.all(phase['pore.temperature'] == T)
+        g = self.air['throat.diffusive_conductance'][sub.throat_map]
+        assert sp.all(phase['throat.diffusive_conductance'] == g)
+
+    def test_transport(self):
+        sub = self.net.view(pores=self.net.pores('front'))
+        phase = sub.project[self.air.name]
+        alg = op.algorithms.FickianDiffusion(network=sub, phase=phase)
+        alg.set_value_BC(pores=sub.pores('left'), values=1)
+        alg.set_value_BC(pores=sub.pores('right'), values=0)
+        alg.run()
+        rate = alg.rate(pores=sub.pores('left'))
+        # The cached matrix is discarded when the parent's values change
+        g = self.phys['throat.diffusive_conductance']
+        self.phys['throat.diffusive_conductance'] = 2*g
+        alg.run()
+        assert sp.allclose(alg.rate(pores=sub.pores('left')), 2*rate)
+        self.phys['throat.diffusive_conductance'] = g
+        assert 'pore.mole_fraction' not in self.air.keys()
+
+    def test_copy_and_pickle(self):
+        sub = self.net.view(pores=self.net.pores('bottom'))
+        vals = sub['pore.diameter']
+        proj = pickle.loads(pickle.dumps(sub.project))
+        assert sp.all(proj.network['pore.diameter'] == vals)
+        proj = sub.project.copy()
+        assert sp.all(proj.network['pore.diameter'] == vals)
+
+    def test_export(self):
+        sub = self.net.view(pores=self.net.pores('bottom'))
+        phase = sub.project[self.air.name]
+        d = op.io.Dict.to_dict(network=sub, phases=[phase])
+        assert len(d[sub.name]['pore.diameter']) == sub.Np
+        assert len(d[phase.name]['throat.diffusive_conductance']) == sub.Nt
+
+
+if __name__ == '__main__':
+
+    t = NetworkViewTest()
+    self = t
+    t.setup_class()
+    for item in t.__dir__():
+        if item.startswith('test'):
+            print('running test: '+item)
+            t.__getattribute__(item)()
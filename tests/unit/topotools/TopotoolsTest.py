@@ -1,5 +1,6 @@
 import openpnm as op
 import numpy as np
+import scipy.sparse as sprs
 from numpy.testing import assert_allclose
 from openpnm import topotools
 import pytest
@@ -25,6 +26,30 @@ class TopotoolsTest:
         h = net.check_network_health()
         assert h.health
 
+    def test_reduce_neighbor_values(self):
+        net = op.network.Cubic(shape=[4, 4, 1])
+        im = net.get_incidence_matrix(fmt='csr')
+        vals = np.random.rand(net.Nt)
+        vals[3] = np.nan
+        neighbors = net.find_neighbor_throats(pores=net.Ps, flatten=False)
+        for mode in ['mean', 'min', 'max', 'sum']:
+            a = topotools.reduce_neighbor_values(im, vals, mode=mode)
+            b = topotools.reduce_neighbor_values(im, vals, mode=mode,
+                                                 ignore_nans=True)
+            for i, Ts in enumerate(neighbors):
+                func = getattr(np, mode)
+                assert_allclose(a[i], func(vals[Ts]))
+                assert_allclose(b[i], getattr(np, 'nan'+mode)(vals[Ts]))
+        w = np.random.rand(net.Nt)
+        a = topotools.reduce_neighbor_values(im, vals, weights=w,
+                                             ignore_nans=True)
+        Ts = neighbors[0]
+        assert_allclose(a[0], np.average(vals[Ts], weights=w[Ts]))
+        # Rows without any values give nan
+        im = sprs.csr_matrix(([1.0, 1.0], ([0, 2], [0, 1])), shape=(3, 2))
+        a = topotools.reduce_neighbor_values(im, [2.0, 3.0], mode='max')
+        assert_allclose(a, [2.0, np.nan, 3.0])
+
     def test_label_faces(self):
         net = op.network.Cubic(shape=[3, 3, 3], connectivity=6)
         net.clear(mode='labels')
@@ -3,6 +3,8 @@ import scipy as sp
 import pytest
 from pathlib import Path
 import os
+import pickle
+from copy import deepcopy
 
 
 class ProjectTest:
@@ -120,6 +122,16 @@ class ProjectTest:
         assert phys22 in proj
         self.ws.close_project(proj)
 
+    def test_purge_forgets_subscriptions(self):
+        proj = self.ws.copy_project(self.net.project)
+        net = proj.network
+        geo1 = proj.geometries()['geo_01']
+        net.subscribe(geo1._clear_label_cache, keys='pore.test')
+        proj.purge_object(geo1)
+        assert ('geo_01', '_clear_label_cache') not in \
+            net._subscribers['pore.test']
+        net['pore.test'] = 1.0
+
     def test_purge_phys_shallow(self):
         proj = self.ws.copy_project(self.net.project)
         phase = proj.phases()['phase_01']
@@ -410,6 +422,150 @@ class ProjectTest:
                               filetype='mat')
         os.remove(fname+'.mat')
 
+    def test_profile_models(self):
+        proj = self.ws.new_project()
+        net = op.network.Cubic(shape=[3, 3, 3], project=proj)
+        geo = op.geometry.StickAndBall(network=net, pores=net.Ps,
+                                       throats=net.Ts)
+        phase = op.phases.Water(network=net)
+        geo.settings['profile_models'] = True
+        phase.settings['profile_models'] = True
+        proj._regenerate_models()
+        s = proj.profile_models().split('\n')
+        n = len(geo.models) + len(phase.models)
+        assert len(s) == 3 + 2*n
+        assert s[3].split('|')[2].strip() in [geo.name, phase.name]
+        proj.profile_models(reset=True)
+        assert len(proj.profile_models().split('\n')) == 3
+
+    def test_memmap_storage(self):
+        proj = self.ws.new_project()
+        net = op.network.Cubic(shape=[3, 3, 3], project=proj)
+        geo = op.geometry.StickAndBall(network=net, pores=net.Ps,
+                                       throats=net.Ts)
+        diam = geo['pore.diameter'].copy()
+        storage = op.utils.MemmapStorage()
+        tmpdir = storage.path
+        proj.storage = storage
+        assert isinstance(geo['pore.diameter'], sp.memmap)
+        assert sp.all(geo['pore.diameter'] == diam)
+        # Objects created later also use the storage
+        phase = op.phases.Air(network=net)
+        assert isinstance(phase['pore.temperature'], sp.memmap)
+        # In-place edits are written through to the file
+        geo['pore.diameter'][0] = 100.0
+        fname = geo['pore.diameter'].filename
+        assert sp.memmap(fname, dtype=float)[0] == 100.0
+        # Files are named after the object and key, and are replaced when
+        # the array is overwritten or removed when it is deleted
+        assert os.path.basename(fname) == '_'.join([proj.name, geo.name,
+                                                    'pore.diameter.dat'])
+        n = len(os.listdir(tmpdir))
+        geo['pore.diameter'] = diam
+        assert geo['pore.diameter'].filename == fname
+        assert len(os.listdir(tmpdir)) == n
+        del geo['pore.diameter']
+        assert len(os.listdir(tmpdir)) == n - 1
+        geo.regenerate_models()
+        assert isinstance(geo['pore.diameter'], sp.memmap)
+        # Purging an object removes its files
+        name = phase.name
+        temperature = phase['pore.temperature']
+        assert any([name in f for f in os.listdir(tmpdir)])
+        proj.purge_object(phase)
+        assert not any([name in f for f in os.listdir(tmpdir)])
+        assert sp.all(temperature == 298.0)
+        # Removing the storage moves arrays back into memory
+        proj.storage = None
+        assert not isinstance(geo['pore.diameter'], sp.memmap)
+        assert len(os.listdir(tmpdir)) == 0
+        storage.close()
+        assert not os.path.exists(tmpdir)
+
+    def test_memory_report(self):
+        proj = self.ws.new_project()
+        net = op.network.Cubic(shape=[3, 3, 3], project=proj)
+        net['pore.volume'] = 1.0
+        phase = op.phases.GenericPhase(network=net)
+        phase['throat.diffusive_conductance'] = 1.0
+        alg = op.algorithms.TransientFickianDiffusion(network=net,
+                                                      phase=phase)
+        alg.set_value_BC(pores=net.pores('left'), values=1)
+        alg.set_IC(0)
+        alg.setup(t_final=2, t_output=1, t_step=1)
+        alg.run()
+        net.get_adjacency_matrix(fmt='coo')
+        df = proj.memory_report(astype='pandas')
+        assert set(df['object']) == set(proj.names)
+        kinds = df.groupby('type')['bytes'].sum()
+        assert kinds['transient'] > 0
+        assert kinds['cache'] > 0
+        caches = df[df['type'] == 'cache']
+        assert '_am' in list(caches[caches['object'] == net.name]['key'])
+        assert '_A_t' in list(caches[caches['object'] == alg.name]['key'])
+        report = proj.memory_report(caches=False, astype='dict')
+        assert sum(report[alg.name].values()) == alg.nbytes
+
+    def test_copy_shares_arrays(self):
+        proj = self.ws.new_project()
+        net = op.network.Cubic(shape=[3, 3, 3], project=proj)
+        geo = op.geometry.StickAndBall(network=net, pores=net.Ps,
+                                       throats=net.Ts)
+        coords = net['pore.coords'].copy()
+        proj2 = proj.copy()
+        proj3 = self.ws.copy_project(proj)
+        net2, net3 = proj2.network, proj3.network
+        geo2 = proj2[geo.name]
+        assert isinstance(net2['pore.coords'], op.utils.SharedArray)
+        assert sp.shares_memory(net2['pore.coords'], net['pore.coords'])
+        assert sp.shares_memory(net3['pore.coords'], net['pore.coords'])
+        # Writing with __setitem__ replaces the array
+        geo2['pore.diameter'] = 1.0
+        assert not sp.any(geo['pore.diameter'] == 1.0)
+        # In-place writes unshare the written array only
+        net2['pore.coords'][:, 0] += 1.0
+        assert sp.all(net['pore.coords'] == coords)
+        assert sp.all(net3['pore.coords'] == coords)
+        assert sp.all(net2['pore.coords'][:, 0] == coords[:, 0] + 1.0)
+        assert not sp.shares_memory(net2['pore.coords'], net['pore.coords'])
+        assert sp.shares_memory(net3['pore.coords'], net['pore.coords'])
+        # A handle to the written array stays valid
+        temp = net['pore.coords']
+        temp[0] = 0.0
+        assert sp.all(net['pore.coords'][0] == 0.0)
+        assert sp.all(net3['pore.coords'][0] == coords[0])
+        # Labels set in-place are unshared too
+        net3.set_label(pores=[0], label='left', mode='remove')
+        assert net['pore.left'][0] and not net3['pore.left'][0]
+        # Copies of shared arrays are ordinary arrays
+        assert type(deepcopy(net3['pore.all'])) is sp.ndarray
+        assert type(pickle.loads(pickle.dumps(net['pore.all']))) is sp.ndarray
+
+    def test_copy_protects_handles_taken_before_copy(self):
+        proj = self.ws.new_project()
+        net = op.network.Cubic(shape=[3, 3, 3], project=proj)
+        handle = net['pore.coords']
+        coords = handle.copy()
+        proj2 = proj.copy()
+        # The shared data can't be changed through the old handle
+        with pytest.raises(ValueError):
+            handle[0] = 99.0
+        assert sp.all(proj2.network['pore.coords'] == coords)
+        # Nor once the copy has written to, and so taken, the shared data
+        proj2.network['pore.coords'][0] = 1.0
+        with pytest.raises(ValueError):
+            handle[1] = 99.0
+        assert sp.all(proj2.network['pore.coords'][1:] == coords[1:])
+        assert sp.all(net['pore.coords'] == coords)
+        # Once the original writes, an old handle is its array again
+        handle = net['pore.coords']
+        coords = handle.copy()
+        proj3 = proj.copy()
+        net['pore.coords'][0] = 2.0
+        handle[1] = 2.0
+        assert sp.all(net['pore.coords'][:2] == 2.0)
+        assert sp.all(proj3.network['pore.coords'] == coords)
+
 
 if __name__ == '__main__':
 
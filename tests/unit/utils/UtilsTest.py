@@ -85,6 +85,47 @@ class UtilsTest:
         assert not op.utils.misc.is_symmetric(ad.A)
 
 
+    def test_bitset(self):
+        mask = sp.rand(21) > 0.5
+        b = op.utils.Bitset(mask)
+        assert b.nbytes == 3
+        assert sp.all(sp.array(b) == mask)
+        assert sp.all(b[[0, 5, -1]] == mask[[0, 5, -1]])
+        assert sp.all(b[2:7] == mask[2:7])
+        assert b.count() == mask.sum()
+        assert sp.all((~b).indices() == sp.where(~mask)[0])
+        b[[3, 4]] = True
+        mask[[3, 4]] = True
+        b[mask] = False
+        assert b.count() == 0
+        with pytest.raises(IndexError):
+            b[21]
+        other = op.utils.Bitset(sp.rand(21) > 0.5)
+        both = op.utils.Bitset.combine([b, other], mode='xnor', size=21)
+        assert both.count() == 0
+        both = op.utils.Bitset.combine([], mode='and', size=21)
+        assert both.count() == 21
+
+    def test_fixed_point_accelerator(self):
+        # A linear map converging slowly under plain iteration
+        g = lambda x: 0.95*x + sp.array([0.05, 0.1])
+        iterations = {}
+        for mode in [None, 'aitken', 'anderson']:
+            acc = op.utils.FixedPointAccelerator(mode=mode, depth=2)
+            x = sp.zeros(2)
+            for i in range(1000):
+                gx = g(x)
+                if sp.absolute(gx - x).max() < 1e-10:
+                    break
+                x = acc.update(x, gx)
+            assert sp.allclose(x, [1, 2])
+            iterations[mode] = i
+        assert iterations['aitken'] < iterations[None]
+        assert iterations['anderson'] < iterations[None]
+        with pytest.raises(Exception):
+            op.utils.FixedPointAccelerator(mode='steffensen')
+
+
 if __name__ == '__main__':
 
     t = UtilsTest()